@@ -0,0 +1,226 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from aws_lambda_powertools.utilities.validation.exceptions import SchemaValidationError
+
+from benchmarks.specs import generate_items, make_event, write_spec
+from powertools_oas_validator.middleware import validate_request
+from powertools_oas_validator.middleware import validators as middleware_validators
+from powertools_oas_validator.services.spec_cache import spec_cache
+from powertools_oas_validator.services.spec_validator import (
+    FASTJSONSCHEMA_ENGINE,
+    OPENAPI_CORE_ENGINE,
+    unmarshaller_cache,
+)
+from powertools_oas_validator.validator import OASValidator
+
+SPEC_SIZES = (10, 100, 1000)
+SMALL_ITEMS = 1
+LARGE_ITEMS = 100
+
+
+def handler(event: Dict, context: Any) -> Dict:
+    return {"statusCode": 201}
+
+
+def get_version() -> Optional[str]:
+    try:
+        return version("powertools-oas-validator")
+    except PackageNotFoundError:
+        return None
+
+
+def reset_caches() -> None:
+    spec_cache.invalidate()
+    unmarshaller_cache.clear()
+    middleware_validators.clear()
+
+
+def measure(
+    func: Callable[[], Any],
+    iterations: int,
+    warmup: int = 0,
+    setup: Optional[Callable[[], Any]] = None,
+) -> List[int]:
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        func()
+
+    timings = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        start = time.perf_counter_ns()
+        func()
+        timings.append(time.perf_counter_ns() - start)
+
+    return timings
+
+
+def summarise(group: str, name: str, timings: List[int]) -> Dict[str, Any]:
+    timings_us = sorted(timing / 1000 for timing in timings)
+    p95_index = min(len(timings_us) - 1, int(len(timings_us) * 0.95))
+
+    return {
+        "group": group,
+        "name": name,
+        "iterations": len(timings_us),
+        "min_us": round(timings_us[0], 2),
+        "mean_us": round(statistics.fmean(timings_us), 2),
+        "median_us": round(statistics.median(timings_us), 2),
+        "p95_us": round(timings_us[p95_index], 2),
+        "max_us": round(timings_us[-1], 2),
+    }
+
+
+def rejected(validated_handler: Callable, event: Dict) -> Callable[[], None]:
+    def run() -> None:
+        try:
+            validated_handler(event, None)
+        except SchemaValidationError:
+            return
+        raise AssertionError("Invalid request was accepted")
+
+    return run
+
+
+def bench_cold_load(oas_paths: Dict[int, str], iterations: int) -> List[Dict]:
+    results = []
+    for size, oas_path in oas_paths.items():
+        timings = measure(
+            lambda: OASValidator(oas_path, eager=True),
+            iterations,
+            setup=reset_caches,
+        )
+        results.append(summarise("cold_load", f"paths={size}", timings))
+
+    return results
+
+
+def bench_warm(oas_path: str, iterations: int, warmup: int) -> List[Dict]:
+    results = []
+    bodies = {
+        "small": {"items": generate_items(SMALL_ITEMS)},
+        "large": {"items": generate_items(LARGE_ITEMS)},
+    }
+
+    middleware_handler = validate_request(handler, oas_path=oas_path)
+    for body_name, body in bodies.items():
+        event = make_event(0, body)
+        timings = measure(lambda: middleware_handler(event, None), iterations, warmup)
+        results.append(summarise("warm", f"validate_request[{body_name}]", timings))
+
+    for engine in (OPENAPI_CORE_ENGINE, FASTJSONSCHEMA_ENGINE):
+        validated_handler = OASValidator(oas_path, eager=True, engine=engine)(handler)
+        for body_name, body in bodies.items():
+            event = make_event(0, body)
+            timings = measure(
+                lambda: validated_handler(event, None), iterations, warmup
+            )
+            results.append(
+                summarise("warm", f"OASValidator[{engine},{body_name}]", timings)
+            )
+
+    return results
+
+
+def bench_rejection(oas_path: str, iterations: int, warmup: int) -> List[Dict]:
+    results = []
+    invalid_bodies = {
+        "missing_property": {},
+        "wrong_type": {"items": [{"id": "1", "name": "item"}]},
+    }
+
+    for fail_fast in (True, False):
+        validated_handler = OASValidator(oas_path, eager=True, fail_fast=fail_fast)(
+            handler
+        )
+        mode = "fail_fast" if fail_fast else "all_errors"
+        for body_name, body in invalid_bodies.items():
+            run = rejected(validated_handler, make_event(0, body))
+            timings = measure(run, iterations, warmup)
+            results.append(summarise("rejection", f"{mode}[{body_name}]", timings))
+
+    return results
+
+
+def bench_scaling(
+    oas_paths: Dict[int, str], iterations: int, warmup: int
+) -> List[Dict]:
+    results = []
+    body = {"items": generate_items(SMALL_ITEMS)}
+    for size, oas_path in oas_paths.items():
+        validated_handler = OASValidator(oas_path, eager=True)(handler)
+        # The last path is the worst case for routing
+        event = make_event(size - 1, body)
+        timings = measure(lambda: validated_handler(event, None), iterations, warmup)
+        results.append(summarise("scaling", f"paths={size}", timings))
+
+    return results
+
+
+def run(
+    sizes: Sequence[int], iterations: int, cold_iterations: int, warmup: int
+) -> Dict[str, Any]:
+    results: List[Dict] = []
+    with tempfile.TemporaryDirectory() as directory:
+        oas_paths = {size: write_spec(directory, size) for size in sizes}
+        small_spec = oas_paths[min(sizes)]
+
+        results.extend(bench_cold_load(oas_paths, cold_iterations))
+        results.extend(bench_warm(small_spec, iterations, warmup))
+        results.extend(bench_rejection(small_spec, iterations, warmup))
+        results.extend(bench_scaling(oas_paths, iterations, warmup))
+
+        reset_caches()
+
+    return {
+        "version": get_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks", description="Benchmark the request validation hot path."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SPEC_SIZES))
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--cold-iterations", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.iterations, args.cold_iterations, args.warmup)
+
+    for result in report["results"]:
+        print(
+            f"{result['group']:<10} {result['name']:<45}"
+            f" median {result['median_us']:>12.2f}us  p95 {result['p95_us']:>12.2f}us",
+            file=sys.stderr,
+        )
+
+    output = json.dumps(report, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as output_file:
+            output_file.write(output + "\n")
+        print(f"Results written to {os.path.abspath(args.output)}", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import json
+import os
+from typing import Any, Dict, List
+
+import yaml  # type: ignore
+
+ITEM_SCHEMA = {
+    "type": "object",
+    "required": ["id", "name"],
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string", "maxLength": 64},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "price": {"type": "number", "minimum": 0},
+    },
+}
+
+
+def get_path(index: int) -> str:
+    return f"/resources-{index}/{{resourceId}}/items"
+
+
+def generate_spec(paths: int) -> Dict[str, Any]:
+    spec_paths = {}
+    for index in range(paths):
+        spec_paths[get_path(index)] = {
+            "parameters": [
+                {
+                    "name": "resourceId",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string"},
+                }
+            ],
+            "post": {
+                "operationId": f"createItems{index}",
+                "parameters": [
+                    {"name": "dryRun", "in": "query", "schema": {"type": "boolean"}}
+                ],
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/ItemBatch"}
+                        }
+                    },
+                },
+                "responses": {"201": {"description": "Created"}},
+            },
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": f"Synthetic {paths}", "version": "1.0.0"},
+        "paths": spec_paths,
+        "components": {
+            "schemas": {
+                "Item": ITEM_SCHEMA,
+                "ItemBatch": {
+                    "type": "object",
+                    "required": ["items"],
+                    "properties": {
+                        "items": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Item"},
+                        }
+                    },
+                },
+            }
+        },
+    }
+
+
+def write_spec(directory: str, paths: int) -> str:
+    oas_path = os.path.join(directory, f"oas-{paths}.yaml")
+    with open(oas_path, "w") as spec_file:
+        yaml.safe_dump(generate_spec(paths), spec_file, sort_keys=False)
+
+    return oas_path
+
+
+def generate_items(count: int) -> List[Dict[str, Any]]:
+    return [
+        {"id": index, "name": f"item-{index}", "tags": ["a", "b"], "price": 1.5}
+        for index in range(count)
+    ]
+
+
+def make_event(path_index: int, body: Any) -> Dict[str, Any]:
+    path = get_path(path_index)
+
+    return {
+        "resource": path,
+        "path": path.replace("{resourceId}", "r-1"),
+        "httpMethod": "POST",
+        "headers": {
+            "Content-Type": "application/json",
+            "Host": "api.example.com",
+            "X-Forwarded-Proto": "https",
+        },
+        "multiValueHeaders": {},
+        "queryStringParameters": {"dryRun": "true"},
+        "multiValueQueryStringParameters": {"dryRun": ["true"]},
+        "pathParameters": {"resourceId": "r-1"},
+        "body": json.dumps(body),
+        "isBase64Encoded": False,
+    }
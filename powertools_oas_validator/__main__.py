@@ -0,0 +1,5 @@
+import sys
+
+from powertools_oas_validator.cli import main
+
+sys.exit(main())
@@ -0,0 +1,110 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from powertools_oas_validator.serializers import json_loads
+from powertools_oas_validator.types import BulkValidationSummary
+from powertools_oas_validator.validator import OASValidator
+
+DEFAULT_CHUNK_SIZE = 1000
+INVALID_JSON_LINE = "InvalidJSONLine"
+
+worker_validator: Optional[OASValidator] = None
+
+
+def init_worker(oas_path: str, options: Dict[str, Any]) -> None:
+    global worker_validator
+
+    # Each worker loads and compiles the spec once, not per chunk
+    worker_validator = OASValidator(oas_path, eager=True, **options)
+
+
+def validate_chunk(events: List[Dict]) -> BulkValidationSummary:
+    if worker_validator is None:
+        raise RuntimeError("The worker was not initialised")
+
+    summary = BulkValidationSummary()
+    summary.add(worker_validator.validate_batch(events))
+
+    return summary
+
+
+def validate_lines(lines: List[bytes]) -> BulkValidationSummary:
+    # Lines are decoded by the workers, and a malformed one is only counted
+    events: List[Dict] = []
+    invalid_lines = 0
+    for line in lines:
+        try:
+            events.append(json_loads(line))
+        except ValueError:
+            invalid_lines += 1
+
+    summary = validate_chunk(events)
+    summary.add_errors(INVALID_JSON_LINE, invalid_lines)
+
+    return summary
+
+
+def iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_lines(path: str) -> Iterator[bytes]:
+    # One line at a time, however large the file is
+    with open(path, "rb") as jsonl_file:
+        for line in jsonl_file:
+            if line.strip():
+                yield line
+
+
+class BulkValidator:
+    def __init__(
+        self,
+        oas_path: str,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **options: Any,
+    ) -> None:
+        self.oas_path = oas_path
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.options = options
+
+    def validate(self, events: Iterable[Dict]) -> BulkValidationSummary:
+        return self._validate(events, validate_chunk)
+
+    def validate_file(self, path: str) -> BulkValidationSummary:
+        return self._validate(iter_lines(path), validate_lines)
+
+    def _validate(
+        self,
+        items: Iterable[Any],
+        validate: Callable[[List[Any]], BulkValidationSummary],
+    ) -> BulkValidationSummary:
+        summary = BulkValidationSummary()
+        # Only a few chunks per worker are in flight, the rest is not read yet
+        max_pending = self.workers * 2
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_worker,
+            initargs=(self.oas_path, self.options),
+        ) as executor:
+            pending: Set[Future] = set()
+            for chunk in iter_chunks(items, self.chunk_size):
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        summary.merge(future.result())
+                pending.add(executor.submit(validate, chunk))
+
+            for future in pending:
+                summary.merge(future.result())
+
+        return summary
@@ -0,0 +1,81 @@
+import argparse
+import json
+from typing import List, Optional
+
+from powertools_oas_validator.bulk import iter_lines
+from powertools_oas_validator.replay import replay
+from powertools_oas_validator.services.spec_artifact import SpecArtifact
+from powertools_oas_validator.services.spec_loader import SpecLoader
+from powertools_oas_validator.services.spec_validator import (
+    OPENAPI_CORE_ENGINE,
+    engines,
+)
+from powertools_oas_validator.validator import OASValidator
+
+
+def compile_specs(oas_paths: List[str]) -> int:
+    for oas_path in oas_paths:
+        artifact_path = SpecArtifact.get_path(oas_path)
+        SpecArtifact.compile(oas_path).dump(artifact_path)
+        print(f"Compiled '{oas_path}' to '{artifact_path}'")
+
+    return 0
+
+
+def stamp_specs(oas_paths: List[str]) -> int:
+    for oas_path in oas_paths:
+        stamp_path = SpecLoader.get_stamp_path(oas_path)
+        SpecLoader(oas_path).stamp()
+        print(f"Validated '{oas_path}' and stamped '{stamp_path}'")
+
+    return 0
+
+
+def replay_events(events_path: str, oas_path: str, engine: str, fail_fast: bool) -> int:
+    validator = OASValidator(oas_path, eager=True, engine=engine, fail_fast=fail_fast)
+    summary = replay(validator, iter_lines(events_path))
+    print(json.dumps(summary, indent=2))
+
+    return 0
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m powertools_oas_validator")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = subparsers.add_parser(
+        "compile", help="Precompile specs to artifacts loaded at cold start"
+    )
+    compile_parser.add_argument("oas_paths", nargs="+", metavar="SPEC")
+
+    stamp_parser = subparsers.add_parser(
+        "stamp", help="Validate specs and stamp them for validate_spec='stamp'"
+    )
+    stamp_parser.add_argument("oas_paths", nargs="+", metavar="SPEC")
+
+    replay_parser = subparsers.add_parser(
+        "replay", help="Validate captured events from a JSONL file and summarise"
+    )
+    replay_parser.add_argument("events_path", metavar="EVENTS")
+    replay_parser.add_argument("--spec", dest="oas_path", required=True)
+    replay_parser.add_argument("--engine", choices=engines, default=OPENAPI_CORE_ENGINE)
+    replay_parser.add_argument("--all-errors", dest="fail_fast", action="store_false")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = get_parser().parse_args(argv)
+
+    if args.command == "compile":
+        return compile_specs(args.oas_paths)
+
+    if args.command == "stamp":
+        return stamp_specs(args.oas_paths)
+
+    if args.command == "replay":
+        return replay_events(
+            args.events_path, args.oas_path, args.engine, args.fail_fast
+        )
+
+    return 1  # pragma: nocover
@@ -0,0 +1,81 @@
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+EMPTY: Dict[str, Any] = {}
+
+
+class MultiDictView(Mapping[str, Any]):
+    def __init__(
+        self,
+        values: Optional[Mapping[str, Any]] = None,
+        lists: Optional[Mapping[str, List[Any]]] = None,
+    ) -> None:
+        self._values = values or EMPTY
+        self._lists = lists or EMPTY
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            return self._lists[key][0]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._lists
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values or self._lists)
+
+    def __len__(self) -> int:
+        return len(self._values or self._lists)
+
+    def getlist(self, key: str) -> List[Any]:
+        try:
+            return list(self._lists[key])
+        except KeyError:
+            pass
+
+        try:
+            return [self._values[key]]
+        except KeyError:
+            return []
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class HeadersView(MultiDictView):
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return super().__getitem__(key)
+        except KeyError:
+            return super().__getitem__(self._find_key(key))
+
+    def __contains__(self, key: object) -> bool:
+        if super().__contains__(key):
+            return True
+
+        try:
+            self._find_key(key)  # type: ignore
+        except KeyError:
+            return False
+
+        return True
+
+    def getlist(self, key: str) -> List[Any]:
+        try:
+            key = self._find_key(key)
+        except KeyError:
+            return []
+
+        return super().getlist(key)
+
+    def _find_key(self, key: str) -> str:
+        # Most lookups hit exactly; scan the event's own keys instead of copying them
+        if key in self._values or key in self._lists:
+            return key
+
+        lower = key.lower()
+        for name in self._values or self._lists:
+            if name.lower() == lower:
+                return name
+
+        raise KeyError(key)
@@ -1,3 +1,8 @@
+from typing import List
+
+from aws_lambda_powertools.utilities.validation.exceptions import SchemaValidationError
+
+
 class NotSupportedFileTypeError(Exception):
     ...
 
@@ -10,9 +15,41 @@ class InvalidEventError(Exception):
     ...
 
 
+class RequestBodyTooLargeError(Exception):
+    ...
+
+
 class UnsupportedOpenAPIVersion(Exception):
     ...
 
 
+class UnsupportedEngine(Exception):
+    ...
+
+
+class UnsupportedValidateSpecMode(Exception):
+    ...
+
+
+class InvalidSampleRateError(Exception):
+    ...
+
+
 class UnhandledValidationError(Exception):
     ...
+
+
+class AggregatedSchemaValidationError(SchemaValidationError):
+    def __init__(self, errors: List[SchemaValidationError]) -> None:
+        validation_message = " ".join(
+            str(error.validation_message) for error in errors
+        )
+        super().__init__(
+            message=f"{len(errors)} validation error(s)",
+            validation_message=validation_message,
+        )
+        self.errors = errors
+
+
+class ResponseValidationError(SchemaValidationError):
+    ...
@@ -1,12 +1,12 @@
 from collections.abc import Callable
-from typing import Dict
+from typing import Any, Dict, Hashable, Optional, Tuple
 
 from aws_lambda_powertools.middleware_factory import lambda_handler_decorator
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-from powertools_oas_validator.services.event_parser import EventParser
-from powertools_oas_validator.services.spec_loader import SpecLoader
-from powertools_oas_validator.services.spec_validator import SpecValidator
+from powertools_oas_validator.validator import OASValidator
+
+validators: Dict[Tuple[Hashable, ...], OASValidator] = {}
 
 
 @lambda_handler_decorator
@@ -15,17 +15,35 @@ def validate_request(
     event: Dict,
     context: LambdaContext,
     oas_path: str,
+    result_key: Optional[str] = None,
+    context_attribute: Optional[str] = None,
+    max_body_size: Optional[int] = None,
+    background: bool = False,
+    **options: Any,
 ) -> Callable:
-    # Setup Spec Loader
-    spec_loader = SpecLoader(oas_path)
-
-    # Setup Event Parser
-    event_parser = EventParser(event)
-
-    # Setup SpecValidator
-    spec_validator = SpecValidator(oas_path, event, spec_loader, event_parser)
-
-    # Validate Spec Against Event
-    spec_validator.validate_request_against_spec()
-
-    return handler(event, context)
+    # Reuse one validator per spec and options for the lifetime of the container
+    key = (
+        oas_path,
+        result_key,
+        context_attribute,
+        max_body_size,
+        background,
+        *sorted(options.items()),
+    )
+    try:
+        validator = validators[key]
+    except KeyError:
+        validator = validators.setdefault(
+            key,
+            OASValidator(
+                oas_path,
+                result_key=result_key,
+                context_attribute=context_attribute,
+                max_body_size=max_body_size,
+                background=background,
+                **options,
+            ),
+        )
+
+    # The decorator validates, exposes the result and calls the handler
+    return validator(handler)(event, context)
@@ -0,0 +1,159 @@
+import re
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+from openapi_core import Spec
+from openapi_core.templating.datatypes import TemplateResult
+from openapi_core.templating.paths.datatypes import (
+    Path,
+    PathOperation,
+    PathOperationServer,
+)
+from openapi_core.templating.paths.exceptions import PathsNotFound
+from openapi_core.templating.paths.finders import APICallPathFinder
+
+VARIABLE_PATTERN = re.compile(r"{([^{}]+)}")
+
+
+class Route:
+    def __init__(self, order: int, path_pattern: str, path: Spec) -> None:
+        self.order = order
+        self.path_pattern = path_pattern
+        self.path = path
+        self.variables = VARIABLE_PATTERN.findall(path_pattern)
+        self.regex = re.compile(self._to_regex(path_pattern) + "$")
+
+    def match(self, name: str) -> Optional[TemplateResult]:
+        result = self.regex.search(name)
+        if result is None:
+            return None
+
+        variables = dict(zip(self.variables, result.groups()))
+
+        return TemplateResult(self.path_pattern, variables)
+
+    @staticmethod
+    def _to_regex(pattern: str) -> str:
+        parts = VARIABLE_PATTERN.split(pattern)
+        literals = [re.escape(part) for part in parts[::2]]
+
+        return "([^/]*)".join(literals)
+
+
+class RouteNode:
+    def __init__(self) -> None:
+        self.literals: Dict[str, "RouteNode"] = {}
+        self.templates: Dict[str, Tuple[Pattern, List[str], "RouteNode"]] = {}
+        self.routes: List[Route] = []
+
+    def insert(self, segments: List[str], route: Route) -> None:
+        node = self
+        for segment in segments:
+            if "{" not in segment:
+                node = node.literals.setdefault(segment, RouteNode())
+                continue
+
+            try:
+                node = node.templates[segment][2]
+            except KeyError:
+                regex = re.compile(Route._to_regex(segment))
+                variables = VARIABLE_PATTERN.findall(segment)
+                child = RouteNode()
+                node.templates[segment] = (regex, variables, child)
+                node = child
+
+        node.routes.append(route)
+
+    def match(
+        self, segments: List[str], index: int, variables: Dict[str, str]
+    ) -> Iterator[Tuple[Route, Dict[str, str]]]:
+        if index == len(segments):
+            for route in self.routes:
+                yield route, variables
+            return
+
+        segment = segments[index]
+
+        child = self.literals.get(segment)
+        if child is not None:
+            yield from child.match(segments, index + 1, variables)
+
+        for regex, names, child in self.templates.values():
+            result = regex.fullmatch(segment)
+            if result is not None:
+                yield from child.match(
+                    segments,
+                    index + 1,
+                    {**variables, **dict(zip(names, result.groups()))},
+                )
+
+
+class APICallPathRouter(APICallPathFinder):
+    def __init__(self, spec: Spec, base_url: Optional[str] = None):
+        super().__init__(spec, base_url=base_url)
+
+        self.routes: Dict[str, Route] = {}
+        self.operations: Dict[Tuple[str, str], Spec] = {}
+        self.root = RouteNode()
+        self.depths: List[int] = []
+
+        paths = spec / "paths"
+        if not paths.exists():
+            return
+
+        depths = set()
+        for order, (path_pattern, path) in enumerate(paths.items()):
+            route = Route(order, path_pattern, path)
+            segments = path_pattern.split("/")[1:]
+
+            self.routes[path_pattern] = route
+            self.root.insert(segments, route)
+            depths.add(len(segments))
+
+            for method in path.keys():
+                self.operations[(path_pattern, method)] = path / method
+
+        self.depths = sorted(depths)
+
+    def find(
+        self, method: str, name: str, resource: Optional[str] = None
+    ) -> PathOperationServer:
+        if resource is not None:
+            try:
+                return self._find_by_resource(method, name, resource)
+            except LookupError:
+                pass
+
+        return super().find(method, name)
+
+    def _find_by_resource(
+        self, method: str, name: str, resource: str
+    ) -> PathOperationServer:
+        operation = self.operations[(resource, method)]
+        route = self.routes[resource]
+
+        path_result = route.match(name)
+        if path_result is None:
+            raise LookupError(resource)
+
+        operations_iter = iter([PathOperation(route.path, operation, path_result)])
+        try:
+            return next(self._get_servers_iter(name, operations_iter))
+        except StopIteration:
+            raise LookupError(resource)
+
+    def _get_paths_iter(self, name: str) -> Iterator[Path]:
+        if not self.routes:
+            raise PathsNotFound((self.spec / "paths").uri())
+
+        segments = name.split("/")
+        matches: List[Tuple[Route, Dict[str, str]]] = []
+        for depth in self.depths:
+            if depth >= len(segments):
+                break
+            matches.extend(self.root.match(segments[-depth:], 0, {}))
+
+        # Concrete paths first, then fewer variables -> more concrete path
+        matches.sort(key=lambda match: (len(match[0].variables), match[0].order))
+
+        for route, variables in matches:
+            yield Path(route.path, TemplateResult(route.path_pattern, variables))
@@ -1,19 +1,118 @@
-from openapi_core import V30RequestValidator, V31RequestValidator
+from functools import cached_property
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from fastjsonschema import JsonSchemaValueException
+from openapi_core import Spec, V30RequestValidator, V31RequestValidator
+from openapi_core.datatypes import Parameters, RequestParameters
+from openapi_core.exceptions import OpenAPIError
+from openapi_core.protocols import BaseRequest, Request
+from openapi_core.templating.media_types.exceptions import MediaTypeNotFound
+from openapi_core.templating.paths.datatypes import PathOperationServer
+from openapi_core.templating.paths.exceptions import PathError
+from openapi_core.unmarshalling.request.datatypes import RequestUnmarshalResult
 from openapi_core.unmarshalling.request.unmarshallers import BaseRequestUnmarshaller
 from openapi_core.unmarshalling.schemas import (
     oas30_write_schema_unmarshallers_factory,
     oas31_schema_unmarshallers_factory,
 )
+from openapi_core.unmarshalling.schemas.unmarshallers import SchemaUnmarshaller
 from openapi_core.unmarshalling.unmarshallers import BaseUnmarshaller
+from openapi_core.validation.request.exceptions import MissingRequestBody
 from openapi_core.validation.request.validators import APICallRequestValidator
 
-from powertools_oas_validator.overrides.validators import CustomBaseRequestValidator
+from powertools_oas_validator.overrides.validators import (
+    CustomAPICallValidator,
+    CustomBaseRequestValidator,
+)
+from powertools_oas_validator.services.instrumentation import (
+    BODY_PHASE,
+    OPERATION_LOOKUP_PHASE,
+    PARAMETERS_PHASE,
+    SECURITY_PHASE,
+    InstrumentationProtocol,
+    noop_instrumentation,
+)
 
 
 class CustomBaseRequestUnmarshaller(
     BaseRequestUnmarshaller, CustomBaseRequestValidator, BaseUnmarshaller
 ):
-    ...
+    fail_fast: bool = True
+    instrumentation: InstrumentationProtocol = noop_instrumentation
+
+    @cached_property
+    def schema_unmarshallers(self) -> Dict[Tuple[Hashable, ...], SchemaUnmarshaller]:
+        return {}
+
+    def _unmarshal_schema(self, schema: Spec, value: Any) -> Any:
+        # Build each schema's unmarshaller on first use instead of on every request
+        key = tuple(schema.parts)
+
+        try:
+            unmarshaller = self.schema_unmarshallers[key]
+        except KeyError:
+            unmarshaller = self.schema_unmarshallers_factory.create(
+                schema,
+                format_validators=self.format_validators,
+                extra_format_validators=self.extra_format_validators,
+                format_unmarshallers=self.format_unmarshallers,
+                extra_format_unmarshallers=self.extra_format_unmarshallers,
+            )
+            self.schema_unmarshallers[key] = unmarshaller
+
+        return unmarshaller.unmarshal(value)
+
+    def _unmarshal(
+        self, request: BaseRequest, operation: Spec, path: Spec
+    ) -> RequestUnmarshalResult:
+        if self.fail_fast:
+            return super()._unmarshal(request, operation, path)
+
+        # Security, parameters and body are all checked to report every violation
+        errors: List[Exception] = []
+
+        try:
+            security = self._get_security(request.parameters, operation)
+        except OpenAPIError as exc:
+            security = None
+            errors.append(exc)
+
+        with self.instrumentation.phase(PARAMETERS_PHASE):
+            params, params_errors = self._get_all_parameters(
+                request.parameters, operation, path
+            )
+        errors.extend(params_errors)
+
+        try:
+            body = self._get_body(request.body, request.mimetype, operation)
+        except MissingRequestBody:
+            body = None
+        except (OpenAPIError, JsonSchemaValueException) as exc:
+            body = None
+            errors.append(exc)
+
+        return RequestUnmarshalResult(
+            errors=errors,  # type: ignore
+            body=body,
+            parameters=params,
+            security=security,
+        )
+
+    def _get_security(
+        self, parameters: RequestParameters, operation: Spec
+    ) -> Optional[Dict[str, str]]:
+        with self.instrumentation.phase(SECURITY_PHASE):
+            return super()._get_security(parameters, operation)
+
+    def _get_parameters(
+        self, parameters: RequestParameters, operation: Spec, path: Spec
+    ) -> Parameters:
+        with self.instrumentation.phase(PARAMETERS_PHASE):
+            return super()._get_parameters(parameters, operation, path)
+
+    def _get_body(self, body: Any, mimetype: str, operation: Spec) -> Any:
+        with self.instrumentation.phase(BODY_PHASE):
+            return super()._get_body(body, mimetype, operation)
 
 
 class BaseAPICallRequestUnmarshaller(CustomBaseRequestUnmarshaller):
@@ -21,9 +120,44 @@ class BaseAPICallRequestUnmarshaller(CustomBaseRequestUnmarshaller):
 
 
 class APICallRequestUnmarshaller(
-    APICallRequestValidator, BaseAPICallRequestUnmarshaller
+    APICallRequestValidator, CustomAPICallValidator, BaseAPICallRequestUnmarshaller
 ):
-    ...
+    def unmarshal(self, request: Request) -> RequestUnmarshalResult:
+        try:
+            path_operation = self.find_operation(request)
+        except PathError as exc:
+            return RequestUnmarshalResult(errors=[exc])
+
+        return self.unmarshal_operation(request, path_operation)
+
+    def find_operation(self, request: Request) -> PathOperationServer:
+        with self.instrumentation.phase(OPERATION_LOOKUP_PHASE):
+            return self._find_path(request)
+
+    def unmarshal_operation(
+        self, request: Request, path_operation: PathOperationServer
+    ) -> RequestUnmarshalResult:
+        path, operation, _, path_result, _ = path_operation
+        request.parameters.path = request.parameters.path or path_result.variables
+
+        return self._unmarshal(request, operation, path)
+
+    def check(self, request: Request) -> RequestUnmarshalResult:
+        # Only the route and content type, none of the schemas are validated
+        try:
+            _, operation, _, _, _ = self.find_operation(request)
+        except PathError as exc:
+            return RequestUnmarshalResult(errors=[exc])
+
+        if "requestBody" in operation and not self.is_missing(request.body):
+            try:
+                self._get_media_type(
+                    operation / "requestBody" / "content", request.mimetype
+                )
+            except MediaTypeNotFound as exc:
+                return RequestUnmarshalResult(errors=[exc])
+
+        return RequestUnmarshalResult(errors=[])
 
 
 #
@@ -1,22 +1,146 @@
-from typing import Any, Optional
+from functools import cached_property
+from typing import Any, Callable, List, Optional, Tuple
+from urllib.parse import urljoin
 
 from openapi_core import Spec
-from openapi_core.datatypes import RequestParameters
+from openapi_core.datatypes import Parameters, RequestParameters
+from openapi_core.deserializing.media_types.exceptions import (
+    MediaTypeDeserializeError,
+)
 from openapi_core.exceptions import OpenAPIError
+from openapi_core.protocols import Request
+from openapi_core.templating.paths.datatypes import PathOperationServer
+from openapi_core.util import chainiters
 from openapi_core.validation.decorators import ValidationErrorWrapper
+from openapi_core.validation.request.exceptions import (
+    MissingParameter,
+    MissingRequestBody,
+    MissingRequiredRequestBody,
+)
 from openapi_core.validation.request.validators import BaseRequestValidator, Dict
+from openapi_core.validation.validators import BaseAPICallValidator
+
+from powertools_oas_validator.overrides.finders import APICallPathRouter
+from powertools_oas_validator.serializers import json_loads
+from powertools_oas_validator.services.schema_compiler import (
+    BodyValidators,
+    is_binary_schema,
+)
+
+JSON_MIMETYPE = "application/json"
 
 
 class CustomBaseRequestValidator(BaseRequestValidator):
+    body_validators: Optional[BodyValidators] = None
+
     class CustomValidationErrorWrapper(ValidationErrorWrapper):
         ...
 
     @CustomValidationErrorWrapper(OpenAPIError)
-    def _get_body(self, body: Optional[str], mimetype: str, operation: Spec) -> Any:
+    def _get_body(self, body: Any, mimetype: str, operation: Spec) -> Any:
+        if self.body_validators is not None:
+            body_validator = self.body_validators.get(operation, mimetype)
+            if body_validator is not None:
+                return self._get_compiled_body(body, mimetype, body_validator)
+
         return super()._get_body.__wrapped__(  # type: ignore
             self, body=body, mimetype=mimetype, operation=operation
         )
 
+    def _get_compiled_body(
+        self,
+        body: Any,
+        mimetype: str,
+        body_validator: Tuple[Callable, bool],
+    ) -> Any:
+        validate, required = body_validator
+
+        if self.is_missing(body):
+            if required:
+                raise MissingRequiredRequestBody
+            raise MissingRequestBody
+
+        # The decoded JSON is returned as is, formats such as dates are not unmarshalled
+        return validate(self._deserialise_json(mimetype, body))
+
+    def _get_body_value(self, body: Any, request_body: Spec) -> Any:
+        # Decoded bodies such as {} or [] are falsy but not missing
+        if self.is_missing(body):
+            if request_body.getkey("required", False):
+                raise MissingRequiredRequestBody
+            raise MissingRequestBody
+
+        return body
+
+    def _get_content_value_and_schema(
+        self, raw: Any, mimetype: str, content: Spec
+    ) -> Tuple[Any, Optional[Spec]]:
+        media_type, mimetype = self._get_media_type(content, mimetype)
+        if "schema" not in media_type:
+            return self._cast(media_type, self._deserialise_data(mimetype, raw)), None
+
+        schema = media_type / "schema"
+        if is_binary_schema(schema):
+            # Uploads are handed over as they are, not validated as strings
+            return raw, None
+
+        return self._cast(media_type, self._deserialise_data(mimetype, raw)), schema
+
+    def _deserialise_data(self, mimetype: str, value: Any) -> Any:
+        if mimetype == JSON_MIMETYPE:
+            return self._deserialise_json(mimetype, value)
+
+        if isinstance(value, bytes):
+            # Decoded base64 bodies of text media types
+            try:
+                value = value.decode()
+            except UnicodeDecodeError:
+                raise MediaTypeDeserializeError(mimetype, value)  # type: ignore
+
+        return super()._deserialise_data(mimetype, value)
+
+    @staticmethod
+    def _deserialise_json(mimetype: str, value: Any) -> Any:
+        # Bodies decoded by API Gateway or a test harness are validated as they are
+        if not isinstance(value, (str, bytes)):
+            return value
+
+        try:
+            return json_loads(value)
+        except ValueError:
+            raise MediaTypeDeserializeError(mimetype, value)  # type: ignore
+
+    @staticmethod
+    def is_missing(body: Any) -> bool:
+        return body is None or body == "" or body == b""
+
+    def _get_all_parameters(
+        self, parameters: RequestParameters, operation: Spec, path: Spec
+    ) -> Tuple[Parameters, List[Exception]]:
+        # Unlike _get_parameters, carries on past invalid values as well
+        errors: List[Exception] = []
+        seen = set()
+        validated = Parameters()
+        for param in chainiters(
+            operation.get("parameters", []), path.get("parameters", [])
+        ):
+            param_key = (param["name"], param["in"])
+            if param_key in seen:
+                continue
+            seen.add(param_key)
+
+            try:
+                value = self._get_parameter(parameters, param)
+            except MissingParameter:
+                continue
+            except OpenAPIError as exc:
+                errors.append(exc)
+                continue
+
+            getattr(validated, param["in"])[param["name"]] = value
+
+        return validated, errors
+
     @CustomValidationErrorWrapper(OpenAPIError)
     def _get_parameter(
         self, parameters: RequestParameters, param: Spec
@@ -32,3 +156,16 @@ class CustomBaseRequestValidator(BaseRequestValidator):
         return super()._get_security.__wrapped__(  # type: ignore
             self, parameters=parameters, operation=operation
         )
+
+
+class CustomAPICallValidator(BaseAPICallValidator):
+    @cached_property
+    def path_finder(self) -> APICallPathRouter:
+        return APICallPathRouter(self.spec, base_url=self.base_url)
+
+    def _find_path(self, request: Request) -> PathOperationServer:
+        path_pattern = getattr(request, "path_pattern", None) or request.path
+        full_url = urljoin(request.host_url, path_pattern)
+        resource = getattr(request, "resource", None)
+
+        return self.path_finder.find(request.method, full_url, resource=resource)
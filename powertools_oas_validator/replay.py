@@ -0,0 +1,100 @@
+import math
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from aws_lambda_powertools.utilities.validation.exceptions import SchemaValidationError
+
+from powertools_oas_validator.bulk import INVALID_JSON_LINE
+from powertools_oas_validator.serializers import json_loads
+from powertools_oas_validator.validator import OASValidator
+
+# Buckets grow by 5%, so percentiles are within 5% of the exact value
+BUCKET_GROWTH = 1.05
+LOG_BUCKET_GROWTH = math.log(BUCKET_GROWTH)
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class LatencyHistogram:
+    def __init__(self) -> None:
+        self.buckets: "Counter[int]" = Counter()
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+
+    def add(self, duration_ns: int) -> None:
+        # A bounded number of buckets, however many durations are added
+        self.buckets[int(math.log(max(duration_ns, 1)) / LOG_BUCKET_GROWTH)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+
+    def percentile(self, percentile: float) -> float:
+        if not self.count:
+            return 0.0
+
+        rank = math.ceil(self.count * percentile / 100)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(BUCKET_GROWTH ** (bucket + 1), self.max_ns)
+
+        return float(self.max_ns)  # pragma: nocover
+
+    def summary(self, percentiles: Sequence[float] = PERCENTILES) -> Dict[str, float]:
+        summary = {
+            f"p{percentile:g}": round(self.percentile(percentile) / 1000, 2)
+            for percentile in percentiles
+        }
+        summary["min"] = round((self.min_ns or 0) / 1000, 2)
+        summary["mean"] = round(self.total_ns / max(self.count, 1) / 1000, 2)
+        summary["max"] = round(self.max_ns / 1000, 2)
+
+        return summary
+
+
+def get_error_key(error: Exception) -> str:
+    # Names such as parameters[id] are bounded by the spec, messages are not
+    name = error.name if isinstance(error, SchemaValidationError) else None
+    if name:
+        return f"{type(error).__name__}: {name}"
+
+    return type(error).__name__
+
+
+def replay(validator: OASValidator, lines: Iterable[bytes]) -> Dict[str, Any]:
+    latencies = LatencyHistogram()
+    errors: "Counter[str]" = Counter()
+    events = 0
+
+    start = time.perf_counter_ns()
+    for line in lines:
+        events += 1
+
+        try:
+            event = json_loads(line)
+        except ValueError:
+            errors[INVALID_JSON_LINE] += 1
+            continue
+
+        validation_start = time.perf_counter_ns()
+        try:
+            validator.validate(event)
+        except Exception as error:
+            errors[get_error_key(error)] += 1
+        finally:
+            latencies.add(time.perf_counter_ns() - validation_start)
+    duration = (time.perf_counter_ns() - start) / 1e9
+
+    return {
+        "events": events,
+        "failed": sum(errors.values()),
+        "duration_s": round(duration, 3),
+        "throughput_per_s": round(events / duration, 1) if duration else 0.0,
+        "latency_us": latencies.summary(),
+        "errors": dict(errors.most_common()),
+    }
@@ -0,0 +1,27 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: nocover
+    orjson = None  # type: ignore
+
+JSON_LIBRARY = "orjson" if orjson is not None else "json"
+
+
+def json_loads(content: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # json also accepts NaN, Infinity and integers beyond 64 bits
+            pass
+
+    return json.loads(content)
+
+
+def json_dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+
+    return json.dumps(data).encode()  # pragma: nocover
@@ -1,7 +1,13 @@
-from typing import Union
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, NoReturn, Optional, Tuple, Union
 
 from aws_lambda_powertools.utilities.validation.exceptions import SchemaValidationError
+from fastjsonschema import JsonSchemaValueException
+from jsonschema.exceptions import ValidationError
 from openapi_core.casting.schemas.exceptions import CastError
+from openapi_core.templating.media_types.exceptions import MediaTypeNotFound
+from openapi_core.templating.paths.exceptions import PathError
+from openapi_core.templating.responses.exceptions import ResponseNotFound
 from openapi_core.templating.security.exceptions import SecurityNotFound
 from openapi_core.validation.request.exceptions import (
     MissingRequiredRequestBody,
@@ -9,34 +15,172 @@ from openapi_core.validation.request.exceptions import (
 )
 from openapi_core.validation.schemas.exceptions import InvalidSchemaValue
 
-from powertools_oas_validator.exceptions import UnhandledValidationError
+from powertools_oas_validator.exceptions import (
+    AggregatedSchemaValidationError,
+    ResponseValidationError,
+    UnhandledValidationError,
+)
 from powertools_oas_validator.types import Request
 
+Handler = Callable[[Exception, Request], SchemaValidationError]
+
 
 class ErrorHandler:
     @staticmethod
     def raise_schema_validation_error(
         ex: Exception,
         request: Request,
-    ) -> None:
-        ex_type = type(ex)
-
-        if issubclass(ex_type, ParameterValidationError) or ex_type == CastError:
-            error = ErrorHandler._handle_parameter_error(ex)  # type: ignore
-        elif ex_type == InvalidSchemaValue or ex_type == MissingRequiredRequestBody:
-            error = ErrorHandler._handle_body_error(ex, request)  # type: ignore
-        elif ex_type == SecurityNotFound:
-            error = ErrorHandler._handle_security_error(ex)  # type: ignore
-        else:
+    ) -> NoReturn:
+        raise ErrorHandler.get_schema_validation_error(ex, request)
+
+    @staticmethod
+    def raise_aggregated_error(
+        errors: Iterable[Exception], request: Request
+    ) -> NoReturn:
+        schema_validation_errors: List[SchemaValidationError] = []
+        for ex in errors:
+            if isinstance(ex, InvalidSchemaValue):
+                # Every violation of the body, not only the first
+                schema_validation_errors.extend(
+                    ErrorHandler._handle_schema_error(error, request)
+                    for error in ex.schema_errors
+                )
+            else:
+                schema_validation_errors.append(
+                    ErrorHandler.get_schema_validation_error(ex, request)
+                )
+
+        raise AggregatedSchemaValidationError(schema_validation_errors)
+
+    @staticmethod
+    def get_schema_validation_error(
+        ex: Exception, request: Request
+    ) -> SchemaValidationError:
+        handler = ErrorHandler.get_handler(type(ex))
+        if handler is None:
             raise UnhandledValidationError(
-                f"'{ex_type}' is unhandled. Please open an issue on:"
+                f"'{type(ex)}' is unhandled. Please open an issue on:"
                 + "https://github.com/RasmusFangel/powertools-oas-validator/issues"
                 + " and it will be resolved ASAP!"
             )
-        raise error
+
+        return handler(ex, request)
+
+    @staticmethod
+    def get_handler(ex_type: type) -> Optional[Handler]:
+        try:
+            return resolved_handlers[ex_type]
+        except KeyError:
+            pass
+
+        # Subclasses are handled like their closest registered base class
+        bases = (base for base in ex_type.__mro__ if base in error_handlers)
+        handler = next((error_handlers[base] for base in bases), None)
+        resolved_handlers[ex_type] = handler
+
+        return handler
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_body_prefix(mimetype: str) -> Tuple[str, Tuple[str, ...]]:
+        # Built once per media type instead of on every rejected request
+        name = f"requestBody.content.{mimetype}.schema.properties"
+
+        return name, tuple(ErrorHandler.split_name(name))
+
+    @staticmethod
+    def get_body_name(request: Request, prop: object) -> Tuple[str, List[str]]:
+        name_prefix, path_prefix = ErrorHandler.get_body_prefix(request.mimetype)
+        prop = str(prop)
+
+        return f"{name_prefix}[{prop}]", [*path_prefix, *ErrorHandler.split_name(prop)]
+
+    @staticmethod
+    def get_response_validation_error(
+        ex: Exception, status: str, mimetype: str
+    ) -> ResponseValidationError:
+        if isinstance(ex, ResponseNotFound):
+            validation_message = (
+                f"'{ex.http_status}' is not one of {ex.availableresponses} "
+                + "response status codes"
+            )
+            return ResponseValidationError(
+                message=validation_message,
+                validation_message=validation_message + ".",
+                name="responses",
+                path=["responses"],
+                value=ex.http_status,
+                rule_definition=ex.availableresponses,
+            )
+
+        if isinstance(ex, MediaTypeNotFound):
+            validation_message = (
+                f"'{ex.mimetype}' is not one of {ex.availableMimetypes} content types"
+            )
+            return ResponseValidationError(
+                message=validation_message,
+                validation_message=validation_message + ".",
+                name=f"responses.{status}.content",
+                path=["responses", status, "content"],
+                value=ex.mimetype,
+                rule_definition=ex.availableMimetypes,
+            )
+
+        # Schema violations of compiled validators are ValueErrors as well
+        if isinstance(ex, ValueError) and not isinstance(ex, JsonSchemaValueException):
+            validation_message = f"Response body is not valid '{mimetype}'"
+            return ResponseValidationError(
+                message=validation_message,
+                validation_message=validation_message + ".",
+                name=f"responses.{status}.content.{mimetype}",
+                path=["responses", status, "content", mimetype],
+                value=None,
+            )
+
+        if isinstance(ex, InvalidSchemaValue):
+            error = ex.schema_errors[0]  # type: ignore
+            prop = error.absolute_path[0] if error.absolute_path else ""
+            message, value = error.message, error.instance
+            rule, rule_definition = error.validator_value, error.validator
+        elif isinstance(ex, JsonSchemaValueException):
+            prop = ex.path[1] if len(ex.path) > 1 else ""
+            message, value = ex.message, ex.value
+            rule, rule_definition = ex.rule_definition, ex.rule
+        else:
+            raise UnhandledValidationError(f"'{type(ex)}' is unhandled.")
+
+        name_prefix, path_prefix = ErrorHandler.get_response_body_prefix(
+            status, mimetype
+        )
+
+        return ResponseValidationError(
+            message=message,
+            validation_message=message + ".",
+            name=f"{name_prefix}[{prop}]",
+            path=[*path_prefix, *ErrorHandler.split_name(str(prop))],
+            value=value,
+            definition=None,
+            rule=rule,
+            rule_definition=rule_definition,
+        )
 
     @staticmethod
-    def _handle_security_error(ex: SecurityNotFound) -> SchemaValidationError:
+    @lru_cache(maxsize=64)
+    def get_response_body_prefix(
+        status: str, mimetype: str
+    ) -> Tuple[str, Tuple[str, ...]]:
+        name = f"responses.{status}.content.{mimetype}.schema.properties"
+
+        return name, tuple(ErrorHandler.split_name(name))
+
+    @staticmethod
+    def split_name(name: str) -> List[str]:
+        return name.replace("[", ".").replace("]", "").split(".")
+
+    @staticmethod
+    def _handle_security_error(
+        ex: SecurityNotFound, request: Request
+    ) -> SchemaValidationError:
         violating_schemes = ex.schemes[0]
         name = f"security[{violating_schemes[0]}]"
         path = name.replace("]", "").split("[")
@@ -53,11 +197,42 @@ class ErrorHandler:
             rule_definition=None,
         )
 
+    @staticmethod
+    def _handle_path_error(ex: PathError, request: Request) -> SchemaValidationError:
+        validation_message = (
+            f"'{request.method.upper()} {request.path}' is not an operation of the spec"
+        )
+
+        return SchemaValidationError(
+            message=validation_message,
+            validation_message=validation_message + ".",
+            name="paths",
+            path=["paths"],
+            value=request.path,
+        )
+
+    @staticmethod
+    def _handle_media_type_error(
+        ex: MediaTypeNotFound, request: Request
+    ) -> SchemaValidationError:
+        validation_message = (
+            f"'{ex.mimetype}' is not one of {ex.availableMimetypes} content types"
+        )
+
+        return SchemaValidationError(
+            message=validation_message,
+            validation_message=validation_message + ".",
+            name="requestBody.content",
+            path=["requestBody", "content"],
+            value=ex.mimetype,
+            rule_definition=ex.availableMimetypes,
+        )
+
     @staticmethod
     def _handle_parameter_error(
-        ex: Union[ParameterValidationError, CastError],
+        ex: Union[ParameterValidationError, CastError], request: Request
     ) -> SchemaValidationError:
-        if type(ex) is CastError:
+        if isinstance(ex, CastError):
             validation_message = f"Parameter '{ex.value}' is not of type: '{ex.type}'"
             return SchemaValidationError(
                 message=validation_message, validation_message=validation_message + "."
@@ -83,7 +258,7 @@ class ErrorHandler:
     def _handle_body_error(
         ex: Union[InvalidSchemaValue, MissingRequiredRequestBody], request: Request
     ) -> SchemaValidationError:
-        if type(ex) is MissingRequiredRequestBody:
+        if isinstance(ex, MissingRequiredRequestBody):
             return SchemaValidationError(
                 message="Missing required 'requestBody'",
                 validation_message="Missing required 'requestBody'.",
@@ -94,13 +269,18 @@ class ErrorHandler:
         except IndexError:
             raise ValueError("Error has no Schema Error! Can't process errors")
 
+        return ErrorHandler._handle_schema_error(error, request)
+
+    @staticmethod
+    def _handle_schema_error(
+        error: ValidationError, request: Request
+    ) -> SchemaValidationError:
         try:
             prop = error.absolute_path[0]
         except IndexError:
             prop = ""
 
-        name = f"requestBody.content.{request.mimetype}.schema.properties[{prop}]"
-        path = name.replace("[", ".").replace("]", "").split(".")
+        name, path = ErrorHandler.get_body_name(request, prop)
 
         return SchemaValidationError(
             message=error.message,
@@ -112,3 +292,38 @@ class ErrorHandler:
             rule=error.validator_value,
             rule_definition=error.validator,
         )
+
+    @staticmethod
+    def _handle_compiled_error(
+        ex: JsonSchemaValueException, request: Request
+    ) -> SchemaValidationError:
+        try:
+            prop = ex.path[1]
+        except IndexError:
+            prop = ""
+
+        name, path = ErrorHandler.get_body_name(request, prop)
+
+        return SchemaValidationError(
+            message=ex.message,
+            validation_message=ex.message + ".",
+            name=name,
+            path=path,
+            value=ex.value,
+            definition=None,
+            rule=ex.rule_definition,
+            rule_definition=ex.rule,
+        )
+
+
+error_handlers: Dict[type, Handler] = {
+    ParameterValidationError: ErrorHandler._handle_parameter_error,  # type: ignore
+    CastError: ErrorHandler._handle_parameter_error,  # type: ignore
+    InvalidSchemaValue: ErrorHandler._handle_body_error,  # type: ignore
+    MissingRequiredRequestBody: ErrorHandler._handle_body_error,  # type: ignore
+    JsonSchemaValueException: ErrorHandler._handle_compiled_error,  # type: ignore
+    SecurityNotFound: ErrorHandler._handle_security_error,  # type: ignore
+    PathError: ErrorHandler._handle_path_error,  # type: ignore
+    MediaTypeNotFound: ErrorHandler._handle_media_type_error,  # type: ignore
+}
+resolved_handlers: Dict[type, Optional[Handler]] = {}
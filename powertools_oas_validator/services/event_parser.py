@@ -1,10 +1,15 @@
-import json
-from typing import Dict, Protocol
+import binascii
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Protocol
+from urllib.parse import parse_qs
 
 from openapi_core.datatypes import RequestParameters
-from werkzeug.datastructures import Headers, ImmutableMultiDict
 
-from powertools_oas_validator.exceptions import InvalidEventError
+from powertools_oas_validator.datastructures import HeadersView, MultiDictView
+from powertools_oas_validator.exceptions import (
+    InvalidEventError,
+    RequestBodyTooLargeError,
+)
 from powertools_oas_validator.types import Request
 
 
@@ -14,8 +19,9 @@ class EventParserProtocol(Protocol):
 
 
 class EventParser(EventParserProtocol):
-    def __init__(self, event: Dict) -> None:
+    def __init__(self, event: Dict, max_body_size: Optional[int] = None) -> None:
         self.event = event
+        self.max_body_size = max_body_size
 
     def event_to_request(self) -> Request:
         return Request(
@@ -26,6 +32,20 @@ class EventParser(EventParserProtocol):
             parameters=self.get_parameters(),
             body=self.get_body(),
             mimetype=self.get_mimetype(),
+            resource=self.get_resource(),
+        )
+
+    def event_to_route(self) -> Request:
+        # Enough to find the operation, neither parameters nor the body are parsed
+        return Request(
+            host_url=self.get_host_url(),
+            path=self.get_path(),
+            full_url_pattern=self.get_full_url_pattern(),
+            method=self.get_method(),
+            parameters=RequestParameters(),
+            body=None,
+            mimetype="",
+            resource=self.get_resource(),
         )
 
     def _get_headers(self) -> Dict:
@@ -34,25 +54,36 @@ class EventParser(EventParserProtocol):
         except KeyError:
             raise InvalidEventError("'headers' missing from event.")
 
-    def get_path(self) -> str:
-        try:
-            return self.event["path"]
-        except KeyError:
-            raise InvalidEventError("'path' missing from event.")
+    @cached_property
+    def headers(self) -> HeadersView:
+        return HeadersView(self._get_headers(), self.event.get("multiValueHeaders"))
 
-    def get_host_url(self) -> str:
+    @cached_property
+    def host_url(self) -> str:
         try:
-            proto = self._get_headers()["X-Forwarded-Proto"]
+            proto = self.headers["X-Forwarded-Proto"]
         except KeyError:
             raise InvalidEventError("'headers.X-Forwarded-Proto' missing from event.")
 
         try:
-            host = self._get_headers()["Host"]
+            host = self.headers["Host"]
         except KeyError:
             raise InvalidEventError("'headers.Host' missing from event.")
 
         return f"{proto}://{host}"
 
+    def get_path(self) -> str:
+        try:
+            return self.event["path"]
+        except KeyError:
+            raise InvalidEventError("'path' missing from event.")
+
+    def get_resource(self) -> Optional[str]:
+        return self.event.get("resource")
+
+    def get_host_url(self) -> str:
+        return self.host_url
+
     def get_method(self) -> str:
         try:
             return self.event["httpMethod"].lower()
@@ -61,7 +92,7 @@ class EventParser(EventParserProtocol):
 
     def get_mimetype(self) -> str:
         try:
-            return self._get_headers()["Content-Type"]
+            return self.headers["Content-Type"]
         except KeyError:
             raise InvalidEventError("'headers.Content-Type' missing from event.")
 
@@ -74,35 +105,141 @@ class EventParser(EventParserProtocol):
             raise InvalidEventError("'path' missing from event.")
 
     def get_parameters(self) -> RequestParameters:
+        # Views over the event's own dicts, nothing is copied per request
+        query_params = MultiDictView(
+            self.event.get("queryStringParameters"),
+            self.event.get("multiValueQueryStringParameters"),
+        )
+
+        cookies = MultiDictView()  # TODO: support cookies
+
+        path_params = self.event.get("pathParameters") or {}
+
+        return RequestParameters(
+            query=query_params, header=self.headers, cookie=cookies, path=path_params
+        )
+
+    def get_body(self) -> Any:
+        body = self.event.get("body")
+        if body is None:
+            return ""
+
+        if self.event.get("isBase64Encoded"):
+            self.check_body_size(self.get_decoded_size(body))
+            return self.decode_base64(body)
+
+        if isinstance(body, (str, bytes)) and self.max_body_size is not None:
+            self.check_body_size(self.get_size(body))
+
+        # Bodies that are already decoded are validated without a JSON roundtrip
+        return body
+
+    def check_body_size(self, size: int) -> None:
+        if self.max_body_size is not None and size > self.max_body_size:
+            raise RequestBodyTooLargeError(
+                f"Request body of {size} bytes exceeds {self.max_body_size} bytes."
+            )
+
+    @staticmethod
+    def get_size(body: Any) -> int:
+        # Limits are in bytes, and non-ASCII characters take more than one in UTF-8
+        if isinstance(body, str) and not body.isascii():
+            return len(body.encode("utf-8"))
+
+        return len(body)
+
+    @staticmethod
+    def get_decoded_size(body: Any) -> int:
+        # Known from the encoded length, nothing is decoded to reject a body
+        padding = body[-2:].count("=" if isinstance(body, str) else b"=")
+
+        return len(body) * 3 // 4 - padding
+
+    @staticmethod
+    def decode_base64(body: Any) -> bytes:
+        # ASCII strings and buffers are read in place, without an encoded copy
+        data: Any = body if isinstance(body, str) else memoryview(body)
+
         try:
-            query_params = self.event["queryStringParameters"]
+            return binascii.a2b_base64(data)
+        except (binascii.Error, ValueError):
+            raise InvalidEventError("'body' is not valid base64.")
+
+
+class HttpApiEventParser(EventParser):
+    def get_path(self) -> str:
+        try:
+            return self.event["rawPath"]
         except KeyError:
-            query_params = {}
+            raise InvalidEventError("'rawPath' missing from event.")
 
-        query_params = ImmutableMultiDict(query_params)
+    def get_resource(self) -> Optional[str]:
+        # e.g. "POST /items/{id}", or "$default" for catch-all routes and function URLs
+        route_key = self.event.get("routeKey", "")
+        _, _, resource = route_key.partition(" ")
 
-        headers = Headers(self._get_headers())
+        return resource or None
 
-        cookies: Dict = {}  # TODO: support cookies
+    @cached_property
+    def headers(self) -> HeadersView:
+        return HeadersView(self._get_headers())
+
+    @cached_property
+    def host_url(self) -> str:
+        proto = self.headers.get("x-forwarded-proto", "https")
+
+        request_context = self.event.get("requestContext", {})
+        host = self.headers.get("host") or request_context.get("domainName")
+        if host is None:
+            raise InvalidEventError("'headers.host' missing from event.")
+
+        return f"{proto}://{host}"
 
-        cookies = ImmutableMultiDict(cookies)
+    def get_method(self) -> str:
+        try:
+            return self.event["requestContext"]["http"]["method"].lower()
+        except KeyError:
+            raise InvalidEventError("'requestContext.http.method' missing from event.")
 
+    def get_mimetype(self) -> str:
         try:
-            path_params = self.event["pathParameters"]
+            return self.headers["content-type"]
         except KeyError:
-            path_params = {}
+            raise InvalidEventError("'headers.content-type' missing from event.")
+
+    def get_full_url_pattern(self) -> str:
+        return self.get_host_url() + self.get_path()
+
+    def get_parameters(self) -> RequestParameters:
+        path_params = self.event.get("pathParameters") or {}
 
         return RequestParameters(
-            query=query_params, header=headers, cookie=cookies, path=path_params
+            query=self._get_query(),
+            header=self.headers,
+            cookie=self._get_cookies(),
+            path=path_params,
         )
 
-    def get_body(self) -> str:
-        try:
-            body = self.event["body"]
-        except KeyError:
-            return ""
+    def _get_query(self) -> MultiDictView:
+        # Unlike queryStringParameters, the raw query string keeps repeated keys
+        raw_query = self.event.get("rawQueryString")
+        if raw_query is None:
+            return MultiDictView(self.event.get("queryStringParameters"))
+
+        return MultiDictView(lists=parse_qs(raw_query, keep_blank_values=True))
+
+    def _get_cookies(self) -> MultiDictView:
+        cookies: Dict[str, List[str]] = {}
+        for cookie in self.event.get("cookies") or []:
+            name, _, value = cookie.partition("=")
+            cookies.setdefault(name.strip(), []).append(value.strip())
+
+        return MultiDictView(lists=cookies)
+
+
+def get_event_parser(event: Dict, max_body_size: Optional[int] = None) -> EventParser:
+    # HTTP API payload v2.0 and function URL events share the same shape
+    if event.get("version") == "2.0" or "rawPath" in event:
+        return HttpApiEventParser(event, max_body_size)
 
-        if type(body) is str:
-            return body
-        else:
-            return json.dumps(body)
+    return EventParser(event, max_body_size)
@@ -0,0 +1,60 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Iterator, Optional, Protocol
+
+from aws_lambda_powertools.metrics import MetricUnit
+
+SPEC_LOAD_PHASE = "spec_load"
+EVENT_PARSE_PHASE = "event_parse"
+OPERATION_LOOKUP_PHASE = "operation_lookup"
+SECURITY_PHASE = "security"
+PARAMETERS_PHASE = "parameters"
+BODY_PHASE = "body"
+
+NOOP_PHASE: ContextManager[None] = nullcontext()
+
+
+class InstrumentationProtocol(Protocol):
+    def phase(self, name: str) -> ContextManager[None]:
+        raise NotImplementedError  # pragma: nocover
+
+
+class NoopInstrumentation(InstrumentationProtocol):
+    def phase(self, name: str) -> ContextManager[None]:
+        # One shared context manager, nothing is allocated per phase
+        return NOOP_PHASE
+
+
+class PowertoolsInstrumentation(InstrumentationProtocol):
+    def __init__(
+        self,
+        metrics: Optional[Any] = None,
+        tracer: Optional[Any] = None,
+        metric_prefix: str = "OASValidator",
+    ) -> None:
+        self.metrics = metrics
+        self.tracer = tracer
+        self.metric_prefix = metric_prefix
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        subsegment: ContextManager[Any] = NOOP_PHASE
+        if self.tracer is not None:
+            subsegment = self.tracer.provider.in_subsegment(
+                f"## {self.metric_prefix}.{name}"
+            )
+
+        start = time.perf_counter()
+        try:
+            with subsegment:
+                yield
+        finally:
+            if self.metrics is not None:
+                self.metrics.add_metric(
+                    name=f"{self.metric_prefix}.{name}",
+                    unit=MetricUnit.Milliseconds,
+                    value=(time.perf_counter() - start) * 1000,
+                )
+
+
+noop_instrumentation = NoopInstrumentation()
@@ -0,0 +1,125 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastjsonschema import JsonSchemaValueException
+from openapi_core import Spec
+from openapi_core.templating.media_types.exceptions import MediaTypeNotFound
+from openapi_core.templating.media_types.finders import MediaTypeFinder
+from openapi_core.templating.responses.exceptions import ResponseNotFound
+from openapi_core.templating.responses.finders import ResponseFinder
+from openapi_core.validation.schemas import (
+    oas30_read_schema_validators_factory,
+    oas31_schema_validators_factory,
+)
+from openapi_core.validation.schemas.exceptions import InvalidSchemaValue
+
+from powertools_oas_validator.datastructures import HeadersView
+from powertools_oas_validator.serializers import json_loads
+from powertools_oas_validator.services.error_handler import ErrorHandler
+from powertools_oas_validator.services.schema_compiler import (
+    SchemaCompiler,
+    is_binary_schema,
+)
+from powertools_oas_validator.services.spec_parser import SpecParser
+
+# API Gateway proxy integrations answer with JSON unless told otherwise
+DEFAULT_MIMETYPE = "application/json"
+
+ResponseValidatorKey = Tuple[str, str, str, str]
+ResponseSchema = Tuple[str, str, Optional[Callable[[Any], Any]]]
+
+
+class ResponseValidator:
+    def __init__(self, spec: Spec) -> None:
+        self.spec = spec
+        # Responses may carry readOnly properties, but not writeOnly ones
+        self.compiler = SchemaCompiler(spec, write=False)
+        version = SpecParser.get_openapi_version(spec)
+        if f"{version.major}.{version.minor}" == "3.1":
+            self.schema_validators_factory = oas31_schema_validators_factory
+        else:
+            self.schema_validators_factory = oas30_read_schema_validators_factory
+        self.schemas: Dict[ResponseValidatorKey, ResponseSchema] = {}
+
+    def validate(self, operation: Spec, response: Dict) -> None:
+        status = str(response["statusCode"])
+        body = response.get("body")
+        mimetype = "" if self.is_missing(body) else self.get_mimetype(response)
+
+        # Looked up and compiled once per operation, status code and media type
+        operation_key: Tuple[str, str] = tuple(operation.parts[1:3])  # type: ignore
+        key: ResponseValidatorKey = (*operation_key, status, mimetype)
+        schema = self.schemas.get(key)
+        if schema is None:
+            schema = self.schemas[key] = self._get_schema(operation, status, mimetype)
+
+        status_key, mimetype_key, validate = schema
+        if validate is None or response.get("isBase64Encoded"):
+            return
+
+        try:
+            data = json_loads(body) if isinstance(body, (str, bytes)) else body
+        except ValueError as ex:
+            # e.g. a plain text body without a Content-Type header
+            raise ErrorHandler.get_response_validation_error(
+                ex, status_key, mimetype_key
+            )
+
+        try:
+            validate(data)
+        except (JsonSchemaValueException, InvalidSchemaValue) as ex:
+            raise ErrorHandler.get_response_validation_error(
+                ex, status_key, mimetype_key
+            )
+
+    def _get_schema(
+        self, operation: Spec, status: str, mimetype: str
+    ) -> ResponseSchema:
+        if "responses" not in operation:
+            return status, mimetype, None
+
+        try:
+            response = ResponseFinder(operation / "responses").find(status)
+            status_key = str(response.parts[-1])
+            if not mimetype or "content" not in response:
+                return status_key, mimetype, None
+
+            media_type, mimetype_key = MediaTypeFinder(response / "content").find(
+                mimetype
+            )
+        except ResponseNotFound as ex:
+            raise ErrorHandler.get_response_validation_error(ex, status, mimetype)
+        except MediaTypeNotFound as ex:
+            raise ErrorHandler.get_response_validation_error(ex, status_key, mimetype)
+
+        if "json" not in mimetype or "schema" not in media_type:
+            return status_key, mimetype_key, None
+
+        schema = media_type / "schema"
+        if is_binary_schema(schema):
+            return status_key, mimetype_key, None
+
+        return status_key, mimetype_key, self._compile(schema)
+
+    def _compile(self, schema: Spec) -> Callable[[Any], Any]:
+        with schema.open() as schema_dict:
+            try:
+                code = self.compiler.compile_to_code(schema_dict)
+            except Exception:
+                # e.g. schemas with external references
+                return self.schema_validators_factory.create(schema).validate
+
+        return self.compiler.load(code)
+
+    @staticmethod
+    def get_mimetype(response: Dict) -> str:
+        headers = HeadersView(
+            response.get("headers"), response.get("multiValueHeaders")
+        )
+        mimetype = headers.get("Content-Type", DEFAULT_MIMETYPE)
+
+        # e.g. "application/json; charset=utf-8"
+        return mimetype.partition(";")[0].strip()
+
+    @staticmethod
+    def is_missing(body: Any) -> bool:
+        return body is None or body == ""
@@ -0,0 +1,161 @@
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import replace
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from openapi_core import Spec
+from openapi_core.datatypes import RequestParameters
+from openapi_core.templating.paths.datatypes import PathOperationServer
+from openapi_core.unmarshalling.request.datatypes import RequestUnmarshalResult
+
+from powertools_oas_validator.types import Request
+
+Fingerprint = Tuple[Hashable, ...]
+# None as the name stands for every parameter of the location
+DeclaredParameter = Tuple[str, Optional[str]]
+
+AUTHORIZATION_PARAMETER: DeclaredParameter = ("header", "Authorization")
+
+
+def copy_result(result: RequestUnmarshalResult) -> RequestUnmarshalResult:
+    # Handlers are free to change validatedBody, the cached result must not change
+    return replace(
+        result, body=deepcopy(result.body), parameters=deepcopy(result.parameters)
+    )
+
+
+class ResultCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Fingerprint, Tuple[float, Any]]" = OrderedDict()
+        self._declared: Dict[Tuple[Hashable, ...], Tuple[DeclaredParameter, ...]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Fingerprint) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[1]
+
+    def put(self, key: Fingerprint, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_fingerprint(
+        self, request: Request, path_operation: PathOperationServer
+    ) -> Optional[Fingerprint]:
+        # Bodies that are already decoded are not hashable, so they are not cached
+        body = request.body
+        if not isinstance(body, (str, bytes)):
+            return None
+
+        parameters = request.parameters
+        values = tuple(
+            self.get_values(parameters, location, name)
+            for location, name in self.get_declared_parameters(path_operation)
+        )
+
+        # The body itself rather than its hash, equal hashes must not share results
+        return request.method, request.full_url_pattern, request.mimetype, values, body
+
+    def get_declared_parameters(
+        self, path_operation: PathOperationServer
+    ) -> Tuple[DeclaredParameter, ...]:
+        path, operation = path_operation.path, path_operation.operation
+        key = tuple(operation.parts)
+
+        try:
+            return self._declared[key]
+        except KeyError:
+            pass
+
+        declared = set()
+        for parameters in (path / "parameters", operation / "parameters"):
+            if not parameters.exists():
+                continue
+
+            for parameter in parameters:
+                declared.add(self.get_declared_parameter(parameter))
+
+        spec = operation.accessor.lookup  # type: ignore
+        for scheme in self.get_security_schemes(operation, spec):
+            declared.add(scheme)
+
+        # Path parameters are part of the URL already
+        self._declared[key] = tuple(
+            sorted(
+                (parameter for parameter in declared if parameter[0] != "path"),
+                key=str,
+            )
+        )
+
+        return self._declared[key]
+
+    @staticmethod
+    def get_declared_parameter(parameter: Spec) -> DeclaredParameter:
+        location = parameter["in"]
+        is_object = (
+            parameter.getkey("style") == "deepObject"
+            or "schema" in parameter
+            and (parameter / "schema").getkey("type") == "object"
+        )
+        if location == "query" and is_object:
+            # Exploded objects are read from query keys other than their name
+            return location, None
+
+        return location, parameter["name"]
+
+    @staticmethod
+    def get_security_schemes(operation: Spec, spec: Dict) -> List[DeclaredParameter]:
+        if "security" in operation:
+            requirements = operation.getkey("security")
+        else:
+            requirements = spec.get("security", [])
+
+        schemes = spec.get("components", {}).get("securitySchemes", {})
+        declared: List[DeclaredParameter] = []
+        for requirement in requirements:
+            for name in requirement:
+                scheme = schemes.get(name, {})
+                if scheme.get("type") == "apiKey":
+                    declared.append((scheme["in"], scheme["name"]))
+                else:
+                    # http, oauth2 and openIdConnect send the Authorization header
+                    declared.append(AUTHORIZATION_PARAMETER)
+
+        return declared
+
+    @staticmethod
+    def get_values(
+        parameters: RequestParameters, location: str, name: Optional[str]
+    ) -> Tuple[Hashable, ...]:
+        values = getattr(parameters, location)
+        if name is None:
+            return tuple((key, tuple(values.getlist(key))) for key in sorted(values))
+
+        return tuple(values.getlist(name))
@@ -0,0 +1,342 @@
+from collections import defaultdict
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+import fastjsonschema
+from openapi_core import Spec
+
+from powertools_oas_validator.exceptions import UnsupportedOpenAPIVersion
+from powertools_oas_validator.services.spec_parser import SpecParser
+
+SCHEMA_MAPPING_KEYWORDS = ("properties", "patternProperties", "definitions", "$defs")
+SCHEMA_KEYWORDS = (
+    "items",
+    "additionalProperties",
+    "additionalItems",
+    "contains",
+    "propertyNames",
+    "not",
+    "if",
+    "then",
+    "else",
+)
+SCHEMA_LIST_KEYWORDS = ("allOf", "anyOf", "oneOf", "prefixItems")
+DRAFT07_FORMATS = {
+    "date",
+    "date-time",
+    "email",
+    "hostname",
+    "idn-hostname",
+    "ipv4",
+    "ipv6",
+    "iri",
+    "iri-reference",
+    "json-pointer",
+    "regex",
+    "relative-json-pointer",
+    "time",
+    "uri",
+    "uri-reference",
+    "uri-template",
+}
+
+EXCLUSIVE_BOUNDS = (("exclusiveMinimum", "minimum"), ("exclusiveMaximum", "maximum"))
+
+# OpenAPI 3.1 schemas are JSON Schema 2020-12, which fastjsonschema does not support
+COMPILABLE_OPENAPI_VERSIONS = ("3.0",)
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+BodyValidatorKey = Tuple[str, str, str]
+
+
+def is_binary_schema(schema: Spec) -> bool:
+    return schema.getkey("format") == "binary"
+
+
+def deny_remote_ref(uri: str) -> Any:
+    raise ValueError(f"Remote reference '{uri}' is not supported")
+
+
+def permissive_format(value: Any) -> bool:
+    return True
+
+
+# OpenAPI formats such as int32 or binary are not JSON Schema formats
+custom_formats: Dict[str, Callable] = defaultdict(lambda: permissive_format)
+
+
+class SchemaCompiler:
+    def __init__(self, spec: Spec, write: bool = True) -> None:
+        self.spec = spec
+        # Requests must not carry readOnly properties, responses writeOnly ones
+        self.forbidden_keyword = "readOnly" if write else "writeOnly"
+        version = SpecParser.get_openapi_version(spec)
+        self.version = f"{version.major}.{version.minor}"
+        self._components: Optional[Dict] = None
+
+    @property
+    def compilable(self) -> bool:
+        return self.version in COMPILABLE_OPENAPI_VERSIONS
+
+    @property
+    def components(self) -> Dict:
+        if self._components is None:
+            components = self.spec.accessor.lookup.get("components", {})  # type: ignore
+            schemas = components.get("schemas", {})
+            self._components = {
+                "schemas": {name: self.translate(val) for name, val in schemas.items()}
+            }
+
+        return self._components
+
+    def compile_to_code(self, schema: Any) -> str:
+        if not self.compilable:
+            # e.g. unevaluatedProperties would be ignored as a draft-07 schema
+            raise UnsupportedOpenAPIVersion(
+                f"Schemas of OpenAPI {self.version} cannot be compiled"
+            )
+
+        definition = {
+            "allOf": [self.translate(schema)],
+            "components": self.components,
+        }
+        handlers = dict.fromkeys(["http", "https", "file"], deny_remote_ref)
+
+        return fastjsonschema.compile_to_code(
+            definition,
+            handlers=handlers,
+            formats=self.get_formats(definition),
+            use_default=False,
+        )
+
+    def translate(self, schema: Any) -> Any:
+        if not isinstance(schema, dict):
+            return schema
+
+        result: Dict[str, Any] = {}
+        for keyword, value in schema.items():
+            if keyword in SCHEMA_MAPPING_KEYWORDS and isinstance(value, dict):
+                result[keyword] = {
+                    name: self.translate(subschema)
+                    for name, subschema in value.items()
+                }
+            elif keyword in SCHEMA_KEYWORDS:
+                result[keyword] = self.translate(value)
+            elif keyword in SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+                result[keyword] = [self.translate(subschema) for subschema in value]
+            else:
+                result[keyword] = value
+
+        self._forbid_properties(result, schema.get("properties"))
+        self._translate_exclusive_bounds(result)
+
+        if result.pop("nullable", False):
+            return self._make_nullable(result)
+
+        return result
+
+    def _forbid_properties(self, schema: Dict, source: Any) -> None:
+        properties = schema.get("properties")
+        if not isinstance(properties, dict):
+            return
+
+        # Checked before translation, which wraps nullable references in anyOf
+        forbidden = {
+            name for name, subschema in source.items() if self._is_forbidden(subschema)
+        }
+        if not forbidden:
+            return
+
+        for name in forbidden:
+            properties[name] = False
+
+        if "required" in schema:
+            schema["required"] = [
+                name for name in schema["required"] if name not in forbidden
+            ]
+
+    def _is_forbidden(self, schema: Any, refs: Tuple[str, ...] = ()) -> bool:
+        if not isinstance(schema, dict):
+            return False
+
+        if schema.get(self.forbidden_keyword):
+            return True
+
+        # e.g. a shared readOnly id, referenced or wrapped in allOf to add a description
+        ref = schema.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/") and ref not in refs:
+            if self._is_forbidden(self._resolve(ref), (*refs, ref)):
+                return True
+
+        all_of = schema.get("allOf")
+        if not isinstance(all_of, list):
+            return False
+
+        return any(self._is_forbidden(subschema, refs) for subschema in all_of)
+
+    def _resolve(self, ref: str) -> Any:
+        value = self.spec.accessor.lookup  # type: ignore
+        for part in ref[2:].split("/"):
+            part = part.replace("~1", "/").replace("~0", "~")
+            if not isinstance(value, dict) or part not in value:
+                return None
+            value = value[part]
+
+        return value
+
+    @staticmethod
+    def _translate_exclusive_bounds(schema: Dict) -> None:
+        # OpenAPI 3.0 flags the bound as exclusive, JSON Schema takes the bound itself
+        for exclusive, bound in EXCLUSIVE_BOUNDS:
+            if not isinstance(schema.get(exclusive), bool):
+                continue
+
+            if schema.pop(exclusive) and bound in schema:
+                schema[exclusive] = schema.pop(bound)
+
+    @staticmethod
+    def _make_nullable(schema: Dict) -> Dict:
+        if "$ref" in schema or "type" not in schema:
+            return {"anyOf": [{"type": "null"}, schema]}
+
+        schema_type = schema["type"]
+        if isinstance(schema_type, list):
+            schema["type"] = [*schema_type, "null"]
+        else:
+            schema["type"] = [schema_type, "null"]
+
+        if "enum" in schema and None not in schema["enum"]:
+            schema["enum"] = [*schema["enum"], None]
+
+        return schema
+
+    @staticmethod
+    def get_formats(definition: Any) -> Dict[str, Callable]:
+        formats: Set[str] = set()
+
+        def collect(schema: Any) -> None:
+            if isinstance(schema, dict):
+                if isinstance(schema.get("format"), str):
+                    formats.add(schema["format"])
+                for value in schema.values():
+                    collect(value)
+            elif isinstance(schema, list):
+                for value in schema:
+                    collect(value)
+
+        collect(definition)
+
+        return {name: custom_formats[name] for name in formats - DRAFT07_FORMATS}
+
+    @staticmethod
+    def load(code: str) -> Callable:
+        namespace: Dict[str, Any] = {}
+        exec(code, namespace)
+
+        return partial(namespace["validate"], custom_formats=custom_formats)
+
+
+class BodyValidators:
+    def __init__(
+        self,
+        spec: Spec,
+        compiled: Optional[Dict[BodyValidatorKey, Tuple[str, bool]]] = None,
+        lazy: bool = False,
+    ) -> None:
+        self.spec = spec
+        self.compiler = SchemaCompiler(spec)
+        self.lazy = lazy
+        self.code: Dict[BodyValidatorKey, str] = {}
+        self.required: Dict[BodyValidatorKey, bool] = {}
+        self.validators: Dict[BodyValidatorKey, Callable] = {}
+        self.operations: Set[Tuple[str, str]] = set()
+
+        if compiled is not None:
+            for key, (code, required) in compiled.items():
+                self.code[key] = code
+                self.required[key] = required
+                self.validators[key] = self.compiler.load(code)
+            self.lazy = False
+            return
+
+        if not self.compiler.compilable:
+            # Every body is left to openapi-core
+            self.lazy = False
+            return
+
+        if lazy:
+            return
+
+        for key, required, schema in self._iter_schemas():
+            self._compile(key, required, schema)
+
+    def get(
+        self, operation: Spec, mimetype: str
+    ) -> Optional[Tuple[Callable, bool]]:
+        key: BodyValidatorKey = (*operation.parts[1:3], mimetype)  # type: ignore
+
+        if self.lazy:
+            self._compile_operation(operation)
+
+        try:
+            return self.validators[key], self.required[key]
+        except KeyError:
+            return None
+
+    def _compile_operation(self, operation: Spec) -> None:
+        operation_key: Tuple[str, str] = tuple(operation.parts[1:3])  # type: ignore
+        if operation_key in self.operations:
+            return
+
+        for key, required, schema in self._iter_operation_schemas(
+            *operation_key, operation
+        ):
+            self._compile(key, required, schema)
+
+        self.operations.add(operation_key)
+
+    def _compile(self, key: BodyValidatorKey, required: bool, schema: Dict) -> None:
+        try:
+            code = self.compiler.compile_to_code(schema)
+        except Exception:
+            # Left to openapi-core, e.g. schemas with external references
+            return
+
+        self.code[key] = code
+        self.required[key] = required
+        self.validators[key] = self.compiler.load(code)
+
+    def _iter_schemas(self) -> Iterator[Tuple[BodyValidatorKey, bool, Dict]]:
+        paths = self.spec / "paths"
+        if not paths.exists():
+            return
+
+        for path_pattern, path in paths.items():
+            for method in HTTP_METHODS:
+                if method in path:
+                    yield from self._iter_operation_schemas(
+                        path_pattern, method, path / method
+                    )
+
+    @staticmethod
+    def _iter_operation_schemas(
+        path_pattern: str, method: str, operation: Spec
+    ) -> Iterator[Tuple[BodyValidatorKey, bool, Dict]]:
+        if "requestBody" not in operation:
+            return
+
+        request_body = operation / "requestBody"
+        if "content" not in request_body:
+            return
+
+        required = request_body.getkey("required", False)
+        for mimetype, media_type in (request_body / "content").items():
+            if "json" not in mimetype or "schema" not in media_type:
+                continue
+
+            if is_binary_schema(media_type / "schema"):
+                continue
+
+            with (media_type / "schema").open() as schema:
+                yield (path_pattern, method, mimetype), required, schema
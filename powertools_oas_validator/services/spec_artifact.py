@@ -0,0 +1,91 @@
+import hashlib
+import logging
+import pickle
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from openapi_core import Spec
+
+from powertools_oas_validator.services.schema_compiler import (
+    BodyValidatorKey,
+    BodyValidators,
+)
+
+ARTIFACT_VERSION = 4
+ARTIFACT_SUFFIX = ".pickle"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SpecArtifact:
+    source_hash: str
+    spec: Dict
+    body_validators: Dict[BodyValidatorKey, Tuple[str, bool]] = field(
+        default_factory=dict
+    )
+    version: int = ARTIFACT_VERSION
+
+    @classmethod
+    def compile(cls, oas_path: str) -> "SpecArtifact":
+        spec = Spec.from_file_path(oas_path)
+        body_validators = BodyValidators(spec)
+
+        return cls(
+            source_hash=cls.hash_file(oas_path),
+            spec=spec.accessor.lookup,  # type: ignore
+            body_validators={
+                key: (code, body_validators.required[key])
+                for key, code in body_validators.code.items()
+            },
+        )
+
+    @classmethod
+    def load_for(cls, oas_path: str) -> Optional["SpecArtifact"]:
+        try:
+            with open(cls.get_path(oas_path), "rb") as artifact_file:
+                artifact = pickle.load(artifact_file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # e.g. a truncated file, or one pickled by an incompatible release
+            logger.warning(
+                "Could not load the spec artifact, the spec is parsed instead",
+                exc_info=True,
+                extra={"oas_path": oas_path},
+            )
+            return None
+
+        if not isinstance(artifact, cls) or artifact.version != ARTIFACT_VERSION:
+            return None
+
+        if artifact.source_hash != cls.hash_file(oas_path):
+            return None
+
+        return artifact
+
+    def dump(self, path: str) -> None:
+        with open(path, "wb") as artifact_file:
+            pickle.dump(self, artifact_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def get_path(oas_path: str) -> str:
+        return oas_path + ARTIFACT_SUFFIX
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        with open(path, "rb") as source_file:
+            return hashlib.sha256(source_file.read()).hexdigest()
+
+
+# Specs compare equal by path, so artifacts are tracked by their accessor
+artifacts: "WeakKeyDictionary[object, SpecArtifact]" = WeakKeyDictionary()
+
+
+def get_artifact(spec: Spec) -> Optional[SpecArtifact]:
+    return artifacts.get(spec.accessor)
+
+
+def set_artifact(spec: Spec, artifact: SpecArtifact) -> None:
+    artifacts[spec.accessor] = artifact
@@ -0,0 +1,72 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+from openapi_core import Spec
+
+FileIdentity = Tuple[int, int]
+SpecCacheKey = Tuple[str, Hashable]
+
+
+class SpecCache:
+    def __init__(self, maxsize: int = 8) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[SpecCacheKey, Tuple[FileIdentity, Spec]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get_or_load(
+        self,
+        oas_path: str,
+        load: Callable[[str], Spec],
+        variant: Hashable = None,
+    ) -> Spec:
+        # Specs loaded differently, e.g. without validation, are cached apart
+        path = os.path.abspath(oas_path)
+        key = (path, variant)
+        identity = self._get_identity(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == identity:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        spec = load(oas_path)
+
+        with self._lock:
+            self._entries[key] = (identity, spec)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return spec
+
+    def invalidate(self, oas_path: Optional[str] = None) -> None:
+        with self._lock:
+            if oas_path is None:
+                self._entries.clear()
+                return
+
+            path = os.path.abspath(oas_path)
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+    def __contains__(self, oas_path: str) -> bool:
+        path = os.path.abspath(oas_path)
+
+        return any(key[0] == path for key in self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _get_identity(path: str) -> FileIdentity:
+        stat = os.stat(path)
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+spec_cache = SpecCache()
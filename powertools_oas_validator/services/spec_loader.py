@@ -1,12 +1,29 @@
 import os
-from typing import Protocol
+from pathlib import Path
+from typing import Dict, Optional, Protocol
 
 from openapi_core import Spec
 
 from powertools_oas_validator.exceptions import (
     FileNotExistsError,
     NotSupportedFileTypeError,
+    UnsupportedValidateSpecMode,
 )
+from powertools_oas_validator.services.instrumentation import (
+    SPEC_LOAD_PHASE,
+    InstrumentationProtocol,
+    noop_instrumentation,
+)
+from powertools_oas_validator.services.spec_artifact import SpecArtifact, set_artifact
+from powertools_oas_validator.services.spec_cache import spec_cache
+from powertools_oas_validator.services.spec_reader import SpecReader
+
+VALIDATE_SPEC_ALWAYS = "always"
+VALIDATE_SPEC_STAMP = "stamp"
+VALIDATE_SPEC_NEVER = "never"
+validate_spec_modes = (VALIDATE_SPEC_ALWAYS, VALIDATE_SPEC_STAMP, VALIDATE_SPEC_NEVER)
+
+STAMP_SUFFIX = ".stamp"
 
 
 class SpecLoaderProtocol(Protocol):
@@ -17,15 +34,79 @@ class SpecLoaderProtocol(Protocol):
 class SpecLoader:
     oas_path: str
     validated_cache: bool = False
+    loader: Optional[str] = None
+
+    def __init__(
+        self,
+        oas_path: str,
+        sidecar: bool = False,
+        validate_spec: str = VALIDATE_SPEC_ALWAYS,
+        instrumentation: InstrumentationProtocol = noop_instrumentation,
+    ) -> None:
+        if validate_spec not in validate_spec_modes:
+            raise UnsupportedValidateSpecMode(
+                f"Unsupported validate_spec mode: '{validate_spec}'"
+            )
 
-    def __init__(self, oas_path: str) -> None:
         self.oas_path = oas_path
+        self.sidecar = sidecar
+        self.validate_spec = validate_spec
+        self.instrumentation = instrumentation
 
     def read_from_file_name(self) -> Spec:
         if not self.validated_cache:
             self.validate_file()
 
-        return Spec.from_file_path(self.oas_path)
+        return spec_cache.get_or_load(
+            self.oas_path, self.load, variant=self.validate_spec
+        )
+
+    def load(self, oas_path: str) -> Spec:
+        # Only timed on a cache miss, cached specs are not loaded again
+        with self.instrumentation.phase(SPEC_LOAD_PHASE):
+            return self._load(oas_path)
+
+    def _load(self, oas_path: str) -> Spec:
+        spec_url = self.get_spec_url(oas_path)
+
+        artifact = SpecArtifact.load_for(oas_path)
+        if artifact is None:
+            reader = SpecReader(oas_path, sidecar=self.sidecar)
+            spec = self.from_dict(oas_path, reader.read(), spec_url)
+            self.loader = reader.loader
+
+            return spec
+
+        # The artifact was validated when it was compiled
+        spec = Spec.from_dict(artifact.spec, spec_url=spec_url, validator=None)
+        set_artifact(spec, artifact)
+        self.loader = "artifact"
+
+        return spec
+
+    def from_dict(self, oas_path: str, data: Dict, spec_url: str) -> Spec:
+        if self.validate_spec == VALIDATE_SPEC_NEVER:
+            return Spec.from_dict(data, spec_url=spec_url, validator=None)
+
+        if self.validate_spec == VALIDATE_SPEC_ALWAYS:
+            return Spec.from_dict(data, spec_url=spec_url)
+
+        # Skip validation if this exact spec has been validated before
+        source_hash = SpecArtifact.hash_file(oas_path)
+        if self.read_stamp(oas_path) == source_hash:
+            return Spec.from_dict(data, spec_url=spec_url, validator=None)
+
+        spec = Spec.from_dict(data, spec_url=spec_url)
+        self.write_stamp(oas_path, source_hash)
+
+        return spec
+
+    def stamp(self) -> None:
+        source_hash = SpecArtifact.hash_file(self.oas_path)
+        data = SpecReader(self.oas_path).read()
+        Spec.from_dict(data, spec_url=self.get_spec_url(self.oas_path))
+
+        self.write_stamp(self.oas_path, source_hash)
 
     def validate_file(self) -> None:
         if self.validated_cache:
@@ -42,3 +123,28 @@ class SpecLoader:
             )
 
         self.validated_cache = True
+
+    @staticmethod
+    def get_spec_url(oas_path: str) -> str:
+        return Path(os.path.abspath(oas_path)).as_uri()
+
+    @staticmethod
+    def get_stamp_path(oas_path: str) -> str:
+        return oas_path + STAMP_SUFFIX
+
+    @classmethod
+    def read_stamp(cls, oas_path: str) -> Optional[str]:
+        try:
+            with open(cls.get_stamp_path(oas_path)) as stamp_file:
+                return stamp_file.read().strip()
+        except OSError:
+            return None
+
+    @classmethod
+    def write_stamp(cls, oas_path: str, source_hash: str) -> None:
+        try:
+            with open(cls.get_stamp_path(oas_path), "w") as stamp_file:
+                stamp_file.write(source_hash)
+        except OSError:
+            # e.g. a read-only file system, the spec is validated again next time
+            pass
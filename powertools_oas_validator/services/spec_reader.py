@@ -0,0 +1,100 @@
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+import yaml  # type: ignore
+from jsonschema_spec.loaders import JsonschemaSafeLoader
+
+from powertools_oas_validator.serializers import JSON_LIBRARY, json_dumps, json_loads
+
+SIDECAR_SUFFIX = ".json"
+
+JSON_LOADER = JSON_LIBRARY
+YAML_LOADER = "yaml-libyaml" if yaml.__with_libyaml__ else "yaml"
+
+
+class SpecReader:
+    def __init__(self, oas_path: str, sidecar: bool = False) -> None:
+        self.oas_path = oas_path
+        self.sidecar = sidecar
+        self.loader: Optional[str] = None
+
+    def read(self) -> Dict:
+        if self.is_json(self.oas_path):
+            return self._read(self.oas_path, self.load_json, JSON_LOADER)
+
+        if not self.sidecar:
+            return self._read(self.oas_path, self.load_yaml, YAML_LOADER)
+
+        sidecar_path = self.get_sidecar_path(self.oas_path)
+        if self.is_fresh(sidecar_path, self.oas_path):
+            return self._read(sidecar_path, self.load_json, f"{JSON_LOADER}-sidecar")
+
+        data = self._read(self.oas_path, self.load_yaml, YAML_LOADER)
+        self.write_sidecar(sidecar_path, data)
+
+        return data
+
+    def _read(self, path: str, load: Callable[[bytes], Any], loader: str) -> Dict:
+        with open(path, "rb") as spec_file:
+            data = load(spec_file.read())
+
+        self.loader = loader
+
+        return data
+
+    @classmethod
+    def load_yaml(cls, content: bytes) -> Any:
+        # Mapping keys such as response codes are not always strings in YAML
+        return cls.stringify_keys(yaml.load(content, JsonschemaSafeLoader))
+
+    @staticmethod
+    def load_json(content: bytes) -> Any:
+        return json_loads(content)
+
+    @classmethod
+    def stringify_keys(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {
+                cls.stringify_key(key): cls.stringify_keys(value)
+                for key, value in data.items()
+            }
+
+        if isinstance(data, list):
+            return [cls.stringify_keys(value) for value in data]
+
+        return data
+
+    @staticmethod
+    def stringify_key(key: Any) -> str:
+        # Same keys as a JSON roundtrip, e.g. 200 -> "200" and true -> "true"
+        return key if isinstance(key, str) else json.dumps(key)
+
+    @staticmethod
+    def write_sidecar(sidecar_path: str, data: Any) -> None:
+        temp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as sidecar_file:
+                sidecar_file.write(json_dumps(data))
+            os.replace(temp_path, sidecar_path)
+        except OSError:
+            # e.g. a read-only file system, the spec is used as read
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def is_fresh(path: str, source_path: str) -> bool:
+        try:
+            return os.stat(path).st_mtime_ns >= os.stat(source_path).st_mtime_ns
+        except OSError:
+            return False
+
+    @staticmethod
+    def is_json(oas_path: str) -> bool:
+        return oas_path.endswith(".json")
+
+    @staticmethod
+    def get_sidecar_path(oas_path: str) -> str:
+        return oas_path + SIDECAR_SUFFIX
@@ -1,20 +1,101 @@
-from typing import Dict
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
-from openapi_core import validate_request
-from openapi_core.validation.request.validators import APICallRequestValidator
+from openapi_core import Spec
+from openapi_core.templating.paths.datatypes import PathOperationServer
+from openapi_core.unmarshalling.request.datatypes import RequestUnmarshalResult
 
-from powertools_oas_validator.exceptions import UnsupportedOpenAPIVersion
+from powertools_oas_validator.exceptions import (
+    UnsupportedEngine,
+    UnsupportedOpenAPIVersion,
+)
 from powertools_oas_validator.overrides import (
     V30RequestUnmarshaller,
     V31RequestUnmarshaller,
 )
+from powertools_oas_validator.overrides.unmarshallers import (
+    APICallRequestUnmarshaller,
+)
 from powertools_oas_validator.services.error_handler import ErrorHandler
 from powertools_oas_validator.services.event_parser import EventParserProtocol
+from powertools_oas_validator.services.instrumentation import (
+    EVENT_PARSE_PHASE,
+    InstrumentationProtocol,
+    noop_instrumentation,
+)
+from powertools_oas_validator.services.schema_compiler import BodyValidators
+from powertools_oas_validator.services.spec_artifact import get_artifact
 from powertools_oas_validator.services.spec_loader import SpecLoaderProtocol
 from powertools_oas_validator.services.spec_parser import SpecParser
+from powertools_oas_validator.types import Request
 
 marshaller_map = {"3.1": V31RequestUnmarshaller, "3.0": V30RequestUnmarshaller}
 
+OPENAPI_CORE_ENGINE = "openapi-core"
+FASTJSONSCHEMA_ENGINE = "fastjsonschema"
+engines = (OPENAPI_CORE_ENGINE, FASTJSONSCHEMA_ENGINE)
+
+UnmarshallerKey = Tuple[
+    int, Optional[str], str, bool, bool, InstrumentationProtocol
+]
+UnmarshallerEntry = Tuple[Spec, APICallRequestUnmarshaller]
+
+
+class UnmarshallerCache:
+    def __init__(self, maxsize: int = 32) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[UnmarshallerKey, UnmarshallerEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(
+        self,
+        spec: Spec,
+        base_url: Optional[str],
+        engine: str = OPENAPI_CORE_ENGINE,
+        lazy: bool = False,
+        fail_fast: bool = True,
+        instrumentation: InstrumentationProtocol = noop_instrumentation,
+    ) -> APICallRequestUnmarshaller:
+        # Specs compare equal by path, so entries are keyed by identity
+        key = (id(spec), base_url, engine, lazy, fail_fast, instrumentation)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is spec:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        if engine not in engines:
+            raise UnsupportedEngine(f"Unsupported validation engine: '{engine}'")
+
+        unmarshaller_cls = SpecValidator.get_unmarshaller_class(spec)
+        unmarshaller = unmarshaller_cls(spec, base_url=base_url)
+        unmarshaller.fail_fast = fail_fast
+        unmarshaller.instrumentation = instrumentation
+
+        if engine == FASTJSONSCHEMA_ENGINE:
+            artifact = get_artifact(spec)
+            compiled = artifact.body_validators if artifact is not None else None
+            unmarshaller.body_validators = BodyValidators(
+                spec, compiled=compiled, lazy=lazy
+            )
+
+        with self._lock:
+            self._entries[key] = (spec, unmarshaller)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return unmarshaller
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class SpecValidator:
     def __init__(
@@ -23,30 +104,89 @@ class SpecValidator:
         event: Dict,
         spec_loader: SpecLoaderProtocol,
         event_parser: EventParserProtocol,
+        unmarshaller: Optional[APICallRequestUnmarshaller] = None,
+        instrumentation: InstrumentationProtocol = noop_instrumentation,
     ) -> None:
         self.file_path = file_path
         self.event = event
         self.spec_loader = spec_loader
         self.event_parser = event_parser
+        self.unmarshaller = unmarshaller
+        self.instrumentation = instrumentation
 
-    def validate_request_against_spec(self) -> None:
-        self.spec = self.spec_loader.read_from_file_name()
-
-        request = self.event_parser.event_to_request()
+    def validate_request_against_spec(self) -> RequestUnmarshalResult:
+        return self.validate_request(*self.prepare())
 
+    @staticmethod
+    def validate_request(
+        request: Request,
+        unmarshaller: APICallRequestUnmarshaller,
+        path_operation: Optional[PathOperationServer] = None,
+    ) -> RequestUnmarshalResult:
         try:
-            validate_request(
-                request,
-                spec=self.spec,
-                base_url=request.host_url,
-                cls=self._get_class(),  # type: ignore
-            )
-
+            if path_operation is None:
+                result = unmarshaller.unmarshal(request)
+            else:
+                # The operation was already looked up, e.g. for a whole batch
+                result = unmarshaller.unmarshal_operation(request, path_operation)
         except Exception as ex:
             ErrorHandler.raise_schema_validation_error(ex, request)
 
-    def _get_class(self) -> type[APICallRequestValidator]:
-        version = SpecParser.get_openapi_version(self.spec)
+        if result.errors and not unmarshaller.fail_fast:
+            ErrorHandler.raise_aggregated_error(result.errors, request)
+
+        # Fail on the first error, like openapi-core's validate()
+        for error in result.errors:
+            ErrorHandler.raise_schema_validation_error(error, request)
+
+        return result
+
+    def check_request_against_spec(self) -> RequestUnmarshalResult:
+        return self.check_request(*self.prepare())
+
+    @staticmethod
+    def check_request(
+        request: Request, unmarshaller: APICallRequestUnmarshaller
+    ) -> RequestUnmarshalResult:
+        result = unmarshaller.check(request)
+        for error in result.errors:
+            ErrorHandler.raise_schema_validation_error(error, request)
+
+        return result
+
+    def prepare(self) -> Tuple[Request, APICallRequestUnmarshaller]:
+        if self.unmarshaller is None:
+            self.spec = self.spec_loader.read_from_file_name()
+        else:
+            self.spec = self.unmarshaller.spec
+
+        with self.instrumentation.phase(EVENT_PARSE_PHASE):
+            request = self.event_parser.event_to_request()
+
+        unmarshaller = self.unmarshaller
+        if unmarshaller is None:
+            unmarshaller = self.get_unmarshaller(
+                self.spec, request.host_url, instrumentation=self.instrumentation
+            )
+
+        return request, unmarshaller
+
+    @staticmethod
+    def get_unmarshaller(
+        spec: Spec,
+        base_url: Optional[str] = None,
+        engine: str = OPENAPI_CORE_ENGINE,
+        lazy: bool = False,
+        fail_fast: bool = True,
+        instrumentation: InstrumentationProtocol = noop_instrumentation,
+    ) -> APICallRequestUnmarshaller:
+        return unmarshaller_cache.get_or_create(
+            spec, base_url, engine, lazy, fail_fast, instrumentation
+        )
+
+    @staticmethod
+    def get_unmarshaller_class(spec: Spec) -> type[APICallRequestUnmarshaller]:
+        version = SpecParser.get_openapi_version(spec)
 
         try:
             return marshaller_map[f"{version.major}.{version.minor}"]
@@ -54,3 +194,6 @@ class SpecValidator:
             raise UnsupportedOpenAPIVersion(
                 f"Unsupported OpenAPI version: '{str(version)}'"
             )
+
+
+unmarshaller_cache = UnmarshallerCache()
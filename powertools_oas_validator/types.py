@@ -1,7 +1,10 @@
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
 from openapi_core.datatypes import RequestParameters
 from openapi_core.protocols import Request as CoreRequest
+from openapi_core.unmarshalling.request.datatypes import RequestUnmarshalResult
 
 
 @dataclass
@@ -22,8 +25,9 @@ class Request(CoreRequest):  # pragma: nocover
         full_url_pattern: str,
         method: str,
         parameters: RequestParameters,
-        body: str,
+        body: Any,
         mimetype: str,
+        resource: Optional[str] = None,
     ) -> None:
         self._host_url = host_url
         self._path = path
@@ -32,6 +36,7 @@ class Request(CoreRequest):  # pragma: nocover
         self.parameters = parameters
         self._body = body
         self._mimetype = mimetype
+        self._resource = resource
 
     @property
     def host_url(self) -> str:
@@ -66,11 +71,11 @@ class Request(CoreRequest):  # pragma: nocover
         self._method = val
 
     @property
-    def body(self) -> str:
+    def body(self) -> Any:
         return self._body
 
     @body.setter
-    def body(self, val: str) -> None:
+    def body(self, val: Any) -> None:
         self._body = val
 
     @property
@@ -80,3 +85,74 @@ class Request(CoreRequest):  # pragma: nocover
     @mimetype.setter
     def mimetype(self, val: str) -> None:
         self._mimetype = val
+
+    @property
+    def resource(self) -> Optional[str]:
+        return self._resource
+
+    @resource.setter
+    def resource(self, val: Optional[str]) -> None:
+        self._resource = val
+
+
+@dataclass
+class BatchRecordResult:
+    identifier: str
+    result: Optional[RequestUnmarshalResult] = None
+    error: Optional[Exception] = None
+    operation: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchValidationResult:
+    records: List[BatchRecordResult]
+
+    @property
+    def failures(self) -> List[BatchRecordResult]:
+        return [record for record in self.records if not record.success]
+
+    def to_batch_response(self) -> Dict[str, List[Dict[str, str]]]:
+        # The partial batch response shape of Powertools' BatchProcessor
+        return {
+            "batchItemFailures": [
+                {"itemIdentifier": record.identifier} for record in self.failures
+            ]
+        }
+
+
+@dataclass
+class BulkValidationSummary:
+    total: int = 0
+    failed: int = 0
+    operations: "Counter[str]" = field(default_factory=Counter)
+    errors: "Counter[Tuple[str, str]]" = field(default_factory=Counter)
+
+    def add(self, result: BatchValidationResult) -> None:
+        for record in result.records:
+            operation = record.operation or "unknown"
+            self.total += 1
+            self.operations[operation] += 1
+            if record.error is not None:
+                self.failed += 1
+                self.errors[(operation, type(record.error).__name__)] += 1
+
+    def add_errors(
+        self, error_type: str, count: int, operation: str = "unknown"
+    ) -> None:
+        if not count:
+            return
+
+        self.total += count
+        self.failed += count
+        self.operations[operation] += count
+        self.errors[(operation, error_type)] += count
+
+    def merge(self, other: "BulkValidationSummary") -> None:
+        self.total += other.total
+        self.failed += other.failed
+        self.operations.update(other.operations)
+        self.errors.update(other.errors)
@@ -0,0 +1,433 @@
+import functools
+import logging
+import random
+from collections.abc import Callable
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from aws_lambda_powertools.utilities.validation.exceptions import SchemaValidationError
+from openapi_core import Spec
+from openapi_core.templating.paths.datatypes import PathOperationServer
+from openapi_core.templating.paths.exceptions import PathError
+from openapi_core.unmarshalling.request.datatypes import RequestUnmarshalResult
+
+from powertools_oas_validator.exceptions import (
+    InvalidSampleRateError,
+    ResponseValidationError,
+    UnsupportedEngine,
+)
+from powertools_oas_validator.overrides.unmarshallers import (
+    APICallRequestUnmarshaller,
+)
+from powertools_oas_validator.services.error_handler import ErrorHandler
+from powertools_oas_validator.services.event_parser import get_event_parser
+from powertools_oas_validator.services.instrumentation import (
+    InstrumentationProtocol,
+    noop_instrumentation,
+)
+from powertools_oas_validator.services.response_validator import ResponseValidator
+from powertools_oas_validator.services.result_cache import ResultCache, copy_result
+from powertools_oas_validator.services.spec_loader import (
+    VALIDATE_SPEC_ALWAYS,
+    SpecLoader,
+)
+from powertools_oas_validator.services.spec_validator import (
+    FASTJSONSCHEMA_ENGINE,
+    OPENAPI_CORE_ENGINE,
+    SpecValidator,
+)
+from powertools_oas_validator.types import (
+    BatchRecordResult,
+    BatchValidationResult,
+    Request,
+)
+
+VALIDATED_BODY_KEY = "validatedBody"
+
+logger = logging.getLogger(__name__)
+
+ViolationCallback = Callable[[Exception, Dict], Any]
+
+BatchEntry = Tuple[BatchRecordResult, Request, PathOperationServer]
+
+BACKGROUND_WORKERS = 1
+# Seconds left to the invocation for returning the response after a flush
+BACKGROUND_DEADLINE_MARGIN = 0.2
+
+
+def attach_result(
+    result: RequestUnmarshalResult,
+    event: Dict,
+    context: LambdaContext,
+    result_key: Optional[str] = None,
+    context_attribute: Optional[str] = None,
+) -> None:
+    event[VALIDATED_BODY_KEY] = result.body
+
+    if result_key is not None:
+        event[result_key] = result
+
+    if context_attribute is not None:
+        setattr(context, context_attribute, result)
+
+
+class OASValidator:
+    spec: Optional[Spec] = None
+    unmarshaller: Optional[APICallRequestUnmarshaller] = None
+
+    def __init__(
+        self,
+        oas_path: str,
+        eager: bool = False,
+        base_url: Optional[str] = None,
+        engine: str = OPENAPI_CORE_ENGINE,
+        sidecar: bool = False,
+        lazy: bool = False,
+        validate_spec: str = VALIDATE_SPEC_ALWAYS,
+        result_key: Optional[str] = None,
+        context_attribute: Optional[str] = None,
+        max_body_size: Optional[int] = None,
+        fail_fast: bool = True,
+        instrumentation: InstrumentationProtocol = noop_instrumentation,
+        sample_rate: float = 1.0,
+        shadow: bool = False,
+        on_violation: Optional[ViolationCallback] = None,
+        background: bool = False,
+        background_timeout: Optional[float] = 1.0,
+        validate_responses: bool = False,
+        response_sample_rate: float = 1.0,
+        result_cache_size: int = 0,
+        result_cache_ttl: float = 60.0,
+    ) -> None:
+        for rate in (sample_rate, response_sample_rate):
+            if not 0 <= rate <= 1:
+                raise InvalidSampleRateError(
+                    f"Sample rate must be between 0 and 1, got: '{rate}'"
+                )
+
+        # The default engine already builds its validators on first use
+        if lazy and engine != FASTJSONSCHEMA_ENGINE:
+            raise UnsupportedEngine(
+                f"lazy=True requires the '{FASTJSONSCHEMA_ENGINE}' engine, "
+                f"got: '{engine}'"
+            )
+
+        self.oas_path = oas_path
+        self.base_url = base_url
+        self.engine = engine
+        self.lazy = lazy
+        self.result_key = result_key
+        self.context_attribute = context_attribute
+        self.max_body_size = max_body_size
+        self.fail_fast = fail_fast
+        self.instrumentation = instrumentation
+        self.sample_rate = sample_rate
+        # Background validation runs after the response is decided, so it only reports
+        self.shadow = shadow or background
+        self.background = background
+        self.background_timeout = background_timeout
+        self.on_violation = on_violation
+        self.validate_responses = validate_responses
+        self.response_sample_rate = response_sample_rate
+        self.result_cache: Optional[ResultCache] = None
+        if result_cache_size > 0:
+            self.result_cache = ResultCache(result_cache_size, result_cache_ttl)
+        self.pending: List[Future] = []
+        self.spec_loader = SpecLoader(
+            oas_path,
+            sidecar=sidecar,
+            validate_spec=validate_spec,
+            instrumentation=instrumentation,
+        )
+
+        if eager:
+            self.compile()
+
+    def compile(self) -> None:
+        spec = self.spec_loader.read_from_file_name()
+        unmarshaller = SpecValidator.get_unmarshaller(
+            spec,
+            self.base_url,
+            self.engine,
+            self.lazy,
+            self.fail_fast,
+            self.instrumentation,
+        )
+
+        # Build the path router now rather than on the first request
+        unmarshaller.path_finder
+
+        self.unmarshaller = unmarshaller
+        self.spec = spec
+
+    def get_spec_validator(self, event: Dict) -> SpecValidator:
+        if self.unmarshaller is None:
+            self.compile()
+
+        return SpecValidator(
+            self.oas_path,
+            event,
+            self.spec_loader,
+            get_event_parser(event, self.max_body_size),
+            unmarshaller=self.unmarshaller,
+            instrumentation=self.instrumentation,
+        )
+
+    def validate(self, event: Dict) -> RequestUnmarshalResult:
+        spec_validator = self.get_spec_validator(event)
+
+        try:
+            if self.is_sampled():
+                if self.result_cache is not None:
+                    return self.validate_with_cache(spec_validator, self.result_cache)
+
+                return spec_validator.validate_request_against_spec()
+
+            return spec_validator.check_request_against_spec()
+        except Exception as error:
+            # Events that cannot be parsed are reported too, e.g. oversized bodies
+            if not self.shadow:
+                raise
+
+            self.report(error, event)
+
+            return RequestUnmarshalResult(errors=[error])  # type: ignore
+
+    @staticmethod
+    def validate_with_cache(
+        spec_validator: SpecValidator, result_cache: ResultCache
+    ) -> RequestUnmarshalResult:
+        request, unmarshaller = spec_validator.prepare()
+
+        try:
+            path_operation = unmarshaller.find_operation(request)
+        except PathError:
+            return spec_validator.validate_request(request, unmarshaller)
+
+        key = result_cache.get_fingerprint(request, path_operation)
+        if key is None:
+            return spec_validator.validate_request(
+                request, unmarshaller, path_operation
+            )
+
+        cached = result_cache.get(key)
+        if isinstance(cached, SchemaValidationError):
+            # Known to be invalid, e.g. a client retrying the same request
+            raise cached.with_traceback(None)
+        if cached is not None:
+            return copy_result(cached)
+
+        try:
+            result = spec_validator.validate_request(
+                request, unmarshaller, path_operation
+            )
+        except SchemaValidationError as error:
+            result_cache.put(key, error)
+            raise
+
+        result_cache.put(key, result)
+
+        return copy_result(result)
+
+    @cached_property
+    def response_validator(self) -> ResponseValidator:
+        if self.unmarshaller is None:
+            self.compile()
+
+        return ResponseValidator(self.spec)  # type: ignore
+
+    def validate_response(self, event: Dict, response: Any) -> None:
+        # Only API Gateway and function URL proxy responses carry a status code
+        if not isinstance(response, dict) or "statusCode" not in response:
+            return
+
+        response_validator = self.response_validator
+        unmarshaller: APICallRequestUnmarshaller = self.unmarshaller  # type: ignore
+
+        try:
+            request = get_event_parser(event).event_to_route()
+            operation = unmarshaller.find_operation(request).operation
+        except Exception:
+            # Already rejected or reported by the request validation
+            return
+
+        try:
+            response_validator.validate(operation, response)
+        except ResponseValidationError as error:
+            if not self.shadow:
+                raise
+
+            self.report(error, event)
+
+    @cached_property
+    def executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=BACKGROUND_WORKERS, thread_name_prefix="oas-validator"
+        )
+
+    def validate_in_background(self, event: Dict) -> None:
+        spec_validator = self.get_spec_validator(event)
+
+        # Parsed here, so the handler is free to change the event meanwhile
+        try:
+            request, unmarshaller = spec_validator.prepare()
+        except Exception:
+            logger.exception("Could not parse the request for validation")
+            return
+
+        validate: Callable[..., RequestUnmarshalResult]
+        if self.is_sampled():
+            validate = spec_validator.validate_request
+        else:
+            validate = spec_validator.check_request
+
+        self.pending.append(
+            self.executor.submit(
+                self._validate_in_background, validate, request, unmarshaller, event
+            )
+        )
+
+    def _validate_in_background(
+        self,
+        validate: Callable[..., RequestUnmarshalResult],
+        request: Request,
+        unmarshaller: APICallRequestUnmarshaller,
+        event: Dict,
+    ) -> None:
+        try:
+            validate(request, unmarshaller)
+        except SchemaValidationError as error:
+            self.report(error, event)
+        except Exception:
+            logger.exception("Background validation failed")
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        pending, self.pending = self.pending, []
+        _, not_done = wait(pending, timeout=timeout)
+        if not not_done:
+            return
+
+        # Validations that have not started are dropped, running ones are left to finish
+        for future in not_done:
+            future.cancel()
+        logger.warning(
+            "Abandoned %d background validation(s) after %s seconds",
+            len(not_done),
+            timeout,
+            extra={"oas_path": self.oas_path},
+        )
+
+    def get_flush_timeout(self, context: LambdaContext) -> Optional[float]:
+        timeout = self.background_timeout
+        get_remaining_time = getattr(context, "get_remaining_time_in_millis", None)
+        if get_remaining_time is None:
+            return timeout
+
+        remaining = max(get_remaining_time() / 1000 - BACKGROUND_DEADLINE_MARGIN, 0)
+
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def validate_batch(
+        self, events: Iterable[Dict], identifiers: Optional[Iterable[str]] = None
+    ) -> BatchValidationResult:
+        if self.unmarshaller is None:
+            self.compile()
+        unmarshaller: APICallRequestUnmarshaller = self.unmarshaller  # type: ignore
+
+        records: List[BatchRecordResult] = []
+        groups: Dict[Tuple[str, str], List[BatchEntry]] = defaultdict(list)
+
+        identified: Iterable[Tuple[str, Dict]]
+        if identifiers is None:
+            identified = ((str(index), event) for index, event in enumerate(events))
+        else:
+            # A ValueError when there are more or fewer identifiers than events
+            identified = zip(identifiers, events, strict=True)
+        for identifier, event in identified:
+            record = BatchRecordResult(identifier)
+            records.append(record)
+
+            try:
+                request = get_event_parser(event, self.max_body_size).event_to_request()
+            except Exception as ex:
+                record.error = ex
+                continue
+
+            try:
+                path_operation = unmarshaller.find_operation(request)
+            except PathError as ex:
+                record.error = ErrorHandler.get_schema_validation_error(ex, request)
+                continue
+
+            operation_key = (path_operation.path_result.resolved, request.method)
+            record.operation = f"{request.method.upper()} {operation_key[0]}"
+            groups[operation_key].append((record, request, path_operation))
+
+        # Records of one operation are validated together, in a tight loop
+        for group in groups.values():
+            for record, request, path_operation in group:
+                try:
+                    record.result = SpecValidator.validate_request(
+                        request, unmarshaller, path_operation
+                    )
+                except Exception as ex:
+                    record.error = ex
+
+        return BatchValidationResult(records)
+
+    def is_sampled(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def is_response_sampled(self) -> bool:
+        if not self.validate_responses:
+            return False
+
+        return (
+            self.response_sample_rate >= 1
+            or random.random() < self.response_sample_rate
+        )
+
+    def report(self, error: Exception, event: Dict) -> None:
+        if self.on_violation is not None:
+            self.on_violation(error, event)
+            return
+
+        path = event.get("path", event.get("rawPath"))
+        kind = "Response" if isinstance(error, ResponseValidationError) else "Request"
+        if isinstance(error, SchemaValidationError):
+            message = error.validation_message
+        else:
+            message = f"{type(error).__name__}: {error}"
+        logger.warning(
+            "%s does not match the OpenAPI spec: %s",
+            kind,
+            message,
+            extra={"oas_path": self.oas_path, "path": path},
+        )
+
+    def __call__(self, handler: Callable) -> Callable:
+        @functools.wraps(handler)
+        def wrapper(event: Dict, context: LambdaContext, **kwargs: Any) -> Any:
+            if self.background:
+                self.validate_in_background(event)
+                try:
+                    response = handler(event, context, **kwargs)
+                finally:
+                    # Bounded, so a slow validation never holds the response for long
+                    self.flush(self.get_flush_timeout(context))
+            else:
+                result = self.validate(event)
+                attach_result(
+                    result, event, context, self.result_key, self.context_attribute
+                )
+                response = handler(event, context, **kwargs)
+
+            if self.is_response_sampled():
+                self.validate_response(event, response)
+
+            return response
+
+        return wrapper
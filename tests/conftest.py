@@ -8,6 +8,7 @@ import pytest
 from powertools_oas_validator.services.event_parser import EventParser
 from powertools_oas_validator.types import Request
 from tests.files.event import event
+from tests.files.event_v2 import event_v2
 
 
 @dataclass
@@ -34,6 +35,11 @@ def mock_event() -> Dict:
     return event
 
 
+@pytest.fixture
+def mock_event_v2() -> Dict:
+    return event_v2
+
+
 @pytest.fixture
 def mock_request(mock_event) -> Request:
     mock_event["body"] = {}
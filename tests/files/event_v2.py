@@ -0,0 +1,41 @@
+# flake8: noqa
+
+event_v2 = {
+    "version": "2.0",
+    "routeKey": "POST /test-path/test-endpoint",
+    "rawPath": "/test-path/test-endpoint",
+    "rawQueryString": "tag=a&tag=b&empty=",
+    "cookies": ["session=abc123", "theme=dark"],
+    "headers": {
+        "accept": "*/*",
+        "accept-encoding": "gzip, deflate",
+        "content-length": "44",
+        "content-type": "application/json",
+        "host": "app.host.com",
+        "user-agent": "python-requests/2.28.2",
+        "x-amzn-trace-id": "Root=1-64883f7e-3c9a0ba86f9b2a4b4ad6a8b9",
+        "x-forwarded-for": "203.0.113.10",
+        "x-forwarded-port": "443",
+        "x-forwarded-proto": "https",
+    },
+    "queryStringParameters": {"tag": "a,b", "empty": ""},
+    "requestContext": {
+        "accountId": "123456789012",
+        "apiId": "api-id",
+        "domainName": "app.host.com",
+        "domainPrefix": "app",
+        "http": {
+            "method": "POST",
+            "path": "/test-path/test-endpoint",
+            "protocol": "HTTP/1.1",
+            "sourceIp": "203.0.113.10",
+            "userAgent": "python-requests/2.28.2",
+        },
+        "requestId": "GKwyQjT3oAMEJXQ=",
+        "routeKey": "POST /test-path/test-endpoint",
+        "stage": "$default",
+        "time": "13/Jun/2023:08:26:42 +0000",
+        "timeEpoch": 1686644802000,
+    },
+    "isBase64Encoded": False,
+}
@@ -0,0 +1,112 @@
+from typing import Dict, Optional
+
+import pytest
+from openapi_core import Spec
+from openapi_core.templating.paths.exceptions import (
+    OperationNotFound,
+    PathNotFound,
+    PathsNotFound,
+    ServerNotFound,
+)
+from openapi_core.templating.paths.finders import APICallPathFinder
+
+from powertools_oas_validator.overrides.finders import APICallPathRouter
+
+operation = {"responses": {"200": {"description": "OK"}}}
+
+spec_dict = {
+    "openapi": "3.0.3",
+    "info": {"title": "Title", "version": "1.0.0"},
+    "servers": [{"url": "/v1"}],
+    "paths": {
+        "/users/{user_id}": {"get": operation, "delete": operation},
+        "/users/me": {"get": operation},
+        "/users/{user_id}/files/{name}.json": {"get": operation},
+        "/users/{user_id}/files/{file_id}": {"get": operation},
+        "/": {"get": operation},
+    },
+}
+
+
+@pytest.fixture
+def spec() -> Spec:
+    return Spec.from_dict(spec_dict, validator=None)
+
+
+@pytest.mark.parametrize(
+    "method, name, path_pattern, variables",
+    [
+        ("get", "https://host/v1/users/5", "/users/{user_id}", {"user_id": "5"}),
+        ("get", "https://host/v1/users/me", "/users/me", {}),
+        ("delete", "https://host/v1/users/me", "/users/{user_id}", {"user_id": "me"}),
+        (
+            "get",
+            "https://host/v1/users/5/files/a.b.json",
+            "/users/{user_id}/files/{name}.json",
+            {"user_id": "5", "name": "a.b"},
+        ),
+        (
+            "get",
+            "https://host/v1/users/5/files/7",
+            "/users/{user_id}/files/{file_id}",
+            {"user_id": "5", "file_id": "7"},
+        ),
+        ("get", "https://host/v1/", "/", {}),
+    ],
+)
+def test_find(
+    spec: Spec, method: str, name: str, path_pattern: str, variables: Dict
+) -> None:
+    result = APICallPathRouter(spec, base_url="https://host").find(method, name)
+
+    assert result.path_result.pattern == path_pattern
+    assert result.path_result.variables == variables
+    assert result == APICallPathFinder(spec, base_url="https://host").find(
+        method, name
+    )
+
+
+@pytest.mark.parametrize(
+    "resource", ["/users/{user_id}", "/users/{user_id}/files/{file_id}", None]
+)
+def test_find_by_resource(spec: Spec, resource: Optional[str]) -> None:
+    router = APICallPathRouter(spec, base_url="https://host")
+
+    result = router.find("get", "https://host/v1/users/5", resource=resource)
+
+    assert result.path_result.pattern == "/users/{user_id}"
+    assert result.path_result.variables == {"user_id": "5"}
+    assert result.server["url"] == "/v1"
+
+
+def test_find_by_resource_falls_back_on_server_mismatch(spec: Spec) -> None:
+    router = APICallPathRouter(spec, base_url="https://host")
+
+    with pytest.raises(ServerNotFound):
+        router.find("get", "https://host/v2/users/5", resource="/users/{user_id}")
+
+
+@pytest.mark.parametrize(
+    "method, name, error",
+    [
+        ("get", "https://host/v1/groups/5", PathNotFound),
+        ("post", "https://host/v1/users/5", OperationNotFound),
+        ("get", "https://host/v2/users/me", ServerNotFound),
+    ],
+)
+def test_find_on_error(spec: Spec, method: str, name: str, error: type) -> None:
+    with pytest.raises(error):
+        APICallPathRouter(spec, base_url="https://host").find(method, name)
+
+
+def test_find_without_paths() -> None:
+    spec = Spec.from_dict(
+        {
+            "openapi": "3.1.0",
+            "info": {"title": "Title", "version": "1.0.0"},
+            "webhooks": {},
+        }
+    )
+
+    with pytest.raises(PathsNotFound):
+        APICallPathRouter(spec).find("get", "https://host/users")
@@ -3,7 +3,10 @@ from unittest.mock import MagicMock
 
 import pytest
 from aws_lambda_powertools.utilities.validation.exceptions import SchemaValidationError
+from fastjsonschema import JsonSchemaValueException
 from openapi_core.casting.schemas.exceptions import CastError
+from openapi_core.templating.media_types.exceptions import MediaTypeNotFound
+from openapi_core.templating.paths.exceptions import PathNotFound
 from openapi_core.templating.security.exceptions import SecurityNotFound
 from openapi_core.validation.request.exceptions import (
     MissingRequiredRequestBody,
@@ -11,7 +14,10 @@ from openapi_core.validation.request.exceptions import (
 )
 from openapi_core.validation.schemas.exceptions import InvalidSchemaValue
 
-from powertools_oas_validator.exceptions import UnhandledValidationError
+from powertools_oas_validator.exceptions import (
+    AggregatedSchemaValidationError,
+    UnhandledValidationError,
+)
 from powertools_oas_validator.services.error_handler import ErrorHandler
 from powertools_oas_validator.services.event_parser import EventParser
 from tests.conftest import MockValidationError
@@ -74,6 +80,38 @@ def test_invalid_property_requestbody(
         )
 
 
+def test_invalid_property_compiled_requestbody(mock_event: Dict) -> None:
+    request = EventParser(mock_event).event_to_request()
+    ex = JsonSchemaValueException(
+        "data.param_3 must be integer",
+        value="not an integer",
+        name="data.param_3",
+        definition={"type": "integer"},
+        rule="type",
+    )
+
+    with pytest.raises(SchemaValidationError) as exc_info:
+        ErrorHandler.raise_schema_validation_error(ex, request)
+
+    error = exc_info.value
+    assert error.message == "data.param_3 must be integer"
+    assert error.validation_message == "data.param_3 must be integer."
+    assert error.path == [
+        "requestBody",
+        "content",
+        "application/json",
+        "schema",
+        "properties",
+        "param_3",
+    ]
+    assert error.name == (
+        "requestBody.content.application/json.schema.properties[param_3]"
+    )
+    assert error.rule == "integer"
+    assert error.rule_definition == "type"
+    assert error.value == "not an integer"
+
+
 def test_missing_required_requestBody(mock_event: Dict) -> None:
     request = EventParser(mock_event).event_to_request()
     ex = MissingRequiredRequestBody()
@@ -141,3 +179,81 @@ def test_unhandled_error(mock_event: Dict) -> None:
         ErrorHandler.raise_schema_validation_error(random_ex, request)
     except Exception as ex:
         assert type(ex) == UnhandledValidationError
+
+
+@pytest.mark.parametrize("validation_errors", [validation_errors])
+def test_aggregated_error(
+    mock_event: Dict, validation_errors: List[MagicMock]
+) -> None:
+    request = EventParser(mock_event).event_to_request()
+    body_ex = InvalidSchemaValue(
+        {"param_3": "not an integer"},  # type: ignore
+        schema_errors=validation_errors * 2,
+        type="object",
+    )
+    security_ex = SecurityNotFound([["BasicAuth"]])
+
+    with pytest.raises(AggregatedSchemaValidationError) as exc_info:
+        ErrorHandler.raise_aggregated_error([security_ex, body_ex], request)
+
+    ex = exc_info.value
+    assert isinstance(ex, SchemaValidationError)
+    assert ex.message == "3 validation error(s)"
+    assert [error.name for error in ex.errors] == [
+        "security[BasicAuth]",
+        "requestBody.content.application/json.schema.properties[param_3]",
+        "requestBody.content.application/json.schema.properties[param_3]",
+    ]
+
+
+def test_get_handler() -> None:
+    class CustomMissingRequiredRequestBody(MissingRequiredRequestBody):
+        ...
+
+    assert (
+        ErrorHandler.get_handler(CustomMissingRequiredRequestBody)
+        is ErrorHandler.get_handler(MissingRequiredRequestBody)
+        is ErrorHandler._handle_body_error
+    )
+    assert ErrorHandler.get_handler(TypeError) is None
+
+
+def test_body_name(mock_event: Dict) -> None:
+    headers = {**mock_event["headers"], "Content-Type": "application/vnd.api+json"}
+    request = EventParser({**mock_event, "headers": headers}).event_to_request()
+
+    name, path = ErrorHandler.get_body_name(request, "param_1")
+
+    assert name == (
+        "requestBody.content.application/vnd.api+json.schema.properties[param_1]"
+    )
+    assert path == name.replace("[", ".").replace("]", "").split(".")
+    assert ErrorHandler.get_body_prefix("application/vnd.api+json") is (
+        ErrorHandler.get_body_prefix("application/vnd.api+json")
+    )
+
+
+def test_path_error(mock_event: Dict) -> None:
+    request = EventParser({**mock_event, "path": "/unknown"}).event_to_request()
+
+    with pytest.raises(SchemaValidationError) as exc_info:
+        ErrorHandler.raise_schema_validation_error(
+            PathNotFound("https://app.host.com/unknown"), request
+        )
+
+    assert exc_info.value.message == "'POST /unknown' is not an operation of the spec"
+    assert exc_info.value.path == ["paths"]
+
+
+def test_media_type_error(mock_event: Dict) -> None:
+    request = EventParser(mock_event).event_to_request()
+
+    with pytest.raises(SchemaValidationError) as exc_info:
+        ErrorHandler.raise_schema_validation_error(
+            MediaTypeNotFound("text/plain", ["application/json"]), request
+        )
+
+    assert exc_info.value.message == (
+        "'text/plain' is not one of ['application/json'] content types"
+    )
+    assert exc_info.value.value == "text/plain"
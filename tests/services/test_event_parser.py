@@ -1,11 +1,19 @@
 from typing import Any, Dict
+from unittest.mock import patch
 
 import pytest
 from openapi_core.datatypes import RequestParameters
-from werkzeug.datastructures import Headers, ImmutableMultiDict
 
-from powertools_oas_validator.exceptions import InvalidEventError
-from powertools_oas_validator.services.event_parser import EventParser
+from powertools_oas_validator.datastructures import HeadersView, MultiDictView
+from powertools_oas_validator.exceptions import (
+    InvalidEventError,
+    RequestBodyTooLargeError,
+)
+from powertools_oas_validator.services.event_parser import (
+    EventParser,
+    HttpApiEventParser,
+    get_event_parser,
+)
 
 function_event_result = [
     ("get_path", {"path": "test_path"}, "test_path"),
@@ -15,6 +23,8 @@ function_event_result = [
         "test proto://Host",
     ),
     ("get_method", {"httpMethod": "POST"}, "post"),
+    ("get_resource", {"resource": "/path/{id}"}, "/path/{id}"),
+    ("get_resource", {}, None),
     ("get_mimetype", {"headers": {"Content-Type": "test mimetype"}}, "test mimetype"),
     (
         "get_full_url_pattern",
@@ -32,14 +42,15 @@ function_event_result = [
             "pathParameters": {"path": "parameter"},
         },
         RequestParameters(
-            query=ImmutableMultiDict({"query": "param"}),
-            header=Headers({"test": "header"}),
-            cookie=ImmutableMultiDict({}),
+            query=MultiDictView({"query": "param"}),
+            header=HeadersView({"test": "header"}),
+            cookie=MultiDictView(),
             path={"path": "parameter"},
         ),
     ),
-    ("get_body", {"body": {"test": "body"}}, '{"test": "body"}'),
+    ("get_body", {"body": {"test": "body"}}, {"test": "body"}),
     ("get_body", {"body": '{"test": "body"}'}, '{"test": "body"}'),
+    ("get_body", {"body": None}, ""),
 ]
 
 
@@ -82,3 +93,158 @@ def test_mandatory_getters_on_error(
     else:
         with pytest.raises(result):  # type: ignore
             getattr(event_parser, function)()
+
+
+http_api_function_event_result = [
+    ("get_path", {"rawPath": "/items/1"}, "/items/1"),
+    ("get_resource", {"routeKey": "GET /items/{id}"}, "/items/{id}"),
+    ("get_resource", {"routeKey": "$default"}, None),
+    ("get_resource", {}, None),
+    (
+        "get_host_url",
+        {"headers": {"x-forwarded-proto": "http", "host": "Host"}},
+        "http://Host",
+    ),
+    (
+        "get_host_url",
+        {"headers": {}, "requestContext": {"domainName": "id.lambda-url.aws"}},
+        "https://id.lambda-url.aws",
+    ),
+    ("get_method", {"requestContext": {"http": {"method": "POST"}}}, "post"),
+    ("get_mimetype", {"headers": {"content-type": "test mimetype"}}, "test mimetype"),
+    (
+        "get_full_url_pattern",
+        {"headers": {"host": "Host"}, "rawPath": "/path"},
+        "https://Host/path",
+    ),
+    (
+        "get_parameters",
+        {
+            "headers": {"test": "header"},
+            "rawQueryString": "query=a&query=b&empty=",
+            "queryStringParameters": {"query": "a,b", "empty": ""},
+            "cookies": ["session=abc", " theme=dark"],
+            "pathParameters": {"path": "parameter"},
+        },
+        RequestParameters(
+            query=MultiDictView(lists={"query": ["a", "b"], "empty": [""]}),
+            header=HeadersView({"test": "header"}),
+            cookie=MultiDictView({"session": "abc", "theme": "dark"}),
+            path={"path": "parameter"},
+        ),
+    ),
+    (
+        "get_parameters",
+        {"headers": {}, "queryStringParameters": {"query": "param"}},
+        RequestParameters(
+            query=MultiDictView({"query": "param"}),
+            header=HeadersView({}),
+            cookie=MultiDictView(),
+            path={},
+        ),
+    ),
+    ("get_body", {"body": '{"test": "body"}'}, '{"test": "body"}'),
+]
+
+
+@pytest.mark.parametrize("function, event, result", http_api_function_event_result)
+def test_http_api_getters(function: str, event: Dict, result: Any) -> None:
+    event_parser = HttpApiEventParser(event)
+
+    assert result == getattr(event_parser, function)()
+
+
+http_api_function_event_result = [
+    ("get_path", {}, InvalidEventError),
+    ("get_method", {"requestContext": {}}, InvalidEventError),
+    ("get_mimetype", {"headers": {}}, InvalidEventError),
+    ("get_host_url", {"headers": {}}, InvalidEventError),
+    ("get_parameters", {}, InvalidEventError),
+]
+
+
+@pytest.mark.parametrize("function, event, result", http_api_function_event_result)
+def test_http_api_mandatory_getters_on_error(
+    function: str, event: Dict, result: Exception
+) -> None:
+    event_parser = HttpApiEventParser(event)
+
+    with pytest.raises(result):  # type: ignore
+        getattr(event_parser, function)()
+
+
+def test_http_api_event_to_request(mock_event_v2: Dict) -> None:
+    request = HttpApiEventParser(mock_event_v2).event_to_request()
+
+    assert request.host_url == "https://app.host.com"
+    assert request.path == "/test-path/test-endpoint"
+    assert request.method == "post"
+    assert request.mimetype == "application/json"
+    assert request.resource == "/test-path/test-endpoint"
+    assert request.parameters.query.getlist("tag") == ["a", "b"]
+    assert request.parameters.cookie["session"] == "abc123"
+
+
+@pytest.mark.parametrize(
+    "event, parser_class",
+    [
+        ({"version": "2.0"}, HttpApiEventParser),
+        ({"rawPath": "/path"}, HttpApiEventParser),
+        ({"version": "1.0", "path": "/path"}, EventParser),
+        ({"path": "/path"}, EventParser),
+    ],
+)
+def test_get_event_parser(event: Dict, parser_class: type) -> None:
+    assert type(get_event_parser(event)) is parser_class
+
+
+@pytest.mark.parametrize(
+    "event, result",
+    [
+        ({"body": "eyJhIjogMX0=", "isBase64Encoded": True}, b'{"a": 1}'),
+        ({"body": b"AAEC", "isBase64Encoded": True}, b"\x00\x01\x02"),
+        ({"body": "eyJhIjogMX0=", "isBase64Encoded": False}, "eyJhIjogMX0="),
+    ],
+)
+def test_get_base64_body(event: Dict, result: Any) -> None:
+    assert EventParser(event).get_body() == result
+
+
+def test_get_invalid_base64_body() -> None:
+    parser = EventParser({"body": "AAE", "isBase64Encoded": True})
+
+    with pytest.raises(InvalidEventError):
+        parser.get_body()
+
+
+@pytest.mark.parametrize(
+    "event, max_body_size, too_large",
+    [
+        ({"body": "12345"}, 5, False),
+        ({"body": "123456"}, 5, True),
+        ({"body": "ééé"}, 6, False),
+        ({"body": "éééé"}, 6, True),
+        ({"body": b"123456"}, 5, True),
+        ({"body": {"a": 1}}, 1, False),
+        ({"body": "AAECAw==", "isBase64Encoded": True}, 4, False),
+        ({"body": "AAECAwQ=", "isBase64Encoded": True}, 4, True),
+    ],
+)
+def test_max_body_size(event: Dict, max_body_size: int, too_large: bool) -> None:
+    parser = EventParser(event, max_body_size)
+
+    if too_large:
+        with pytest.raises(RequestBodyTooLargeError):
+            parser.get_body()
+    else:
+        parser.get_body()
+
+
+def test_max_body_size_checked_before_decoding() -> None:
+    parser = EventParser({"body": "AAEC" * 4, "isBase64Encoded": True}, 3)
+
+    with patch.object(EventParser, "decode_base64") as decode_mock:
+        with pytest.raises(RequestBodyTooLargeError):
+            parser.get_body()
+
+    decode_mock.assert_not_called()
@@ -0,0 +1,80 @@
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+from unittest.mock import MagicMock
+
+import pytest
+from aws_lambda_powertools.metrics import MetricUnit
+
+from powertools_oas_validator.services.instrumentation import (
+    NOOP_PHASE,
+    NoopInstrumentation,
+    PowertoolsInstrumentation,
+)
+from powertools_oas_validator.validator import OASValidator
+
+oas_path = os.getcwd() + "/tests/files/oas-valid.yaml"
+
+
+class RecordingInstrumentation:
+    def __init__(self) -> None:
+        self.phases: List[str] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self.phases.append(name)
+        yield
+
+
+def test_validator_phases(mock_event: Dict, tmp_path: Path) -> None:
+    instrumented_oas_path = str(tmp_path / "oas.yaml")
+    shutil.copy(oas_path, instrumented_oas_path)
+    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+    instrumentation = RecordingInstrumentation()
+    validator = OASValidator(instrumented_oas_path, instrumentation=instrumentation)
+
+    validator.validate(mock_event)
+    validator.validate(mock_event)
+
+    request_phases = ["event_parse", "operation_lookup", "security", "parameters"]
+    assert instrumentation.phases == [
+        "spec_load",
+        *request_phases,
+        "body",
+        *request_phases,
+        "body",
+    ]
+
+
+def test_noop_instrumentation() -> None:
+    assert NoopInstrumentation().phase("body") is NOOP_PHASE
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_powertools_instrumentation(fail: bool) -> None:
+    metrics = MagicMock()
+    tracer = MagicMock()
+    instrumentation = PowertoolsInstrumentation(metrics=metrics, tracer=tracer)
+
+    with pytest.raises(ValueError) if fail else NOOP_PHASE:
+        with instrumentation.phase("body"):
+            if fail:
+                raise ValueError
+
+    tracer.provider.in_subsegment.assert_called_once_with("## OASValidator.body")
+    metrics.add_metric.assert_called_once()
+    assert metrics.add_metric.call_args.kwargs["name"] == "OASValidator.body"
+    assert metrics.add_metric.call_args.kwargs["unit"] == MetricUnit.Milliseconds
+    assert metrics.add_metric.call_args.kwargs["value"] >= 0
+
+
+def test_powertools_instrumentation_without_tracer() -> None:
+    metrics = MagicMock()
+
+    with PowertoolsInstrumentation(metrics=metrics).phase("security"):
+        pass
+
+    assert metrics.add_metric.call_args.kwargs["name"] == "OASValidator.security"
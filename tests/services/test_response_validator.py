@@ -0,0 +1,171 @@
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from openapi_core import Spec
+
+from powertools_oas_validator.exceptions import ResponseValidationError
+from powertools_oas_validator.services.response_validator import ResponseValidator
+from powertools_oas_validator.validator import OASValidator
+
+RESPONSES_SPEC = """
+openapi: 3.0.3
+info:
+  title: Items
+  version: "1.0.0"
+paths:
+  /items:
+    get:
+      responses:
+        "200":
+          description: OK
+          content:
+            application/json:
+              schema:
+                type: object
+                required: [id]
+                properties:
+                  id:
+                    type: integer
+                    readOnly: true
+                  secret:
+                    type: string
+                    writeOnly: true
+                  password:
+                    $ref: "#/components/schemas/Password"
+                  count:
+                    type: integer
+                    maximum: 100
+                    exclusiveMaximum: true
+            text/plain:
+              schema:
+                type: string
+        "2XX":
+          description: Other successes
+        "404":
+          description: Not found
+          content:
+            application/json:
+              schema:
+                $ref: "#/components/schemas/Error"
+  /errors:
+    get:
+      responses:
+        default:
+          description: Error
+          content:
+            application/*:
+              schema:
+                $ref: "#/components/schemas/Error"
+components:
+  schemas:
+    Password:
+      type: string
+      writeOnly: true
+    Error:
+      type: object
+      required: [message]
+      properties:
+        message:
+          type: string
+"""
+
+
+@pytest.fixture
+def spec(tmp_path: Path) -> Spec:
+    oas_path = tmp_path / "oas.yaml"
+    oas_path.write_text(RESPONSES_SPEC)
+
+    return OASValidator(str(oas_path), eager=True).spec  # type: ignore
+
+
+def make_response(status: int, body: Any, mimetype: str = "application/json") -> Dict:
+    return {
+        "statusCode": status,
+        "headers": {"Content-Type": mimetype},
+        "body": body if isinstance(body, str) else json.dumps(body),
+    }
+
+
+@pytest.mark.parametrize(
+    "path, response",
+    [
+        ("/items", make_response(200, {"id": 1})),
+        ("/items", make_response(200, {"id": 1, "count": 50})),
+        ("/items", make_response(200, {"id": 1}, "application/json; charset=utf-8")),
+        ("/items", make_response(200, "anything", "text/plain")),
+        ("/items", make_response(201, "anything", "text/plain")),
+        ("/items", make_response(404, {"message": "Not found"})),
+        ("/items", {"statusCode": 200, "body": json.dumps({"id": 1})}),
+        ("/items", {"statusCode": 200, "body": None}),
+        ("/items", {**make_response(200, "AP/+"), "isBase64Encoded": True}),
+        (
+            "/errors",
+            make_response(500, {"message": "Oops"}, "application/problem+json"),
+        ),
+    ],
+)
+def test_valid_response(spec: Spec, path: str, response: Dict) -> None:
+    ResponseValidator(spec).validate(spec / "paths" / path / "get", response)
+
+
+@pytest.mark.parametrize(
+    "path, response, name",
+    [
+        (
+            "/items",
+            make_response(200, {"id": "1"}),
+            "responses.200.content.application/json.schema.properties[id]",
+        ),
+        (
+            "/items",
+            make_response(200, {"id": 1, "secret": "s"}),
+            "responses.200.content.application/json.schema.properties[secret]",
+        ),
+        (
+            "/items",
+            make_response(200, {"id": 1, "password": "p"}),
+            "responses.200.content.application/json.schema.properties[password]",
+        ),
+        (
+            "/items",
+            make_response(404, {}),
+            "responses.404.content.application/json.schema.properties[]",
+        ),
+        (
+            "/errors",
+            make_response(500, {}, "application/problem+json"),
+            "responses.default.content.application/*.schema.properties[]",
+        ),
+        ("/items", make_response(500, {}), "responses"),
+        (
+            "/items",
+            {"statusCode": 200, "body": "OK"},
+            "responses.200.content.application/json",
+        ),
+        (
+            "/items",
+            make_response(200, {"id": 1, "count": 100}),
+            "responses.200.content.application/json.schema.properties[count]",
+        ),
+        ("/items", make_response(200, "<p/>", "text/html"), "responses.200.content"),
+    ],
+)
+def test_invalid_response(spec: Spec, path: str, response: Dict, name: str) -> None:
+    with pytest.raises(ResponseValidationError) as exc_info:
+        ResponseValidator(spec).validate(spec / "paths" / path / "get", response)
+
+    assert exc_info.value.name == name
+
+
+def test_schemas_are_compiled_once(spec: Spec) -> None:
+    response_validator = ResponseValidator(spec)
+    operation = spec / "paths" / "/items" / "get"
+
+    response_validator.validate(operation, make_response(200, {"id": 1}))
+    compiled = dict(response_validator.schemas)
+    response_validator.validate(operation, make_response(200, {"id": 2}))
+
+    assert list(compiled) == [("/items", "get", "200", "application/json")]
+    assert response_validator.schemas == compiled
@@ -0,0 +1,184 @@
+from pathlib import Path
+from typing import Dict
+from unittest.mock import patch
+
+import pytest
+from openapi_core.templating.paths.datatypes import PathOperationServer
+
+from powertools_oas_validator.services.event_parser import EventParser
+from powertools_oas_validator.services.result_cache import ResultCache
+from powertools_oas_validator.validator import OASValidator
+
+ITEMS_SPEC = """
+openapi: 3.0.3
+info:
+  title: Items
+  version: "1.0.0"
+security:
+  - bearer: []
+paths:
+  /items/{id}:
+    parameters:
+      - name: id
+        in: path
+        required: true
+        schema:
+          type: string
+    get:
+      parameters:
+        - name: verbose
+          in: query
+          schema:
+            type: boolean
+        - name: filter
+          in: query
+          style: deepObject
+          schema:
+            type: object
+      security:
+        - apiKey: []
+      responses:
+        "200":
+          description: OK
+  /health:
+    get:
+      responses:
+        "200":
+          description: OK
+components:
+  securitySchemes:
+    bearer:
+      type: http
+      scheme: bearer
+    apiKey:
+      type: apiKey
+      in: header
+      name: X-Api-Key
+"""
+
+
+def find_operation(tmp_path: Path, event: Dict) -> PathOperationServer:
+    oas_path = tmp_path / "oas.yaml"
+    oas_path.write_text(ITEMS_SPEC)
+    validator = OASValidator(str(oas_path), eager=True)
+
+    request = EventParser(event).event_to_request()
+
+    return validator.unmarshaller.find_operation(request)  # type: ignore
+
+
+def make_event(mock_event: Dict, path: str, **update: Dict) -> Dict:
+    return {
+        **mock_event,
+        "httpMethod": "GET",
+        "path": path,
+        "resource": None,
+        "body": None,
+        **update,
+    }
+
+
+def test_get_and_put() -> None:
+    cache = ResultCache(maxsize=2)
+
+    assert cache.get(("a",)) is None
+    cache.put(("a",), 1)
+    cache.put(("b",), 2)
+    assert cache.get(("a",)) == 1
+    cache.put(("c",), 3)
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == 1
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_ttl() -> None:
+    cache = ResultCache(ttl=10)
+
+    with patch("powertools_oas_validator.services.result_cache.time") as time_mock:
+        time_mock.monotonic.return_value = 100
+        cache.put(("a",), 1)
+        time_mock.monotonic.return_value = 109
+        assert cache.get(("a",)) == 1
+        time_mock.monotonic.return_value = 110
+        assert cache.get(("a",)) is None
+
+    assert len(cache) == 0
+
+
+def test_declared_parameters(mock_event: Dict, tmp_path: Path) -> None:
+    path_operation = find_operation(tmp_path, make_event(mock_event, "/items/1"))
+
+    assert ResultCache().get_declared_parameters(path_operation) == (
+        ("header", "X-Api-Key"),
+        ("query", "verbose"),
+        ("query", None),
+    )
+
+    path_operation = find_operation(tmp_path, make_event(mock_event, "/health"))
+
+    assert ResultCache().get_declared_parameters(path_operation) == (
+        ("header", "Authorization"),
+    )
+
+
+@pytest.mark.parametrize(
+    "update, same",
+    [
+        ({"headers": {"User-Agent": "curl"}}, True),
+        ({"multiValueQueryStringParameters": {"verbose": ["true"]}}, False),
+        ({"multiValueQueryStringParameters": {"filter[a]": ["1"]}}, False),
+        ({"path": "/items/2"}, False),
+        ({"body": "{}"}, False),
+        ({"headers": {"X-Api-Key": "key"}}, False),
+    ],
+)
+def test_fingerprint(
+    mock_event: Dict, tmp_path: Path, update: Dict, same: bool
+) -> None:
+    headers = {**mock_event["headers"], "X-Api-Key": "secret"}
+    event = make_event(mock_event, "/items/1", headers=headers)
+    other_event = {**event, **update}
+    if "headers" in update:
+        other_event["headers"] = {**headers, **update["headers"]}
+    cache = ResultCache()
+
+    fingerprints = []
+    for each in (event, other_event):
+        path_operation = find_operation(tmp_path, each)
+        request = EventParser(each).event_to_request()
+        fingerprints.append(cache.get_fingerprint(request, path_operation))
+
+    assert (fingerprints[0] == fingerprints[1]) is same
+
+
+def test_colliding_bodies_are_not_shared(mock_event: Dict, tmp_path: Path) -> None:
+    class CollidingBody(str):
+        def __hash__(self) -> int:
+            return 0
+
+    cache = ResultCache()
+    for body in ('{"a": 1}', '{"b": 2}'):
+        event = make_event(mock_event, "/health", body=CollidingBody(body))
+        path_operation = find_operation(tmp_path, event)
+        request = EventParser(event).event_to_request()
+        key = cache.get_fingerprint(request, path_operation)
+        assert cache.get(key) is None  # type: ignore
+        cache.put(key, body)  # type: ignore
+
+    assert len(cache) == 2
+
+
+def test_decoded_bodies_are_not_fingerprinted(
+    mock_event: Dict, tmp_path: Path
+) -> None:
+    event = make_event(mock_event, "/health", body={"decoded": True})
+    path_operation = find_operation(tmp_path, event)
+    request = EventParser(event).event_to_request()
+
+    assert ResultCache().get_fingerprint(request, path_operation) is None
@@ -0,0 +1,265 @@
+import os
+from typing import Any
+
+import pytest
+from fastjsonschema import JsonSchemaValueException
+from openapi_core import Spec
+
+from powertools_oas_validator.exceptions import UnsupportedOpenAPIVersion
+from powertools_oas_validator.services.schema_compiler import (
+    BodyValidators,
+    SchemaCompiler,
+)
+
+spec_dict = {
+    "openapi": "3.0.3",
+    "info": {"title": "Title", "version": "1.0.0"},
+    "paths": {},
+    "components": {
+        "schemas": {
+            "Pet": {
+                "type": "object",
+                "required": ["id", "name"],
+                "properties": {
+                    "id": {"type": "integer", "format": "int64", "readOnly": True},
+                    "name": {"type": "string"},
+                    "tag": {"type": "string", "nullable": True},
+                    "kind": {
+                        "type": "string",
+                        "enum": ["cat", "dog"],
+                        "nullable": True,
+                    },
+                    "password": {"type": "string", "writeOnly": True},
+                    "ownerId": {"$ref": "#/components/schemas/Id"},
+                    "breederId": {
+                        "allOf": [{"$ref": "#/components/schemas/Id"}],
+                        "description": "Who bred the pet",
+                    },
+                    "parentId": {"$ref": "#/components/schemas/Id", "nullable": True},
+                    "token": {"$ref": "#/components/schemas/Token"},
+                },
+            },
+            "Id": {"type": "integer", "readOnly": True},
+            "Token": {"$ref": "#/components/schemas/Secret"},
+            "Secret": {"type": "string", "writeOnly": True},
+            "Node": {
+                "type": "object",
+                "properties": {"next": {"$ref": "#/components/schemas/Node"}},
+            },
+        }
+    },
+}
+
+
+@pytest.fixture
+def spec() -> Spec:
+    return Spec.from_dict(spec_dict, validator=None)
+
+
+def compile_schema(spec: Spec, schema: Any, write: bool = True) -> Any:
+    compiler = SchemaCompiler(spec, write=write)
+
+    return compiler.load(compiler.compile_to_code(schema))
+
+
+def test_translate_nullable(spec: Spec) -> None:
+    compiler = SchemaCompiler(spec)
+
+    assert compiler.translate({"type": "string", "nullable": True}) == {
+        "type": ["string", "null"]
+    }
+    assert compiler.translate({"enum": ["a"], "type": "string", "nullable": True}) == {
+        "enum": ["a", None],
+        "type": ["string", "null"],
+    }
+    assert compiler.translate({"$ref": "#/a", "nullable": True}) == {
+        "anyOf": [{"type": "null"}, {"$ref": "#/a"}]
+    }
+
+
+def test_translate_exclusive_bounds(spec: Spec) -> None:
+    compiler = SchemaCompiler(spec)
+
+    assert compiler.translate({"maximum": 100, "exclusiveMaximum": True}) == {
+        "exclusiveMaximum": 100
+    }
+    assert compiler.translate({"minimum": 0, "exclusiveMinimum": True}) == {
+        "exclusiveMinimum": 0
+    }
+    assert compiler.translate({"maximum": 100, "exclusiveMaximum": False}) == {
+        "maximum": 100
+    }
+    # OpenAPI 3.1 bounds are numbers already
+    assert compiler.translate({"exclusiveMaximum": 100}) == {"exclusiveMaximum": 100}
+
+
+@pytest.mark.parametrize(
+    "data, valid",
+    [(50, True), (0, False), (1, True), (99, True), (100, False)],
+)
+def test_compile_exclusive_bounds(spec: Spec, data: Any, valid: bool) -> None:
+    validate = compile_schema(
+        spec,
+        {
+            "type": "integer",
+            "minimum": 0,
+            "exclusiveMinimum": True,
+            "maximum": 100,
+            "exclusiveMaximum": True,
+        },
+    )
+
+    if valid:
+        assert validate(data) == data
+    else:
+        with pytest.raises(JsonSchemaValueException):
+            validate(data)
+
+
+@pytest.mark.parametrize(
+    "data, valid",
+    [
+        ({"name": "Rex"}, True),
+        ({"name": "Rex", "tag": None, "kind": None}, True),
+        ({"name": "Rex", "password": "secret", "token": "secret"}, True),
+        ({"name": "Rex", "id": 1}, False),
+        ({"name": "Rex", "ownerId": 1}, False),
+        ({"name": "Rex", "breederId": 1}, False),
+        ({"name": "Rex", "parentId": 1}, False),
+        ({"name": "Rex", "kind": "bird"}, False),
+        ({"tag": "good boy"}, False),
+    ],
+)
+def test_compile_request_schema(spec: Spec, data: Any, valid: bool) -> None:
+    validate = compile_schema(spec, {"$ref": "#/components/schemas/Pet"})
+
+    if valid:
+        assert validate(data) == data
+    else:
+        with pytest.raises(JsonSchemaValueException):
+            validate(data)
+
+
+@pytest.mark.parametrize(
+    "data, valid",
+    [
+        ({"id": 1, "name": "Rex", "ownerId": 1, "breederId": 1}, True),
+        ({"name": "Rex"}, False),
+        ({"id": 1, "name": "Rex", "password": "secret"}, False),
+        ({"id": 1, "name": "Rex", "token": "secret"}, False),
+    ],
+)
+def test_compile_response_schema(spec: Spec, data: Any, valid: bool) -> None:
+    validate = compile_schema(spec, {"$ref": "#/components/schemas/Pet"}, write=False)
+
+    if valid:
+        assert validate(data) == data
+    else:
+        with pytest.raises(JsonSchemaValueException):
+            validate(data)
+
+
+def test_compile_recursive_schema(spec: Spec) -> None:
+    validate = compile_schema(spec, {"$ref": "#/components/schemas/Node"})
+
+    assert validate({"next": {"next": {}}}) == {"next": {"next": {}}}
+
+
+def test_compile_unknown_format(spec: Spec) -> None:
+    validate = compile_schema(spec, {"type": "string", "format": "binary"})
+
+    assert validate("data") == "data"
+
+
+def test_body_validators() -> None:
+    spec = Spec.from_file_path(os.getcwd() + "/tests/files/oas-valid.yaml")
+    operation = spec / "paths" / "/test-path/test-endpoint" / "post"
+
+    body_validators = BodyValidators(spec)
+    validate, required = body_validators.get(operation, "application/json")
+
+    assert required is True
+    assert validate({"param_1": "Param 1", "param_2": "Param 2"})
+    assert body_validators.get(operation, "application/xml") is None
+
+    with pytest.raises(JsonSchemaValueException):
+        validate({"param_1": "Param 1"})
+
+
+def test_body_validators_skips_uncompilable_schemas() -> None:
+    spec = Spec.from_dict(
+        {
+            **spec_dict,
+            "paths": {
+                "/pets": {
+                    "post": {
+                        "requestBody": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "properties": {
+                                            "pet": {"$ref": "https://host/pet.json"}
+                                        }
+                                    }
+                                }
+                            }
+                        },
+                        "responses": {},
+                    }
+                }
+            },
+        },
+        validator=None,
+    )
+
+    assert BodyValidators(spec).validators == {}
+
+
+def test_body_validators_lazy() -> None:
+    spec = Spec.from_file_path(os.getcwd() + "/tests/files/oas-valid.yaml")
+    operation = spec / "paths" / "/test-path/test-endpoint" / "post"
+
+    body_validators = BodyValidators(spec, lazy=True)
+
+    assert body_validators.validators == {}
+
+    validate, required = body_validators.get(operation, "application/json")
+
+    assert required is True
+    assert body_validators.operations == {("/test-path/test-endpoint", "post")}
+    assert body_validators.get(operation, "application/json") == (validate, required)
+    assert list(body_validators.code) == [
+        ("/test-path/test-endpoint", "post", "application/json")
+    ]
+
+
+def test_openapi_31_is_not_compiled() -> None:
+    spec = Spec.from_dict(
+        {
+            **spec_dict,
+            "openapi": "3.1.0",
+            "paths": {
+                "/pets": {
+                    "post": {
+                        "requestBody": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {"unevaluatedProperties": False}
+                                }
+                            }
+                        },
+                    }
+                }
+            },
+        },
+        validator=None,
+    )
+    operation = spec / "paths" / "/pets" / "post"
+
+    with pytest.raises(UnsupportedOpenAPIVersion):
+        SchemaCompiler(spec).compile_to_code({"unevaluatedProperties": False})
+
+    for lazy in (False, True):
+        body_validators = BodyValidators(spec, lazy=lazy)
+        assert body_validators.get(operation, "application/json") is None
+        assert body_validators.validators == {}
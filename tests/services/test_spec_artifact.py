@@ -0,0 +1,91 @@
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from powertools_oas_validator.services.schema_compiler import BodyValidators
+from powertools_oas_validator.services.spec_artifact import (
+    ARTIFACT_VERSION,
+    SpecArtifact,
+)
+from powertools_oas_validator.services.spec_loader import SpecLoader
+
+BODY_KEY = ("/test-path/test-endpoint", "post", "application/json")
+
+
+@pytest.fixture
+def oas_path(tmp_path: Path) -> str:
+    path = tmp_path / "oas.yaml"
+    shutil.copy("tests/files/oas-valid.yaml", path)
+
+    return str(path)
+
+
+def test_compile(oas_path: str) -> None:
+    artifact = SpecArtifact.compile(oas_path)
+
+    assert artifact.version == ARTIFACT_VERSION
+    assert artifact.source_hash == SpecArtifact.hash_file(oas_path)
+    assert artifact.spec["openapi"].startswith("3.")
+    assert list(artifact.body_validators) == [BODY_KEY]
+
+
+def test_dump_and_load_for(oas_path: str) -> None:
+    artifact = SpecArtifact.compile(oas_path)
+    artifact.dump(SpecArtifact.get_path(oas_path))
+
+    assert SpecArtifact.get_path(oas_path) == oas_path + ".pickle"
+    assert SpecArtifact.load_for(oas_path) == artifact
+
+
+def test_load_for_missing(oas_path: str) -> None:
+    assert SpecArtifact.load_for(oas_path) is None
+
+
+def test_load_for_stale(oas_path: str) -> None:
+    SpecArtifact.compile(oas_path).dump(SpecArtifact.get_path(oas_path))
+
+    with open(oas_path, "a") as oas_file:
+        oas_file.write("\n# changed\n")
+
+    assert SpecArtifact.load_for(oas_path) is None
+
+
+def test_load_for_other_version(oas_path: str) -> None:
+    artifact = SpecArtifact.compile(oas_path)
+    artifact.version = ARTIFACT_VERSION + 1
+    artifact.dump(SpecArtifact.get_path(oas_path))
+
+    assert SpecArtifact.load_for(oas_path) is None
+
+
+def test_load_for_not_an_artifact(oas_path: str) -> None:
+    with open(SpecArtifact.get_path(oas_path), "wb") as artifact_file:
+        pickle.dump({"spec": {}}, artifact_file)
+
+    assert SpecArtifact.load_for(oas_path) is None
+
+
+@pytest.mark.parametrize("content", [b"garbage", b"", b"\x80\x05\x95"])
+def test_load_for_corrupt(
+    oas_path: str, content: bytes, caplog: pytest.LogCaptureFixture
+) -> None:
+    with open(SpecArtifact.get_path(oas_path), "wb") as artifact_file:
+        artifact_file.write(content)
+
+    with caplog.at_level("WARNING"):
+        assert SpecArtifact.load_for(oas_path) is None
+
+    assert "Could not load the spec artifact" in caplog.text
+
+
+def test_body_validators_from_artifact(oas_path: str) -> None:
+    artifact = SpecArtifact.compile(oas_path)
+    spec = SpecLoader(oas_path).load(oas_path)
+
+    body_validators = BodyValidators(spec, compiled=artifact.body_validators)
+
+    assert body_validators.code == {BODY_KEY: artifact.body_validators[BODY_KEY][0]}
+    assert body_validators.required == {BODY_KEY: artifact.body_validators[BODY_KEY][1]}
+    assert BODY_KEY in body_validators.validators
@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from powertools_oas_validator.services.spec_cache import SpecCache
+
+
+@pytest.fixture
+def spec_file(tmp_path: Path) -> str:
+    path = tmp_path / "oas.yaml"
+    path.write_text("openapi: 3.0.3")
+
+    return str(path)
+
+
+def test_get_or_load_caches(spec_file: str) -> None:
+    cache = SpecCache()
+    load = MagicMock(return_value="spec")
+
+    assert cache.get_or_load(spec_file, load) == "spec"
+    assert cache.get_or_load(spec_file, load) == "spec"
+
+    load.assert_called_once_with(spec_file)
+    assert spec_file in cache
+
+
+def test_get_or_load_by_variant(spec_file: str) -> None:
+    cache = SpecCache()
+    load = MagicMock(side_effect=["never", "always"])
+
+    assert cache.get_or_load(spec_file, load, variant="never") == "never"
+    assert cache.get_or_load(spec_file, load, variant="always") == "always"
+    assert cache.get_or_load(spec_file, load, variant="never") == "never"
+
+    cache.invalidate(spec_file)
+    assert spec_file not in cache
+
+
+def test_get_or_load_reloads_on_change(spec_file: str) -> None:
+    cache = SpecCache()
+    load = MagicMock(side_effect=["old", "new"])
+
+    assert cache.get_or_load(spec_file, load) == "old"
+
+    Path(spec_file).write_text("openapi: 3.1.0")
+    stat = os.stat(spec_file)
+    os.utime(spec_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.get_or_load(spec_file, load) == "new"
+    assert load.call_count == 2
+
+
+def test_get_or_load_evicts_least_recently_used(tmp_path: Path) -> None:
+    paths = []
+    for name in ["a", "b", "c"]:
+        path = tmp_path / f"{name}.yaml"
+        path.write_text("openapi: 3.0.3")
+        paths.append(str(path))
+
+    cache = SpecCache(maxsize=2)
+    load = MagicMock(side_effect=lambda path: path)
+
+    cache.get_or_load(paths[0], load)
+    cache.get_or_load(paths[1], load)
+    cache.get_or_load(paths[0], load)
+    cache.get_or_load(paths[2], load)
+
+    assert len(cache) == 2
+    assert paths[0] in cache
+    assert paths[1] not in cache
+
+
+def test_invalidate(spec_file: str) -> None:
+    cache = SpecCache()
+    load = MagicMock(return_value="spec")
+
+    cache.get_or_load(spec_file, load)
+    cache.invalidate(spec_file)
+    cache.get_or_load(spec_file, load)
+
+    assert load.call_count == 2
+
+    cache.invalidate()
+
+    assert len(cache) == 0
+
+
+def test_get_or_load_file_not_exists() -> None:
+    with pytest.raises(FileNotFoundError):
+        SpecCache().get_or_load("file-not-exist.yaml", MagicMock())
@@ -1,24 +1,80 @@
+import shutil
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from openapi_core import Spec
+from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
 
 from powertools_oas_validator.exceptions import (
     FileNotExistsError,
     NotSupportedFileTypeError,
+    UnsupportedValidateSpecMode,
+)
+from powertools_oas_validator.services.spec_artifact import SpecArtifact, get_artifact
+from powertools_oas_validator.services.spec_loader import (
+    VALIDATE_SPEC_ALWAYS,
+    SpecLoader,
 )
-from powertools_oas_validator.services.spec_loader import SpecLoader
 
 
-@patch("powertools_oas_validator.services.spec_loader.Spec")
+@pytest.fixture
+def invalid_oas_path(tmp_path: Path) -> str:
+    oas_path = str(tmp_path / "oas.yaml")
+    shutil.copy("tests/files/oas-invalid.yaml", oas_path)
+
+    return oas_path
+
+
+@patch("powertools_oas_validator.services.spec_loader.spec_cache")
 @patch("powertools_oas_validator.services.spec_loader.os")
-def test_read_from_file_name(os_mock: MagicMock, spec_mock: MagicMock) -> None:
-    spec_mock.from_file_path = MagicMock()
+def test_read_from_file_name(os_mock: MagicMock, spec_cache_mock: MagicMock) -> None:
     os_mock.path = MagicMock()
     os_mock.path.isfile = MagicMock(return_value=True)
 
-    SpecLoader(".yaml").read_from_file_name()
+    loader = SpecLoader(".yaml")
+    loader.read_from_file_name()
+
+    spec_cache_mock.get_or_load.assert_called_once_with(
+        ".yaml", loader.load, variant=VALIDATE_SPEC_ALWAYS
+    )
+
+
+@patch("powertools_oas_validator.services.spec_loader.SpecReader")
+@patch("powertools_oas_validator.services.spec_loader.SpecArtifact")
+@patch("powertools_oas_validator.services.spec_loader.Spec")
+def test_load_without_artifact(
+    spec_mock: MagicMock, spec_artifact_mock: MagicMock, spec_reader_mock: MagicMock
+) -> None:
+    spec_artifact_mock.load_for = MagicMock(return_value=None)
+    spec_reader_mock.return_value.loader = "yaml-libyaml"
+
+    loader = SpecLoader(".yaml", sidecar=True)
+    spec = loader.load(".yaml")
 
-    spec_mock.from_file_path.assert_called_once_with(".yaml")
+    assert spec == spec_mock.from_dict.return_value
+    assert loader.loader == "yaml-libyaml"
+    spec_reader_mock.assert_called_once_with(".yaml", sidecar=True)
+    spec_mock.from_dict.assert_called_once_with(
+        spec_reader_mock.return_value.read.return_value,
+        spec_url=SpecLoader.get_spec_url(".yaml"),
+    )
+
+
+def test_load_with_artifact(tmp_path: Path) -> None:
+    oas_path = str(tmp_path / "oas.yaml")
+    shutil.copy("tests/files/oas-valid.yaml", oas_path)
+    artifact = SpecArtifact.compile(oas_path)
+    artifact.dump(SpecArtifact.get_path(oas_path))
+
+    with patch.object(Spec, "from_file_path") as from_file_path_mock:
+        loader = SpecLoader(oas_path)
+        spec = loader.load(oas_path)
+
+    from_file_path_mock.assert_not_called()
+    assert loader.loader == "artifact"
+    assert get_artifact(spec) == artifact
+    assert spec.accessor.lookup == artifact.spec
 
 
 @patch("powertools_oas_validator.services.spec_loader.os")
@@ -50,3 +106,60 @@ def test_validate_file_not_supported(os_mock: MagicMock) -> None:
 
     with pytest.raises(NotSupportedFileTypeError):
         SpecLoader(".filenotsupported").validate_file()
+
+
+def test_load_validate_spec_always(invalid_oas_path: str) -> None:
+    with pytest.raises(OpenAPIValidationError):
+        SpecLoader(invalid_oas_path).load(invalid_oas_path)
+
+
+def test_load_validate_spec_never(invalid_oas_path: str) -> None:
+    loader = SpecLoader(invalid_oas_path, validate_spec="never")
+
+    assert loader.load(invalid_oas_path)["openapi"]
+    assert SpecLoader.read_stamp(invalid_oas_path) is None
+
+
+def test_cached_spec_is_validated_for_stricter_mode(invalid_oas_path: str) -> None:
+    SpecLoader(invalid_oas_path, validate_spec="never").read_from_file_name()
+
+    with pytest.raises(OpenAPIValidationError):
+        SpecLoader(invalid_oas_path).read_from_file_name()
+
+
+def test_load_validate_spec_stamp(tmp_path: Path) -> None:
+    oas_path = str(tmp_path / "oas.yaml")
+    shutil.copy("tests/files/oas-valid.yaml", oas_path)
+    loader = SpecLoader(oas_path, validate_spec="stamp")
+
+    loader.load(oas_path)
+
+    assert SpecLoader.read_stamp(oas_path) == SpecArtifact.hash_file(oas_path)
+
+
+def test_load_validate_spec_stamp_matches(invalid_oas_path: str) -> None:
+    SpecLoader.write_stamp(invalid_oas_path, SpecArtifact.hash_file(invalid_oas_path))
+
+    SpecLoader(invalid_oas_path, validate_spec="stamp").load(invalid_oas_path)
+
+
+def test_load_validate_spec_stamp_mismatch(invalid_oas_path: str) -> None:
+    SpecLoader.write_stamp(invalid_oas_path, "outdated")
+
+    with pytest.raises(OpenAPIValidationError):
+        SpecLoader(invalid_oas_path, validate_spec="stamp").load(invalid_oas_path)
+
+    assert SpecLoader.read_stamp(invalid_oas_path) == "outdated"
+
+
+def test_write_stamp_not_writable(tmp_path: Path) -> None:
+    oas_path = str(tmp_path / "missing" / "oas.yaml")
+
+    SpecLoader.write_stamp(oas_path, "hash")
+
+    assert SpecLoader.read_stamp(oas_path) is None
+
+
+def test_unsupported_validate_spec_mode() -> None:
+    with pytest.raises(UnsupportedValidateSpecMode):
+        SpecLoader(".yaml", validate_spec="sometimes")
@@ -0,0 +1,94 @@
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from powertools_oas_validator.services.spec_reader import (
+    JSON_LOADER,
+    YAML_LOADER,
+    SpecReader,
+)
+
+SPEC_YAML = """
+openapi: 3.0.3
+info:
+  title: Test
+  version: 2023-01-01
+paths:
+  /items:
+    get:
+      responses:
+        200:
+          description: OK
+"""
+
+
+@pytest.fixture
+def yaml_path(tmp_path: Path) -> str:
+    path = tmp_path / "oas.yaml"
+    path.write_text(SPEC_YAML)
+
+    return str(path)
+
+
+def test_read_yaml(yaml_path: str) -> None:
+    reader = SpecReader(yaml_path)
+
+    data = reader.read()
+
+    assert reader.loader == YAML_LOADER
+    assert data["info"]["version"] == "2023-01-01"
+    assert data["paths"]["/items"]["get"]["responses"] == {"200": {"description": "OK"}}
+    assert not os.path.exists(SpecReader.get_sidecar_path(yaml_path))
+
+
+def test_read_json(yaml_path: str, tmp_path: Path) -> None:
+    json_path = tmp_path / "oas.json"
+    json_path.write_text(json.dumps(SpecReader(yaml_path).read()))
+    reader = SpecReader(str(json_path))
+
+    assert reader.read() == SpecReader(yaml_path).read()
+    assert reader.loader == JSON_LOADER
+
+
+def test_read_sidecar(yaml_path: str) -> None:
+    reader = SpecReader(yaml_path, sidecar=True)
+
+    data = reader.read()
+
+    assert reader.loader == YAML_LOADER
+    assert os.path.exists(SpecReader.get_sidecar_path(yaml_path))
+
+    assert reader.read() == data
+    assert reader.loader == f"{JSON_LOADER}-sidecar"
+
+
+def test_read_stale_sidecar(yaml_path: str) -> None:
+    sidecar_path = SpecReader.get_sidecar_path(yaml_path)
+    Path(sidecar_path).write_text("{}")
+    stat = os.stat(yaml_path)
+    os.utime(sidecar_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000))
+    reader = SpecReader(yaml_path, sidecar=True)
+
+    data = reader.read()
+
+    assert reader.loader == YAML_LOADER
+    assert data["openapi"] == "3.0.3"
+    assert json.loads(Path(sidecar_path).read_text()) == data
+
+
+@patch("powertools_oas_validator.services.spec_reader.os.replace")
+def test_write_sidecar_not_writable(replace_mock: MagicMock, yaml_path: str) -> None:
+    replace_mock.side_effect = PermissionError
+    reader = SpecReader(yaml_path, sidecar=True)
+
+    assert reader.read()["openapi"] == "3.0.3"
+    assert os.listdir(os.path.dirname(yaml_path)) == ["oas.yaml"]
+
+
+def test_stringify_keys() -> None:
+    data = {200: [{True: None, 1.5: "a"}], "null": {None: 1}}
+
+    assert SpecReader.stringify_keys(data) == json.loads(json.dumps(data))
@@ -3,19 +3,32 @@ from unittest.mock import MagicMock, patch
 import pytest
 from aws_lambda_powertools.utilities.validation.exceptions import SchemaValidationError
 from jsonschema.exceptions import ValidationError
+from openapi_core.casting.schemas.exceptions import CastError
+from openapi_core.unmarshalling.request.datatypes import RequestUnmarshalResult
 from openapi_core.validation.schemas.exceptions import InvalidSchemaValue
 
-from powertools_oas_validator.overrides.unmarshallers import V30RequestUnmarshaller
-from powertools_oas_validator.services.spec_validator import SpecValidator
+from powertools_oas_validator.exceptions import UnsupportedOpenAPIVersion
+from powertools_oas_validator.overrides.unmarshallers import (
+    V30RequestUnmarshaller,
+    V31RequestUnmarshaller,
+)
+from powertools_oas_validator.services.spec_validator import (
+    SpecValidator,
+    UnmarshallerCache,
+    marshaller_map,
+)
 
 
-@patch("powertools_oas_validator.services.spec_validator.validate_request")
-def test_validate_request_against_spec(mock_validate_request: MagicMock) -> None:
+def get_spec_mock(version: str = "3.0.0") -> MagicMock:
     spec_mock = MagicMock()
 
     spec_mock.accessor = MagicMock()
-    spec_mock.accessor.lookup = {"openapi": "3.0.0"}
+    spec_mock.accessor.lookup = {"openapi": version}
 
+    return spec_mock
+
+
+def get_spec_validator(spec_mock: MagicMock, **kwargs) -> SpecValidator:
     mock_loader = MagicMock()
     mock_loader.read_from_file_name = MagicMock(return_value=spec_mock)
 
@@ -25,22 +38,33 @@ def test_validate_request_against_spec(mock_validate_request: MagicMock) -> None
     mock_parser = MagicMock()
     mock_parser.event_to_request = MagicMock(return_value=mock_request)
 
-    spec_validator = SpecValidator("", {}, mock_loader, mock_parser)
+    return SpecValidator("", {}, mock_loader, mock_parser, **kwargs)
 
-    spec_validator.validate_request_against_spec()
 
-    mock_validate_request.assert_called_once_with(
-        mock_request,
-        spec=spec_mock,
-        base_url="host_url",
-        cls=V30RequestUnmarshaller,
+@patch.dict(
+    "powertools_oas_validator.services.spec_validator.marshaller_map",
+    {"3.0": MagicMock()},
+)
+def test_validate_request_against_spec() -> None:
+    spec_mock = get_spec_mock()
+    spec_validator = get_spec_validator(spec_mock)
+    unmarshal_result = RequestUnmarshalResult(errors=[], body={"test": "body"})
+    marshaller_map["3.0"].return_value.unmarshal.return_value = unmarshal_result
+
+    assert spec_validator.validate_request_against_spec() is unmarshal_result
+
+    mock_request = spec_validator.event_parser.event_to_request()
+    marshaller_map["3.0"].assert_called_once_with(spec_mock, base_url="host_url")
+    marshaller_map["3.0"].return_value.unmarshal.assert_called_once_with(
+        mock_request
     )
 
 
-@patch("powertools_oas_validator.services.spec_validator.validate_request")
-def test_validate_request_against_spec_on_error(
-    mock_validate_request: MagicMock,
-) -> None:
+@patch.dict(
+    "powertools_oas_validator.services.spec_validator.marshaller_map",
+    {"3.0": MagicMock()},
+)
+def test_validate_request_against_spec_on_error() -> None:
     expected_error = InvalidSchemaValue(
         "",
         schema_errors=[
@@ -50,29 +74,92 @@ def test_validate_request_against_spec_on_error(
         ],
         type=MagicMock(),
     )
-    mock_validate_request.side_effect = [expected_error]
-    spec_mock = MagicMock()
+    marshaller_map["3.0"].return_value.unmarshal.return_value = RequestUnmarshalResult(
+        errors=[expected_error]
+    )
 
-    spec_mock.accessor = MagicMock()
-    spec_mock.accessor.lookup = {"openapi": "3.0.0"}
+    spec_validator = get_spec_validator(get_spec_mock())
 
-    mock_loader = MagicMock()
-    mock_loader.read_from_file_name = MagicMock(return_value=spec_mock)
+    with pytest.raises(SchemaValidationError):
+        spec_validator.validate_request_against_spec()
 
-    mock_request = MagicMock()
-    mock_request.host_url = "host_url"
 
-    mock_parser = MagicMock()
-    mock_parser.event_to_request = MagicMock(return_value=mock_request)
+@patch.dict(
+    "powertools_oas_validator.services.spec_validator.marshaller_map",
+    {"3.0": MagicMock()},
+)
+def test_validate_request_against_spec_on_raised_error() -> None:
+    marshaller_map["3.0"].return_value.unmarshal.side_effect = CastError(
+        "not an integer", "integer"
+    )
 
-    spec_validator = SpecValidator("", {}, mock_loader, mock_parser)
+    spec_validator = get_spec_validator(get_spec_mock())
 
     with pytest.raises(SchemaValidationError):
         spec_validator.validate_request_against_spec()
 
-    mock_validate_request.assert_called_once_with(
-        mock_request,
-        spec=spec_mock,
-        base_url="host_url",
-        cls=V30RequestUnmarshaller,
-    )
+
+def test_validate_request_against_spec_with_unmarshaller() -> None:
+    spec_mock = get_spec_mock()
+    unmarshaller = MagicMock()
+    unmarshaller.spec = spec_mock
+    unmarshaller.unmarshal.return_value = RequestUnmarshalResult(errors=[])
+
+    spec_validator = get_spec_validator(spec_mock, unmarshaller=unmarshaller)
+    spec_validator.validate_request_against_spec()
+
+    spec_validator.spec_loader.read_from_file_name.assert_not_called()
+    unmarshaller.unmarshal.assert_called_once()
+    assert spec_validator.spec is spec_mock
+
+
+@pytest.mark.parametrize(
+    "version, result",
+    [("3.0.3", V30RequestUnmarshaller), ("3.1.0", V31RequestUnmarshaller)],
+)
+def test_get_unmarshaller_class(version: str, result: type) -> None:
+    assert SpecValidator.get_unmarshaller_class(get_spec_mock(version)) is result
+
+
+def test_get_unmarshaller_class_unsupported_version() -> None:
+    with pytest.raises(UnsupportedOpenAPIVersion):
+        SpecValidator.get_unmarshaller_class(get_spec_mock("2.0.0"))
+
+
+@patch.dict(
+    "powertools_oas_validator.services.spec_validator.marshaller_map",
+    {"3.0": MagicMock()},
+)
+def test_validate_request_against_spec_reuses_unmarshaller() -> None:
+    spec_mock = get_spec_mock()
+
+    unmarshaller_mock = marshaller_map["3.0"].return_value
+    unmarshaller_mock.unmarshal.return_value = RequestUnmarshalResult(errors=[])
+
+    get_spec_validator(spec_mock).validate_request_against_spec()
+    get_spec_validator(spec_mock).validate_request_against_spec()
+
+    marshaller_map["3.0"].assert_called_once_with(spec_mock, base_url="host_url")
+    assert unmarshaller_mock.unmarshal.call_count == 2
+
+
+@patch.dict(
+    "powertools_oas_validator.services.spec_validator.marshaller_map",
+    {"3.0": MagicMock(side_effect=lambda spec, base_url: MagicMock())},
+)
+def test_unmarshaller_cache() -> None:
+    cache = UnmarshallerCache(maxsize=2)
+    spec_mock = get_spec_mock()
+    other_spec_mock = get_spec_mock()
+
+    unmarshaller = cache.get_or_create(spec_mock, None)
+
+    assert cache.get_or_create(spec_mock, None) is unmarshaller
+    assert cache.get_or_create(spec_mock, "base_url") is not unmarshaller
+    assert cache.get_or_create(other_spec_mock, None) is not unmarshaller
+    assert len(cache) == 2
+    assert cache.get_or_create(spec_mock, None) is not unmarshaller
+
+    cache.clear()
+
+    assert len(cache) == 0
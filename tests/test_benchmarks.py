@@ -0,0 +1,37 @@
+import json
+from pathlib import Path
+
+from benchmarks.run import main, run
+
+
+def test_run() -> None:
+    report = run([2, 3], iterations=2, cold_iterations=1, warmup=0)
+
+    groups = {result["group"] for result in report["results"]}
+    assert groups == {"cold_load", "warm", "rejection", "scaling"}
+    assert all(result["iterations"] > 0 for result in report["results"])
+
+
+def test_main_writes_json(tmp_path: Path) -> None:
+    output = tmp_path / "results.json"
+
+    assert (
+        main(
+            [
+                "--sizes",
+                "2",
+                "--iterations",
+                "1",
+                "--cold-iterations",
+                "1",
+                "--warmup",
+                "0",
+                "--output",
+                str(output),
+            ]
+        )
+        == 0
+    )
+
+    report = json.loads(output.read_text())
+    assert [result["name"] for result in report["results"]][:1] == ["paths=2"]
@@ -0,0 +1,85 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from powertools_oas_validator import bulk
+from powertools_oas_validator.bulk import (
+    BulkValidator,
+    init_worker,
+    iter_chunks,
+    iter_lines,
+    validate_chunk,
+    validate_lines,
+)
+
+oas_path = os.getcwd() + "/tests/files/oas-valid.yaml"
+OPERATION = "POST /test-path/test-endpoint"
+
+
+def make_events(mock_event: Dict) -> List[Dict]:
+    valid_event = {
+        **mock_event,
+        "body": json.dumps({"param_1": "Param 1", "param_2": "Param 2"}),
+    }
+    invalid_event = {**mock_event, "body": json.dumps({"param_1": "Param 1"})}
+
+    return [valid_event, invalid_event, {"body": "{}"}] * 3
+
+
+def test_validate_chunk(mock_event: Dict) -> None:
+    init_worker(oas_path, {"fail_fast": False})
+
+    summary = validate_chunk(make_events(mock_event))
+
+    assert summary.total == 9
+    assert summary.failed == 6
+    assert summary.operations == {OPERATION: 6, "unknown": 3}
+    assert summary.errors == {
+        (OPERATION, "AggregatedSchemaValidationError"): 3,
+        ("unknown", "InvalidEventError"): 3,
+    }
+
+
+def test_validate_chunk_without_worker(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bulk, "worker_validator", None)
+
+    with pytest.raises(RuntimeError):
+        validate_chunk([])
+
+
+def test_iter_chunks() -> None:
+    assert list(iter_chunks(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]  # type: ignore
+
+
+def test_validate_file(mock_event: Dict, tmp_path: Path) -> None:
+    events_path = tmp_path / "events.jsonl"
+    lines = [json.dumps(event) for event in make_events(mock_event)]
+    events_path.write_text("\n".join([*lines, "", "not json", "{"]) + "\n\n")
+
+    assert len(list(iter_lines(str(events_path)))) == 11
+
+    summary = BulkValidator(oas_path, workers=2, chunk_size=2).validate_file(
+        str(events_path)
+    )
+
+    assert summary.total == 11
+    assert summary.failed == 8
+    assert summary.errors == {
+        (OPERATION, "SchemaValidationError"): 3,
+        ("unknown", "InvalidEventError"): 3,
+        ("unknown", "InvalidJSONLine"): 2,
+    }
+
+
+def test_validate_lines(mock_event: Dict) -> None:
+    init_worker(oas_path, {})
+    lines = [json.dumps(event).encode() for event in make_events(mock_event)[:2]]
+
+    summary = validate_lines([*lines, b"not json"])
+
+    assert summary.total == 3
+    assert summary.failed == 2
+    assert summary.operations == {OPERATION: 2, "unknown": 1}
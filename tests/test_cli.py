@@ -0,0 +1,94 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+
+from powertools_oas_validator.cli import main
+from powertools_oas_validator.replay import LatencyHistogram
+from powertools_oas_validator.services.spec_artifact import SpecArtifact
+from powertools_oas_validator.services.spec_loader import SpecLoader
+
+oas_path = os.getcwd() + "/tests/files/oas-valid.yaml"
+
+
+def test_compile(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    oas_path = str(tmp_path / "oas.yaml")
+    shutil.copy("tests/files/oas-valid.yaml", oas_path)
+
+    assert main(["compile", oas_path]) == 0
+
+    assert SpecArtifact.load_for(oas_path) is not None
+    assert SpecArtifact.get_path(oas_path) in capsys.readouterr().out
+
+
+def test_no_command() -> None:
+    with pytest.raises(SystemExit):
+        main([])
+
+
+def test_stamp(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    oas_path = str(tmp_path / "oas.yaml")
+    shutil.copy("tests/files/oas-valid.yaml", oas_path)
+
+    assert main(["stamp", oas_path]) == 0
+
+    assert SpecLoader.read_stamp(oas_path) == SpecArtifact.hash_file(oas_path)
+    assert SpecLoader.get_stamp_path(oas_path) in capsys.readouterr().out
+
+
+def test_stamp_invalid_spec(tmp_path: Path) -> None:
+    oas_path = str(tmp_path / "oas.yaml")
+    shutil.copy("tests/files/oas-invalid.yaml", oas_path)
+
+    with pytest.raises(OpenAPIValidationError):
+        main(["stamp", oas_path])
+
+    assert SpecLoader.read_stamp(oas_path) is None
+
+
+def test_replay(
+    mock_event: Dict, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    valid_body = {"param_1": "Param 1", "param_2": "Param 2"}
+    events = [
+        {**mock_event, "body": json.dumps(valid_body)},
+        {**mock_event, "body": json.dumps({"param_1": "Param 1"})},
+        {**mock_event, "path": "/unknown"},
+        {"body": "{}"},
+    ]
+    events_path = tmp_path / "events.jsonl"
+    events_path.write_text(
+        "\n".join([*(json.dumps(event) for event in events), "", "not json"])
+    )
+
+    assert main(["replay", str(events_path), "--spec", oas_path]) == 0
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["events"] == 5
+    assert summary["failed"] == 4
+    body_name = "requestBody.content.application/json.schema.properties[]"
+    assert set(summary["errors"]) == {
+        f"SchemaValidationError: {body_name}",
+        "SchemaValidationError: paths",
+        "InvalidEventError",
+        "InvalidJSONLine",
+    }
+    assert summary["latency_us"]["p50"] <= summary["latency_us"]["max"]
+    assert summary["throughput_per_s"] > 0
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram()
+    for duration_ns in range(1000, 101000, 1000):
+        histogram.add(duration_ns)
+
+    assert histogram.count == 100
+    assert histogram.percentile(50) == pytest.approx(50000, rel=0.05)
+    assert histogram.percentile(99) == pytest.approx(99000, rel=0.05)
+    assert histogram.percentile(100) == 100000
+    assert histogram.summary()["min"] == 1.0
+    assert LatencyHistogram().percentile(50) == 0.0
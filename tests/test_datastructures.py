@@ -0,0 +1,63 @@
+import pytest
+
+from powertools_oas_validator.datastructures import HeadersView, MultiDictView
+
+
+def test_multi_dict_view() -> None:
+    view = MultiDictView({"a": "2", "b": "3"}, {"a": ["1", "2"]})
+
+    assert view["a"] == "2"
+    assert "b" in view
+    assert "c" not in view
+    assert view.getlist("a") == ["1", "2"]
+    assert view.getlist("b") == ["3"]
+    assert view.getlist("c") == []
+    assert dict(view) == {"a": "2", "b": "3"}
+    assert len(view) == 2
+    assert repr(view) == "MultiDictView({'a': '2', 'b': '3'})"
+
+    with pytest.raises(KeyError):
+        view["c"]
+
+
+def test_multi_dict_view_lists() -> None:
+    view = MultiDictView(lists={"a": ["1", "2"]})
+
+    assert view["a"] == "1"
+    assert view.getlist("a") == ["1", "2"]
+    assert list(view) == ["a"]
+
+
+def test_multi_dict_view_empty() -> None:
+    view = MultiDictView(None, None)
+
+    assert len(view) == 0
+    assert view == {}
+
+
+def test_multi_dict_view_is_a_view() -> None:
+    values = {"a": "1"}
+    view = MultiDictView(values)
+
+    values["b"] = "2"
+
+    assert view["b"] == "2"
+
+
+def test_headers_view() -> None:
+    view = HeadersView(
+        {"Content-Type": "application/json", "X-Tags": "a"},
+        {"X-Tags": ["a", "b"]},
+    )
+
+    assert view["Content-Type"] == "application/json"
+    assert view["content-type"] == "application/json"
+    assert "CONTENT-TYPE" in view
+    assert "Accept" not in view
+    assert view.get("accept") is None
+    assert view.getlist("x-tags") == ["a", "b"]
+    assert view.getlist("content-type") == ["application/json"]
+    assert view.getlist("accept") == []
+
+    with pytest.raises(KeyError):
+        view["Accept"]
@@ -11,8 +11,10 @@ from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
 from powertools_oas_validator.exceptions import (
     FileNotExistsError,
     NotSupportedFileTypeError,
+    ResponseValidationError,
 )
 from powertools_oas_validator.middleware import validate_request
+from powertools_oas_validator.validator import VALIDATED_BODY_KEY
 
 app = APIGatewayRestResolver()
 
@@ -27,6 +29,37 @@ def dummy_handler_valid_body(event: Dict, context: LambdaContext) -> None:
     app.resolve(event, context)
 
 
+result_app = APIGatewayRestResolver()
+
+
+@result_app.post("/test-path/test-endpoint")
+def dummy_post_func() -> Dict:
+    return result_app.current_event["validatedRequest"].body
+
+
+@validate_request(
+    oas_path=os.getcwd() + "/tests/files/oas-valid.yaml",
+    result_key="validatedRequest",
+    context_attribute="validated_request",
+)
+def dummy_handler_with_result(event: Dict, context: LambdaContext) -> Dict:
+    return result_app.resolve(event, context)
+
+
+@validate_request(
+    oas_path=os.getcwd() + "/tests/files/oas-valid.yaml", background=True
+)
+def dummy_handler_background(event: Dict, context: LambdaContext) -> str:
+    return "response"
+
+
+@validate_request(
+    oas_path=os.getcwd() + "/tests/files/oas-valid.yaml", validate_responses=True
+)
+def dummy_handler_invalid_response(event: Dict, context: LambdaContext) -> Dict:
+    return {"statusCode": 200, "body": json.dumps({"message": 1})}
+
+
 @validate_request(oas_path=os.getcwd() + "/tests/files/oas-invalid.yaml")
 def dummy_handler_invalid(event: Dict, context: LambdaContext) -> None:
     app.resolve(event, context)
@@ -44,10 +77,46 @@ def dummy_handler_file_not_exist(event: Dict, context: LambdaContext) -> None:
 
 def test_validate_oas_on_succes(mock_event: Dict) -> None:
     context = MagicMock()
-    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+    body = {"param_1": "Param 1", "param_2": "Param 2"}
+    mock_event["body"] = json.dumps(body)
 
     dummy_handler_valid_body(mock_event, context)
 
+    assert mock_event[VALIDATED_BODY_KEY] == body
+
+
+def test_validate_oas_exposes_result(mock_event: Dict) -> None:
+    context = MagicMock()
+    body = {"param_1": "Param 1", "param_2": "Param 2"}
+    mock_event["body"] = json.dumps(body)
+
+    response = dummy_handler_with_result(mock_event, context)
+
+    assert json.loads(response["body"]) == body
+    assert context.validated_request is mock_event["validatedRequest"]
+
+
+def test_validate_oas_in_background(
+    mock_event: Dict, caplog: pytest.LogCaptureFixture
+) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1"})
+    mock_event.pop(VALIDATED_BODY_KEY, None)
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = 3000
+
+    with caplog.at_level("WARNING"):
+        assert dummy_handler_background(mock_event, context) == "response"
+
+    assert "'param_2' is a required property." in caplog.text
+    assert VALIDATED_BODY_KEY not in mock_event
+
+
+def test_validate_oas_passes_options_on(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+
+    with pytest.raises(ResponseValidationError):
+        dummy_handler_invalid_response(mock_event, MagicMock())
+
 
 def test_validate_oas_on_invalid_oas() -> None:
     event = {"path": "/endpoint", "httpMethod": "GET"}
@@ -0,0 +1,30 @@
+import math
+
+import pytest
+
+from powertools_oas_validator.serializers import json_dumps, json_loads
+
+
+@pytest.mark.parametrize(
+    "content, result",
+    [
+        ('{"key": [1, "value"]}', {"key": [1, "value"]}),
+        (b'{"key": null}', {"key": None}),
+        ("18446744073709551616", 18446744073709551616),
+    ],
+)
+def test_json_loads(content: str, result: object) -> None:
+    assert json_loads(content) == result
+
+
+def test_json_loads_nan() -> None:
+    assert math.isnan(json_loads("NaN"))
+
+
+def test_json_loads_invalid() -> None:
+    with pytest.raises(ValueError):
+        json_loads("{invalid")
+
+
+def test_json_dumps() -> None:
+    assert json_loads(json_dumps({"key": [1, "value"]})) == {"key": [1, "value"]}
@@ -4,7 +4,12 @@ from typing import Dict
 from openapi_core.datatypes import RequestParameters
 
 from powertools_oas_validator.services.event_parser import EventParser
-from powertools_oas_validator.types import OpenAPIVersion, Request
+from powertools_oas_validator.types import (
+    BatchRecordResult,
+    BatchValidationResult,
+    OpenAPIVersion,
+    Request,
+)
 
 
 def test_open_api_version() -> None:
@@ -21,4 +26,21 @@ def test_request(mock_event: Dict) -> None:
     assert request.host_url == "https://app.host.com"
     assert request.path == "/test-path/test-endpoint"
     assert request.mimetype == "application/json"
+    assert request.resource == "/test-endpoint"
     assert type(request.parameters) == RequestParameters
+
+
+def test_batch_validation_result() -> None:
+    error = ValueError("invalid")
+    result = BatchValidationResult(
+        [
+            BatchRecordResult("1"),
+            BatchRecordResult("2", error=error),
+            BatchRecordResult("3", error=error),
+        ]
+    )
+
+    assert [record.identifier for record in result.failures] == ["2", "3"]
+    assert result.to_batch_response() == {
+        "batchItemFailures": [{"itemIdentifier": "2"}, {"itemIdentifier": "3"}]
+    }
@@ -0,0 +1,991 @@
+import json
+import os
+import shutil
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from aws_lambda_powertools.utilities.validation.exceptions import SchemaValidationError
+from openapi_core.unmarshalling.request.datatypes import RequestUnmarshalResult
+
+from powertools_oas_validator.exceptions import (
+    AggregatedSchemaValidationError,
+    InvalidEventError,
+    InvalidSampleRateError,
+    RequestBodyTooLargeError,
+    ResponseValidationError,
+    UnhandledValidationError,
+    UnsupportedEngine,
+)
+from powertools_oas_validator.overrides.unmarshallers import (
+    APICallRequestUnmarshaller,
+    V30RequestUnmarshaller,
+)
+from powertools_oas_validator.services.spec_artifact import SpecArtifact
+from powertools_oas_validator.services.spec_validator import SpecValidator
+from powertools_oas_validator.validator import VALIDATED_BODY_KEY, OASValidator
+
+oas_path = os.getcwd() + "/tests/files/oas-valid.yaml"
+
+
+def test_eager_compile() -> None:
+    validator = OASValidator(oas_path, eager=True)
+
+    assert type(validator.unmarshaller) is V30RequestUnmarshaller
+    assert validator.unmarshaller.spec is validator.spec
+
+
+def test_lazy_compile() -> None:
+    validator = OASValidator(oas_path)
+
+    assert validator.unmarshaller is None
+
+
+@patch.object(OASValidator, "compile")
+def test_validate_compiles_once(compile_mock: MagicMock) -> None:
+    validator = OASValidator(oas_path)
+    validator.unmarshaller = MagicMock()
+
+    with patch("powertools_oas_validator.validator.SpecValidator"):
+        validator.validate({})
+
+    compile_mock.assert_not_called()
+
+
+def test_decorator(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+    handler = MagicMock(return_value="response")
+
+    validated_handler = OASValidator(oas_path, eager=True)(handler)
+
+    assert validated_handler(mock_event, "context") == "response"
+    handler.assert_called_once_with(mock_event, "context")
+
+
+@pytest.mark.parametrize(
+    "body, valid",
+    [
+        ({"param_1": "Param 1", "param_2": "Param 2"}, True),
+        ({"param_1": "Param 1"}, False),
+    ],
+)
+def test_http_api_event(mock_event_v2: Dict, body: Dict, valid: bool) -> None:
+    mock_event_v2["body"] = json.dumps(body)
+    validator = OASValidator(oas_path, eager=True)
+
+    if valid:
+        validator.validate(mock_event_v2)
+    else:
+        with pytest.raises(SchemaValidationError):
+            validator.validate(mock_event_v2)
+
+
+PARAMETERS_SPEC = """
+openapi: 3.0.3
+info:
+  title: Parameters
+  version: "1.0.0"
+paths:
+  /items:
+    get:
+      parameters:
+        - name: X-Request-Id
+          in: header
+          required: true
+          schema:
+            type: string
+        - name: tag
+          in: query
+          schema:
+            type: array
+            items:
+              type: integer
+      security:
+        - ApiKey: []
+      responses:
+        "200":
+          description: OK
+components:
+  securitySchemes:
+    ApiKey:
+      type: apiKey
+      in: header
+      name: X-Api-Key
+"""
+
+
+@pytest.mark.parametrize(
+    "headers, query, valid",
+    [
+        ({"x-request-id": "1", "x-api-key": "key"}, ["1", "2"], True),
+        ({"x-request-id": "1", "x-api-key": "key"}, ["1", "a"], False),
+        ({"x-request-id": "1"}, [], False),
+        ({"x-api-key": "key"}, [], False),
+    ],
+)
+def test_parameters(
+    mock_event: Dict, tmp_path: Path, headers: Dict, query: List, valid: bool
+) -> None:
+    parameters_oas_path = tmp_path / "oas.yaml"
+    parameters_oas_path.write_text(PARAMETERS_SPEC)
+    event = {
+        **mock_event,
+        "path": "/items",
+        "httpMethod": "GET",
+        "headers": {**mock_event["headers"], **headers},
+        "queryStringParameters": {"tag": query[-1]} if query else None,
+        "multiValueQueryStringParameters": {"tag": query} if query else None,
+        "body": None,
+    }
+    validator = OASValidator(str(parameters_oas_path), eager=True)
+
+    if valid:
+        validator.validate(event)
+    else:
+        with pytest.raises(SchemaValidationError):
+            validator.validate(event)
+
+
+def test_all_errors_parameters(mock_event: Dict, tmp_path: Path) -> None:
+    parameters_oas_path = tmp_path / "oas.yaml"
+    parameters_oas_path.write_text(PARAMETERS_SPEC)
+    event = {
+        **mock_event,
+        "path": "/items",
+        "httpMethod": "GET",
+        "queryStringParameters": {"tag": "a"},
+        "multiValueQueryStringParameters": {"tag": ["a"]},
+        "body": None,
+    }
+    validator = OASValidator(str(parameters_oas_path), fail_fast=False)
+
+    with pytest.raises(AggregatedSchemaValidationError) as exc_info:
+        validator.validate(event)
+
+    assert len(exc_info.value.errors) == 3
+    assert exc_info.value.errors[0].name == "security[ApiKey]"
+    assert exc_info.value.errors[1].name == "parameters[X-Request-Id]"
+
+    with pytest.raises(SchemaValidationError) as exc_info:
+        OASValidator(str(parameters_oas_path)).validate(event)
+
+    assert type(exc_info.value) is SchemaValidationError
+
+
+@pytest.mark.parametrize(
+    "body, messages",
+    [
+        (
+            {"param_3": "3"},
+            [
+                "'param_1' is a required property",
+                "'param_2' is a required property",
+                "'3' is not of type 'integer'",
+            ],
+        ),
+        ({"param_1": "Param 1", "param_2": 2}, ["2 is not of type 'string'"]),
+    ],
+)
+def test_all_errors_body(mock_event: Dict, body: Dict, messages: List[str]) -> None:
+    mock_event["body"] = body
+    validator = OASValidator(oas_path, fail_fast=False)
+
+    with pytest.raises(AggregatedSchemaValidationError) as exc_info:
+        validator.validate(mock_event)
+
+    assert sorted(error.message for error in exc_info.value.errors) == sorted(messages)
+
+
+@pytest.mark.parametrize("engine", ["openapi-core", "fastjsonschema"])
+@pytest.mark.parametrize(
+    "body, valid",
+    [
+        ({"param_1": "Param 1", "param_2": "Param 2"}, True),
+        ('{"param_1": "Param 1", "param_2": "Param 2"}', True),
+        ({}, False),
+        ({"param_1": "Param 1"}, False),
+    ],
+)
+def test_validate_returns_decoded_body(
+    mock_event: Dict, engine: str, body: Any, valid: bool
+) -> None:
+    mock_event["body"] = body
+    validator = OASValidator(oas_path, eager=True, engine=engine)
+
+    if valid:
+        assert validator.validate(mock_event).body == {
+            "param_1": "Param 1",
+            "param_2": "Param 2",
+        }
+    else:
+        with pytest.raises(SchemaValidationError, match="param_"):
+            validator.validate(mock_event)
+
+
+def test_decorator_exposes_validated_body(mock_event: Dict) -> None:
+    body = {"param_1": "Param 1", "param_2": "Param 2"}
+    mock_event["body"] = json.dumps(body)
+    handler = MagicMock(side_effect=lambda event, context: event[VALIDATED_BODY_KEY])
+
+    assert OASValidator(oas_path)(handler)(mock_event, "context") == body
+
+
+def test_decorator_exposes_unmarshal_result(mock_event: Dict) -> None:
+    body = {"param_1": "Param 1", "param_2": "Param 2"}
+    mock_event["body"] = body
+    context = MagicMock()
+    handler = MagicMock()
+
+    validator = OASValidator(
+        oas_path, result_key="validatedRequest", context_attribute="validated_request"
+    )
+    validator(handler)(mock_event, context)
+
+    result = mock_event["validatedRequest"]
+    assert type(result) is RequestUnmarshalResult
+    assert result.body == body
+    assert result.errors == []
+    assert context.validated_request is result
+
+
+def test_validate_unmarshals_parameters(mock_event: Dict, tmp_path: Path) -> None:
+    parameters_oas_path = tmp_path / "oas.yaml"
+    parameters_oas_path.write_text(PARAMETERS_SPEC)
+    event = {
+        **mock_event,
+        "path": "/items",
+        "httpMethod": "GET",
+        "headers": {**mock_event["headers"], "X-Request-Id": "1", "X-Api-Key": "key"},
+        "queryStringParameters": {"tag": "2"},
+        "multiValueQueryStringParameters": {"tag": ["1", "2"]},
+        "body": None,
+    }
+
+    result = OASValidator(str(parameters_oas_path)).validate(event)
+
+    assert result.parameters.query == {"tag": [1, 2]}
+    assert result.parameters.header == {"X-Request-Id": "1"}
+    assert result.security == {"ApiKey": "key"}
+    assert result.body is None
+
+
+UPLOADS_SPEC = """
+openapi: 3.0.3
+info:
+  title: Uploads
+  version: "1.0.0"
+paths:
+  /uploads:
+    post:
+      requestBody:
+        required: true
+        content:
+          application/octet-stream:
+            schema:
+              type: string
+              format: binary
+          application/json:
+            schema:
+              type: object
+              required: [name]
+              properties:
+                name:
+                  type: string
+          text/plain:
+            schema:
+              type: string
+              maxLength: 5
+      responses:
+        "200":
+          description: OK
+"""
+
+
+@pytest.mark.parametrize("engine", ["openapi-core", "fastjsonschema"])
+@pytest.mark.parametrize(
+    "mimetype, body, result",
+    [
+        ("application/octet-stream", "AP/+", b"\x00\xff\xfe"),
+        ("application/json", "eyJuYW1lIjogImEifQ==", {"name": "a"}),
+        ("text/plain", "aGVsbG8=", "hello"),
+        ("application/json", "e30=", None),
+        ("text/plain", "aGVsbG8gd29ybGQ=", None),
+    ],
+)
+def test_base64_body(
+    mock_event: Dict, tmp_path: Path, engine: str, mimetype: str, body: str, result: Any
+) -> None:
+    uploads_oas_path = tmp_path / "oas.yaml"
+    uploads_oas_path.write_text(UPLOADS_SPEC)
+    event = {
+        **mock_event,
+        "path": "/uploads",
+        "headers": {**mock_event["headers"], "Content-Type": mimetype},
+        "body": body,
+        "isBase64Encoded": True,
+    }
+    validator = OASValidator(str(uploads_oas_path), eager=True, engine=engine)
+
+    if result is not None:
+        assert validator.validate(event).body == result
+    else:
+        with pytest.raises(SchemaValidationError):
+            validator.validate(event)
+
+
+def test_max_body_size(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+    handler = MagicMock()
+
+    validated_handler = OASValidator(oas_path, max_body_size=16)(handler)
+
+    with pytest.raises(RequestBodyTooLargeError):
+        validated_handler(mock_event, "context")
+
+    handler.assert_not_called()
+
+
+def test_decorator_on_error(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1"})
+    handler = MagicMock()
+
+    validated_handler = OASValidator(oas_path)(handler)
+
+    with pytest.raises(SchemaValidationError):
+        validated_handler(mock_event, "context")
+
+    handler.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "body, valid",
+    [
+        ({"param_1": "Param 1", "param_2": "Param 2"}, True),
+        ({"param_1": "Param 1", "param_2": "Param 2", "param_3": "3"}, False),
+        ({"param_1": "Param 1"}, False),
+    ],
+)
+def test_fastjsonschema_engine(mock_event: Dict, body: Dict, valid: bool) -> None:
+    mock_event["body"] = json.dumps(body)
+    validator = OASValidator(oas_path, eager=True, engine="fastjsonschema")
+
+    assert validator.unmarshaller.body_validators is not None
+
+    if valid:
+        validator.validate(mock_event)
+    else:
+        with pytest.raises(SchemaValidationError):
+            validator.validate(mock_event)
+
+
+def test_fastjsonschema_engine_from_artifact(mock_event: Dict, tmp_path: Path) -> None:
+    artifact_oas_path = str(tmp_path / "oas.yaml")
+    shutil.copy(oas_path, artifact_oas_path)
+    artifact = SpecArtifact.compile(artifact_oas_path)
+    artifact.dump(SpecArtifact.get_path(artifact_oas_path))
+    mock_event["body"] = json.dumps({"param_1": "Param 1"})
+
+    validator = OASValidator(artifact_oas_path, eager=True, engine="fastjsonschema")
+
+    assert validator.unmarshaller.body_validators.code == {
+        key: code for key, (code, _) in artifact.body_validators.items()
+    }
+    with pytest.raises(SchemaValidationError):
+        validator.validate(mock_event)
+
+
+def test_schema_unmarshallers_are_memoized(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+    validator = OASValidator(oas_path, eager=True)
+    unmarshaller = validator.unmarshaller
+    unmarshaller.schema_unmarshallers.clear()
+    factory = unmarshaller.schema_unmarshallers_factory
+
+    with patch.object(factory, "create", wraps=factory.create) as create_mock:
+        validator.validate(mock_event)
+        validator.validate(mock_event)
+
+    assert create_mock.call_count == len(unmarshaller.schema_unmarshallers) > 0
+
+
+DATES_SPEC = """
+openapi: 3.0.3
+info:
+  title: Dates
+  version: "1.0.0"
+paths:
+  /dates:
+    post:
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                day:
+                  type: string
+                  format: date
+      responses:
+        "200":
+          description: OK
+"""
+
+
+@pytest.mark.parametrize(
+    "engine, day",
+    [("openapi-core", date(2020, 1, 1)), ("fastjsonschema", "2020-01-01")],
+)
+def test_body_formats_by_engine(
+    mock_event: Dict, tmp_path: Path, engine: str, day: Any
+) -> None:
+    dates_oas_path = tmp_path / "oas.yaml"
+    dates_oas_path.write_text(DATES_SPEC)
+    event = {**mock_event, "path": "/dates", "body": json.dumps({"day": "2020-01-01"})}
+
+    validator = OASValidator(str(dates_oas_path), eager=True, engine=engine)
+
+    assert validator.validate(event).body == {"day": day}
+
+
+OPENAPI_31_SPEC = """
+openapi: 3.1.0
+info:
+  title: Pets
+  version: "1.0.0"
+paths:
+  /pets:
+    post:
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                a:
+                  type: string
+                b:
+                  type: string
+              dependentRequired:
+                a: [b]
+              unevaluatedProperties: false
+      responses:
+        "200":
+          description: OK
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  a:
+                    type: string
+                unevaluatedProperties: false
+"""
+
+
+@pytest.mark.parametrize("engine", ["openapi-core", "fastjsonschema"])
+@pytest.mark.parametrize(
+    "body, valid",
+    [
+        ({"a": "x", "b": "y"}, True),
+        ({"a": "x", "b": "y", "zzz": 1}, False),
+        ({"a": "x"}, False),
+    ],
+)
+def test_openapi_31_bodies_by_engine(
+    mock_event: Dict, tmp_path: Path, engine: str, body: Dict, valid: bool
+) -> None:
+    pets_oas_path = tmp_path / "oas.yaml"
+    pets_oas_path.write_text(OPENAPI_31_SPEC)
+    event = {**mock_event, "path": "/pets", "body": json.dumps(body)}
+
+    validator = OASValidator(str(pets_oas_path), eager=True, engine=engine)
+
+    if valid:
+        assert validator.validate(event).body == body
+    else:
+        with pytest.raises(SchemaValidationError):
+            validator.validate(event)
+
+
+def test_openapi_31_responses(mock_event: Dict, tmp_path: Path) -> None:
+    pets_oas_path = tmp_path / "oas.yaml"
+    pets_oas_path.write_text(OPENAPI_31_SPEC)
+    event = {**mock_event, "path": "/pets", "body": json.dumps({"a": "x", "b": "y"})}
+    handler = MagicMock(return_value={"statusCode": 200, "body": '{"zzz": 1}'})
+
+    validated_handler = OASValidator(
+        str(pets_oas_path), engine="fastjsonschema", validate_responses=True
+    )(handler)
+
+    with pytest.raises(ResponseValidationError):
+        validated_handler(event, "context")
+
+
+READ_ONLY_REF_SPEC = """
+openapi: 3.0.3
+info:
+  title: Pets
+  version: "1.0.0"
+paths:
+  /pets:
+    post:
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                id:
+                  $ref: "#/components/schemas/Id"
+                name:
+                  type: string
+      responses:
+        "200":
+          description: OK
+components:
+  schemas:
+    Id:
+      type: integer
+      readOnly: true
+"""
+
+
+@pytest.mark.parametrize("engine", ["openapi-core", "fastjsonschema"])
+def test_referenced_read_only_property_by_engine(
+    mock_event: Dict, tmp_path: Path, engine: str
+) -> None:
+    pets_oas_path = tmp_path / "oas.yaml"
+    pets_oas_path.write_text(READ_ONLY_REF_SPEC)
+    event = {**mock_event, "path": "/pets", "body": json.dumps({"id": 1, "name": "a"})}
+
+    validator = OASValidator(str(pets_oas_path), eager=True, engine=engine)
+
+    with pytest.raises(SchemaValidationError):
+        validator.validate(event)
+
+
+def test_lazy_fastjsonschema_engine(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1"})
+    validator = OASValidator(oas_path, eager=True, engine="fastjsonschema", lazy=True)
+    body_validators = validator.unmarshaller.body_validators
+
+    assert body_validators.validators == {}
+
+    with pytest.raises(SchemaValidationError):
+        validator.validate(mock_event)
+
+    assert body_validators.operations == {("/test-path/test-endpoint", "post")}
+
+
+@pytest.mark.parametrize("engine", ["openapi-core", "unknown"])
+def test_lazy_requires_fastjsonschema_engine(engine: str) -> None:
+    with pytest.raises(UnsupportedEngine):
+        OASValidator(oas_path, engine=engine, lazy=True)
+
+
+def test_unsupported_engine() -> None:
+    with pytest.raises(UnsupportedEngine):
+        OASValidator(oas_path, eager=True, engine="unknown")
+
+
+@pytest.mark.parametrize(
+    "event_update, valid",
+    [
+        ({"body": json.dumps({"param_1": "Param 1"})}, True),
+        ({"body": "not json"}, True),
+        ({"path": "/unknown", "resource": None}, False),
+        ({"headers": {"Content-Type": "text/plain"}}, False),
+    ],
+)
+def test_unsampled_requests_are_checked(
+    mock_event: Dict, event_update: Dict, valid: bool
+) -> None:
+    headers = {**mock_event["headers"], **event_update.pop("headers", {})}
+    event = {**mock_event, "headers": headers, **event_update}
+    validator = OASValidator(oas_path, sample_rate=0)
+
+    if valid:
+        result = validator.validate(event)
+        assert result.errors == []
+        assert result.body is None
+    else:
+        with pytest.raises(SchemaValidationError):
+            validator.validate(event)
+
+
+@pytest.mark.parametrize("sample, sampled", [(0.2, True), (0.6, False)])
+def test_sample_rate(mock_event: Dict, sample: float, sampled: bool) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1"})
+    validator = OASValidator(oas_path, sample_rate=0.5)
+
+    with patch("powertools_oas_validator.validator.random.random", return_value=sample):
+        if sampled:
+            with pytest.raises(SchemaValidationError):
+                validator.validate(mock_event)
+        else:
+            validator.validate(mock_event)
+
+
+@pytest.mark.parametrize("sample_rate", [-0.1, 1.5])
+def test_invalid_sample_rate(sample_rate: float) -> None:
+    with pytest.raises(InvalidSampleRateError):
+        OASValidator(oas_path, sample_rate=sample_rate)
+
+
+def test_shadow_mode(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1"})
+    on_violation = MagicMock()
+    handler = MagicMock(return_value="response")
+
+    validated_handler = OASValidator(
+        oas_path, shadow=True, on_violation=on_violation, result_key="result"
+    )(handler)
+
+    assert validated_handler(mock_event, "context") == "response"
+    error = on_violation.call_args.args[0]
+    assert type(error) is SchemaValidationError
+    assert on_violation.call_args.args[1] is mock_event
+    assert mock_event["result"].errors == [error]
+    assert mock_event[VALIDATED_BODY_KEY] is None
+
+
+def test_shadow_mode_logs_violations(
+    mock_event: Dict, caplog: pytest.LogCaptureFixture
+) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1"})
+
+    with caplog.at_level("WARNING"):
+        OASValidator(oas_path, shadow=True).validate(mock_event)
+
+    assert "'param_2' is a required property." in caplog.text
+
+
+@pytest.mark.parametrize(
+    "update, sample_rate, error_type",
+    [
+        (
+            {"httpMethod": "GET", "body": None, "multiValueHeaders": {}},
+            0,
+            InvalidEventError,
+        ),
+        ({"body": "{"}, 1, UnhandledValidationError),
+        ({"body": json.dumps({"param_1": "x" * 100})}, 1, RequestBodyTooLargeError),
+    ],
+)
+def test_shadow_mode_reports_unparsable_events(
+    mock_event: Dict, update: Dict, sample_rate: float, error_type: type
+) -> None:
+    event = {**mock_event, **update}
+    if event["body"] is None:
+        event["headers"] = {
+            key: value
+            for key, value in mock_event["headers"].items()
+            if key != "Content-Type"
+        }
+    on_violation = MagicMock()
+    handler = MagicMock(return_value="response")
+
+    validated_handler = OASValidator(
+        oas_path,
+        shadow=True,
+        sample_rate=sample_rate,
+        max_body_size=50,
+        on_violation=on_violation,
+    )(handler)
+
+    assert validated_handler(event, "context") == "response"
+    assert type(on_violation.call_args.args[0]) is error_type
+    assert event[VALIDATED_BODY_KEY] is None
+
+
+def test_shadow_mode_logs_unparsable_events(
+    mock_event: Dict, caplog: pytest.LogCaptureFixture
+) -> None:
+    event = {**mock_event, "body": "{"}
+
+    with caplog.at_level("WARNING"):
+        result = OASValidator(oas_path, shadow=True).validate(event)
+
+    assert type(result.errors[0]) is UnhandledValidationError
+    assert "UnhandledValidationError" in caplog.text
+
+
+def test_background_validation(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1"})
+    mock_event.pop(VALIDATED_BODY_KEY, None)
+    threads = []
+    on_violation = MagicMock(
+        side_effect=lambda error, event: threads.append(threading.current_thread())
+    )
+    handler = MagicMock(return_value="response")
+
+    validator = OASValidator(oas_path, background=True, on_violation=on_violation)
+
+    assert validator(handler)(mock_event, "context") == "response"
+    assert type(on_violation.call_args.args[0]) is SchemaValidationError
+    assert threads[0] is not threading.current_thread()
+    assert validator.pending == []
+    assert VALIDATED_BODY_KEY not in mock_event
+
+
+def test_background_validation_of_valid_request(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+    on_violation = MagicMock()
+
+    validator = OASValidator(oas_path, background=True, on_violation=on_violation)
+    validator(MagicMock())(mock_event, "context")
+
+    on_violation.assert_not_called()
+
+
+def test_background_validation_never_raises(
+    mock_event: Dict, caplog: pytest.LogCaptureFixture
+) -> None:
+    handler = MagicMock(return_value="response")
+    validator = OASValidator(oas_path, background=True)
+
+    with caplog.at_level("ERROR"):
+        assert validator(handler)({"body": "{}"}, "context") == "response"
+
+    with patch.object(
+        SpecValidator, "validate_request", side_effect=RuntimeError("Unexpected")
+    ):
+        with caplog.at_level("ERROR"):
+            assert validator(handler)(mock_event, "context") == "response"
+
+    assert "Could not parse the request for validation" in caplog.text
+    assert "Background validation failed" in caplog.text
+
+
+def test_background_validation_is_abandoned_after_timeout(
+    mock_event: Dict, caplog: pytest.LogCaptureFixture
+) -> None:
+    released = threading.Event()
+    handler = MagicMock(return_value="response")
+    validator = OASValidator(oas_path, background=True, background_timeout=0.01)
+
+    with patch.object(
+        SpecValidator, "validate_request", side_effect=lambda *args: released.wait()
+    ):
+        with caplog.at_level("WARNING"):
+            assert validator(handler)(mock_event, "context") == "response"
+        released.set()
+
+    assert validator.pending == []
+    assert "Abandoned 1 background validation(s) after 0.01 seconds" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "background_timeout, remaining_time, timeout",
+    [(1.0, 5000, 1.0), (1.0, 500, 0.3), (None, 500, 0.3), (1.0, 100, 0)],
+)
+def test_flush_timeout(
+    background_timeout: float, remaining_time: int, timeout: float
+) -> None:
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = remaining_time
+    validator = OASValidator(oas_path, background_timeout=background_timeout)
+
+    assert validator.get_flush_timeout(context) == pytest.approx(timeout)
+    assert validator.get_flush_timeout("context") == background_timeout
+
+
+def test_validate_batch(mock_event: Dict) -> None:
+    valid_event = {
+        **mock_event,
+        "body": json.dumps({"param_1": "Param 1", "param_2": "Param 2"}),
+    }
+    events = [
+        valid_event,
+        {**mock_event, "body": json.dumps({"param_1": "Param 1"})},
+        {**mock_event, "path": "/unknown", "resource": None},
+        {"body": "{}"},
+        valid_event,
+    ]
+    validator = OASValidator(oas_path)
+
+    with patch.object(
+        APICallRequestUnmarshaller,
+        "find_operation",
+        autospec=True,
+        side_effect=APICallRequestUnmarshaller.find_operation,
+    ) as find_mock:
+        result = validator.validate_batch(events, ["a", "b", "c", "d", "e"])
+
+    assert find_mock.call_count == 4
+    assert [record.identifier for record in result.records] == list("abcde")
+    assert result.records[0].operation == "POST /test-path/test-endpoint"
+    assert result.records[3].operation is None
+    assert [record.success for record in result.records] == [
+        True,
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert result.records[0].result.body == {"param_1": "Param 1", "param_2": "Param 2"}
+    assert type(result.records[1].error) is SchemaValidationError
+    assert type(result.records[2].error) is SchemaValidationError
+    assert type(result.records[3].error) is InvalidEventError
+    assert result.to_batch_response() == {
+        "batchItemFailures": [
+            {"itemIdentifier": "b"},
+            {"itemIdentifier": "c"},
+            {"itemIdentifier": "d"},
+        ]
+    }
+
+
+@pytest.mark.parametrize("identifiers", [["a"], ["a", "b", "c"]])
+def test_validate_batch_mismatched_identifiers(
+    mock_event: Dict, identifiers: List[str]
+) -> None:
+    events = [{**mock_event, "body": "{}"}, {**mock_event, "body": "{}"}]
+
+    with pytest.raises(ValueError):
+        OASValidator(oas_path).validate_batch(events, identifiers)
+
+
+def test_validate_batch_default_identifiers(mock_event: Dict) -> None:
+    events = [{**mock_event, "body": "{}"}, {**mock_event, "body": "{}"}]
+
+    result = OASValidator(oas_path, fail_fast=False).validate_batch(events)
+
+    assert [record.identifier for record in result.records] == ["0", "1"]
+    assert all(
+        type(record.error) is AggregatedSchemaValidationError
+        for record in result.records
+    )
+
+
+@pytest.mark.parametrize(
+    "response, valid",
+    [
+        ({"statusCode": 200, "body": json.dumps({"message": "Hello"})}, True),
+        ({"statusCode": 200, "body": json.dumps({"message": 1})}, False),
+        ({"statusCode": 500, "body": ""}, False),
+        ("not a proxy response", True),
+    ],
+)
+def test_validate_responses(mock_event: Dict, response: Any, valid: bool) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+    handler = MagicMock(return_value=response)
+
+    validated_handler = OASValidator(oas_path, validate_responses=True)(handler)
+
+    if valid:
+        assert validated_handler(mock_event, "context") == response
+    else:
+        with pytest.raises(ResponseValidationError):
+            validated_handler(mock_event, "context")
+
+
+def test_validate_responses_in_shadow_mode(
+    mock_event: Dict, caplog: pytest.LogCaptureFixture
+) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+    response = {"statusCode": 200, "body": json.dumps({"message": 1})}
+
+    handler = MagicMock(return_value=response)
+
+    validator = OASValidator(oas_path, validate_responses=True, background=True)
+    with caplog.at_level("WARNING"):
+        assert validator(handler)(mock_event, "context") == response
+
+    assert "Response does not match the OpenAPI spec" in caplog.text
+
+
+def test_invalid_json_response_in_shadow_mode(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+    response = {"statusCode": 200, "body": "OK"}
+    on_violation = MagicMock()
+    handler = MagicMock(return_value=response)
+
+    validator = OASValidator(
+        oas_path, validate_responses=True, shadow=True, on_violation=on_violation
+    )
+
+    assert validator(handler)(mock_event, "context") == response
+    assert type(on_violation.call_args.args[0]) is ResponseValidationError
+
+
+def test_validate_responses_of_unknown_operation(mock_event: Dict) -> None:
+    event = {**mock_event, "path": "/unknown", "resource": None}
+    response = {"statusCode": 200, "body": json.dumps({"message": 1})}
+
+    OASValidator(oas_path, validate_responses=True).validate_response(event, response)
+
+
+@pytest.mark.parametrize("sample, sampled", [(0.2, True), (0.6, False)])
+def test_response_sample_rate(mock_event: Dict, sample: float, sampled: bool) -> None:
+    validator = OASValidator(
+        oas_path, validate_responses=True, response_sample_rate=0.5
+    )
+
+    with patch("powertools_oas_validator.validator.random.random", return_value=sample):
+        assert validator.is_response_sampled() is sampled
+
+    assert OASValidator(oas_path).is_response_sampled() is False
+    with pytest.raises(InvalidSampleRateError):
+        OASValidator(oas_path, response_sample_rate=2)
+
+
+def test_result_cache(mock_event: Dict) -> None:
+    mock_event["body"] = json.dumps({"param_1": "Param 1", "param_2": "Param 2"})
+    validator = OASValidator(oas_path, result_cache_size=8)
+
+    result = validator.validate(mock_event)
+    with patch.object(SpecValidator, "validate_request") as validate_mock:
+        assert validator.validate(mock_event) == result
+
+    validate_mock.assert_not_called()
+    assert validator.result_cache is not None
+    assert (validator.result_cache.hits, validator.result_cache.misses) == (1, 1)
+
+
+def test_result_cache_returns_copies(mock_event: Dict) -> None:
+    body = {"param_1": "Param 1", "param_2": "Param 2"}
+    mock_event["body"] = json.dumps(body)
+    bodies = []
+
+    def handler(event: Dict, context: Any) -> None:
+        bodies.append(dict(event[VALIDATED_BODY_KEY]))
+        event[VALIDATED_BODY_KEY]["param_1"] = "Changed"
+        event[VALIDATED_BODY_KEY]["injected"] = True
+
+    validated_handler = OASValidator(oas_path, result_cache_size=8)(handler)
+    validated_handler(mock_event, "context")
+    validated_handler(mock_event, "context")
+
+    assert bodies == [body, body]
+
+
+def test_result_cache_of_invalid_requests(mock_event: Dict) -> None:
+    event = {**mock_event, "body": json.dumps({"param_1": "Param 1"})}
+    validator = OASValidator(oas_path, result_cache_size=8)
+
+    with pytest.raises(SchemaValidationError) as first:
+        validator.validate(event)
+    with patch.object(SpecValidator, "validate_request") as validate_mock:
+        with pytest.raises(SchemaValidationError) as second:
+            validator.validate(event)
+
+    validate_mock.assert_not_called()
+    assert second.value is first.value
+
+
+@pytest.mark.parametrize(
+    "event_update",
+    [{"path": "/unknown", "resource": None}, {"body": {"param_1": "Param 1"}}],
+)
+def test_result_cache_is_bypassed(mock_event: Dict, event_update: Dict) -> None:
+    validator = OASValidator(oas_path, result_cache_size=8)
+
+    with pytest.raises(SchemaValidationError):
+        validator.validate({**mock_event, **event_update})
+
+    assert len(validator.result_cache) == 0  # type: ignore
+    assert OASValidator(oas_path).result_cache is None